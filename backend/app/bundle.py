@@ -0,0 +1,95 @@
+"""Explore bundle: every role and industry in one payload, shared values interned.
+
+Category documents repeat the same solutions (with the same link lists),
+links and customer evidence across use cases, roles and industries. The
+bundle stores each distinct value once in a reference table and use cases
+refer to it by id, its position in the table:
+
+    {
+      "roles": [category, ...],
+      "industries": [category, ...],
+      "solutions": [{"name": ..., "links": [link id, ...]}, ...],
+      "links": [{"type": ..., "url": ...}, ...],
+      "evidence": [{"name": ..., "solutionPlay": ..., "storyUrl": ...}, ...],
+      "missing": ["role:slug", ...]
+    }
+
+Each category is its stored document with ``useCases[].solutions`` and
+``useCases[].customerEvidence`` replaced by lists of ids. Values are
+interned by their full content, so ``expand_category`` restores the
+original document exactly.
+"""
+
+import json
+from typing import Any
+
+CATEGORY_LISTS = (("role", "roles"), ("industry", "industries"))
+
+
+class _Table:
+    """Append-only list of distinct values with an id per value."""
+
+    def __init__(self):
+        self.rows: list[Any] = []
+        self._ids: dict[str, int] = {}
+
+    def intern(self, value: Any) -> int:
+        key = json.dumps(value, sort_keys=True, separators=(",", ":"))
+        index = self._ids.get(key)
+        if index is None:
+            index = self._ids[key] = len(self.rows)
+            self.rows.append(value)
+        return index
+
+
+def build_bundle(categories: dict[str, list[dict]], missing: list[str]) -> dict:
+    """Normalize category documents, given per type in catalog order, into one bundle."""
+    solutions, links, evidence = _Table(), _Table(), _Table()
+
+    def intern_solution(solution: Any) -> int:
+        if isinstance(solution, dict) and isinstance(solution.get("links"), list):
+            solution = {**solution, "links": [links.intern(link) for link in solution["links"]]}
+        return solutions.intern(solution)
+
+    def normalize(use_case: Any) -> Any:
+        if not isinstance(use_case, dict):
+            return use_case
+        use_case = dict(use_case)
+        if isinstance(use_case.get("solutions"), list):
+            use_case["solutions"] = [intern_solution(solution) for solution in use_case["solutions"]]
+        if isinstance(use_case.get("customerEvidence"), list):
+            use_case["customerEvidence"] = [evidence.intern(item) for item in use_case["customerEvidence"]]
+        return use_case
+
+    bundle = {}
+    for category_type, list_key in CATEGORY_LISTS:
+        bundle[list_key] = []
+        for category in categories.get(category_type, []):
+            if isinstance(category, dict) and isinstance(category.get("useCases"), list):
+                category = {**category, "useCases": [normalize(use_case) for use_case in category["useCases"]]}
+            bundle[list_key].append(category)
+    bundle.update(solutions=solutions.rows, links=links.rows, evidence=evidence.rows, missing=missing)
+    return bundle
+
+
+def expand_category(bundle: dict, category: dict) -> dict:
+    """Resolve the ids in one bundled category back into the stored document."""
+    def solution(index: int) -> Any:
+        value = bundle["solutions"][index]
+        if isinstance(value, dict) and isinstance(value.get("links"), list):
+            value = {**value, "links": [bundle["links"][link] for link in value["links"]]}
+        return value
+
+    def expand(use_case: Any) -> Any:
+        if not isinstance(use_case, dict):
+            return use_case
+        use_case = dict(use_case)
+        if isinstance(use_case.get("solutions"), list):
+            use_case["solutions"] = [solution(index) for index in use_case["solutions"]]
+        if isinstance(use_case.get("customerEvidence"), list):
+            use_case["customerEvidence"] = [bundle["evidence"][index] for index in use_case["customerEvidence"]]
+        return use_case
+
+    if not isinstance(category.get("useCases"), list):
+        return category
+    return {**category, "useCases": [expand(use_case) for use_case in category["useCases"]]}
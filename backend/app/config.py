@@ -42,6 +42,11 @@ class Config:
         self.MAX_RESPONSE_TOKENS = int(os.getenv("MAX_RESPONSE_TOKENS", "4096"))
         self.RECOMMENDATIONS_MAX_TOKENS = int(os.getenv("RECOMMENDATIONS_MAX_TOKENS", "800"))
         
+        self.CONTENT_CACHE_CONTROL = os.getenv(
+            "CONTENT_CACHE_CONTROL",
+            "public, max-age=60, stale-while-revalidate=600"
+        )
+        
         self.AZURE_VOICELIVE_ENDPOINT = os.getenv(
             "AZURE_VOICELIVE_ENDPOINT",
             f"wss://{self.AZURE_AI_REGION}.api.cognitive.microsoft.com/openai/realtime"
@@ -0,0 +1,94 @@
+"""Faceted filtering of use cases over precomputed bitsets.
+
+Every use case of every catalog category gets a position, in catalog
+order, and every facet value a bitset (a Python int) with the bits of the
+use cases that have it:
+
+    type          "role" or "industry"
+    solution      a solution the use case lists
+    link          the type of any link of those solutions ("Demo", "Video")
+    solutionPlay  the solution play of any of its customer evidence
+
+A filter ORs the bitsets of the requested values within a facet and ANDs
+the facets, so answering a query is a handful of big-int operations
+however many use cases there are. Facet counts are disjunctive: each
+facet is counted under every filter except its own, so the counts show
+what selecting another value of that facet would add.
+"""
+
+from collections import defaultdict
+from typing import Iterable, Iterator
+
+from .models import Category
+
+FACETS = ("type", "solution", "link", "solutionPlay")
+
+
+def _values(category: Category, index: int) -> dict[str, set[str]]:
+    use_case = category.use_cases[index]
+    return {
+        "type": {category.type},
+        "solution": {solution.name for solution in use_case.solutions},
+        "link": {link.type for solution in use_case.solutions for link in solution.links},
+        "solutionPlay": {
+            evidence.solution_play for evidence in use_case.customer_evidence if evidence.solution_play
+        },
+    }
+
+
+def positions(bits: int) -> Iterator[int]:
+    """Positions of the set bits of ``bits``, lowest first."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class FacetIndex:
+    """Immutable bitsets per facet value over the use cases of ``categories``."""
+
+    __slots__ = ("documents", "bitsets", "all")
+
+    def __init__(self, categories: Iterable[Category]):
+        self.documents: list[tuple[Category, int]] = []
+        bitsets: dict[str, dict[str, int]] = {facet: defaultdict(int) for facet in FACETS}
+        for category in categories:
+            for index in range(len(category.use_cases)):
+                bit = 1 << len(self.documents)
+                for facet, values in _values(category, index).items():
+                    for value in values:
+                        bitsets[facet][value] |= bit
+                self.documents.append((category, index))
+        self.bitsets = {facet: dict(values) for facet, values in bitsets.items()}
+        self.all = (1 << len(self.documents)) - 1
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def match(self, facet: str, values: Iterable[str]) -> int:
+        """Use cases having any of ``values`` for ``facet``."""
+        bits = 0
+        for value in values:
+            bits |= self.bitsets[facet].get(value, 0)
+        return bits
+
+    def filter(self, selected: dict[str, list[str]]) -> tuple[int, dict[str, dict[str, int]]]:
+        """Apply ``selected`` values per facet; return the matching bitset and facet counts.
+
+        Facets without values do not filter. Counts list every value of
+        every facet, most frequent first, including values that count 0.
+        """
+        matches = {facet: self.match(facet, values) for facet, values in selected.items() if values}
+        result = self.all
+        for bits in matches.values():
+            result &= bits
+
+        counts = {}
+        for facet, values in self.bitsets.items():
+            others = self.all
+            for other, bits in matches.items():
+                if other != facet:
+                    others &= bits
+            tally = {value: (bits & others).bit_count() for value, bits in values.items()}
+            counts[facet] = dict(sorted(tally.items(), key=lambda item: (-item[1], item[0])))
+        return result, counts
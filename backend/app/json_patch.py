@@ -0,0 +1,84 @@
+"""Minimal RFC 6902 JSON Patch generation and application.
+
+``diff`` emits ``add``, ``remove`` and ``replace`` operations only. Objects
+are compared member by member. Arrays are compared element by element
+with extra or missing elements added or removed at the end, so an
+insertion in the middle of a list becomes a run of replaces. That keeps
+the generator simple and patches still small for the edits content
+tooling makes (changed text, appended use cases).
+"""
+
+from typing import Any
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff(old: Any, new: Any, path: str = "") -> list[dict]:
+    """Return the operations that turn ``old`` into ``new``."""
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+    if isinstance(old, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            member = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": member, "value": value})
+            else:
+                ops.extend(diff(old[key], value, member))
+        return ops
+    if isinstance(old, list):
+        ops = []
+        for index in range(min(len(old), len(new))):
+            ops.extend(diff(old[index], new[index], f"{path}/{index}"))
+        for index in range(len(old) - 1, len(new) - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{index}"})
+        for index in range(len(old), len(new)):
+            ops.append({"op": "add", "path": f"{path}/{index}", "value": new[index]})
+        return ops
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def apply(document: Any, patch: list[dict]) -> Any:
+    """Apply ``add``/``remove``/``replace`` operations, returning the new document.
+
+    The input is modified in place where possible; a patch on the root
+    replaces it. Raises ValueError for paths that do not resolve.
+    """
+    for operation in patch:
+        op, path = operation["op"], operation["path"]
+        if path == "":
+            if op == "remove":
+                raise ValueError("Cannot remove the document root")
+            document = operation["value"]
+            continue
+        *parents, last = [_unescape(token) for token in path.split("/")[1:]]
+        target = document
+        try:
+            for token in parents:
+                target = target[int(token)] if isinstance(target, list) else target[token]
+            if isinstance(target, list):
+                index = len(target) if last == "-" else int(last)
+                if op == "add":
+                    target.insert(index, operation["value"])
+                elif op == "remove":
+                    del target[index]
+                else:
+                    target[index] = operation["value"]
+            elif op == "remove":
+                del target[last]
+            else:
+                target[last] = operation["value"]
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            raise ValueError(f"Cannot apply {op} at {path}") from e
+    return document
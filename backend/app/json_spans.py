@@ -0,0 +1,74 @@
+"""Locate values inside serialized JSON without decoding them.
+
+Used to serve sub-documents of the backup files (for example one category
+out of categories.json) as raw bytes without building Python objects.
+"""
+
+import json
+import re
+
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.S)
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+_SCALAR = re.compile(rb'[^,}\]\s]+')
+_WHITESPACE = re.compile(rb'[ \t\r\n]*')
+
+
+def _skip_whitespace(buf: bytes, pos: int) -> int:
+    return _WHITESPACE.match(buf, pos).end()
+
+
+def _match_end(pattern: re.Pattern, buf: bytes, pos: int) -> int:
+    match = pattern.match(buf, pos)
+    if match is None:
+        raise ValueError(f"Invalid JSON value at offset {pos}")
+    return match.end()
+
+
+def skip_value(buf: bytes, pos: int) -> int:
+    """Return the end offset of the JSON value starting at ``pos``."""
+    first = buf[pos:pos + 1]
+    if first == b'"':
+        return _match_end(_STRING, buf, pos)
+    if first not in (b'{', b'['):
+        return _match_end(_SCALAR, buf, pos)
+
+    depth = 0
+    while True:
+        match = _STRUCTURAL.search(buf, pos)
+        if match is None:
+            raise ValueError("Unterminated JSON value")
+        char = match.group()
+        if char == b'"':
+            pos = _match_end(_STRING, buf, match.start())
+            continue
+        depth += 1 if char in (b'{', b'[') else -1
+        pos = match.end()
+        if depth == 0:
+            return pos
+
+
+def object_spans(buf: bytes, pos: int = 0) -> dict[str, tuple[int, int]]:
+    """Map each key of the JSON object at ``pos`` to its value's byte span."""
+    pos = _skip_whitespace(buf, pos)
+    if buf[pos:pos + 1] != b'{':
+        raise ValueError(f"Expected JSON object at offset {pos}")
+    pos += 1
+
+    spans = {}
+    while True:
+        pos = _skip_whitespace(buf, pos)
+        if buf[pos:pos + 1] == b'}':
+            return spans
+        match = _STRING.match(buf, pos)
+        if match is None:
+            raise ValueError(f"Expected object key at offset {pos}")
+        key = json.loads(match.group())
+        pos = _skip_whitespace(buf, match.end())
+        if buf[pos:pos + 1] != b':':
+            raise ValueError(f"Expected ':' at offset {pos}")
+        start = _skip_whitespace(buf, pos + 1)
+        end = skip_value(buf, start)
+        spans[key] = (start, end)
+        pos = _skip_whitespace(buf, end)
+        if buf[pos:pos + 1] == b',':
+            pos += 1
@@ -1,8 +1,12 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 from pydantic import BaseModel
 from typing import List, Dict, Any
+from contextlib import asynccontextmanager
+from itertools import islice
+import json
 import logging
 import os
 import aiohttp
@@ -10,20 +14,41 @@ import aiohttp
 from .config import config
 from .websocket_handler import VoiceProxyHandler
 from .story_scraper import scraper
-from .redis_client import redis_client
+from .redis_client import redis_client, Document
+from .projection import parse_fields, top_level
+from .models import CATEGORY_FIELDS
+from .search import tokenize
+from .facets import positions
+from .related import NEIGHBORS
 
 load_dotenv()
 
+CATEGORY_TYPES = ["role", "industry"]
+MAX_BULK_CATEGORIES = 100
+MAX_SEARCH_QUERY = 200
+MAX_SEARCH_RESULTS = 50
+MAX_SEARCH_SUGGESTIONS = 8
+MAX_FILTER_RESULTS = 500
+MAX_RELATED_RESULTS = NEIGHBORS
+
 logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Connect and warm caches in the background; release connections on shutdown."""
+    redis_client.start()
+    yield
+    await redis_client.close()
+
 app = FastAPI(
     title="Frontier AI Solutions API",
     description="Backend API for Frontier AI Solutions with Avatar Integration",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -32,6 +57,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Content-Version"],
 )
 
 class ConversationMessage(BaseModel):
@@ -58,6 +84,7 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "health": "/health",
+            "ready": "/ready",
             "config": "/api/config",
             "solutions": "/api/solutions",
             "websocket": "/ws/voice",
@@ -77,25 +104,103 @@ async def health():
     elif os.getenv("REDIS_HOST") and os.getenv("REDIS_PASSWORD"):
         redis_status = "configured"
     
+    data_layer = redis_client.stats()
+    if data_layer and data_layer["circuit"]["state"] != "closed":
+        redis_status = f"circuit_{data_layer['circuit']['state']}"
+    
     return {
         "status": "healthy" if is_valid else "degraded",
         "configuration_valid": is_valid,
         "missing_config": missing if not is_valid else [],
         "redis_status": redis_status,
+        "data_layer": data_layer,
         "environment": config.ENVIRONMENT
     }
 
+@app.get("/ready")
+async def ready():
+    """Readiness probe: 200 once the data layer is connected and warmed up."""
+    body = {"ready": redis_client.ready, "warmup": redis_client.warmup}
+    if not redis_client.ready:
+        return JSONResponse(status_code=503, content=body)
+    return body
+
 @app.get("/api/config")
 async def get_config():
     """Return non-sensitive configuration for the client."""
     return config.to_dict()
 
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+def version_headers() -> dict:
+    """``X-Content-Version`` carrying the current ``fas:version``, when known."""
+    version = redis_client.content_version
+    return {"X-Content-Version": str(version)} if version is not None else {}
+
+def negotiate_encoding(accept_encoding: str | None, available: tuple[str, ...]) -> str | None:
+    """Pick the best of ``available`` content codings for an Accept-Encoding header.
+
+    ``available`` is in server preference order, which breaks q-value ties.
+    """
+    if not accept_encoding:
+        return None
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.strip().lower()] = weight
+    best, best_weight = None, 0.0
+    for coding in available:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+def document_response(request: Request, document: Document, compress: bool = True) -> Response:
+    """Serve stored JSON bytes with an ETag, answering 304 on a match.
+
+    A precompressed encoding is served when the client accepts one; each
+    encoding gets its own ETag so caches never mix representations. Pass
+    ``compress=False`` for documents built per request, which would
+    otherwise be compressed on the event loop.
+    """
+    encoding = None
+    if compress:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"), tuple(Document.COMPRESSORS))
+    body = document.encoded(encoding) if encoding else None
+    etag = document.etag
+    headers = {"Cache-Control": config.CONTENT_CACHE_CONTROL, "Vary": "Accept-Encoding", **version_headers()}
+    if body is None:
+        body = document.raw
+    else:
+        etag = f'{etag[:-1]}-{encoding}"'
+        headers["Content-Encoding"] = encoding
+    headers["ETag"] = etag
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 @app.get("/api/solutions")
-async def get_solutions():
+async def get_solutions(request: Request):
     """Get solutions from Redis."""
-    data = redis_client.get_solutions()
-    if data:
-        return data
+    document = await redis_client.get_solutions_document()
+    if document:
+        return document_response(request, document)
     
     return {
         "solutions": [
@@ -124,32 +229,222 @@ async def get_solutions():
     }
 
 @app.get("/api/catalog")
-async def get_catalog():
+async def get_catalog(request: Request):
     """Get catalog index with all roles and industries."""
-    data = redis_client.get_catalog()
-    if data:
-        return data
+    document = await redis_client.get_catalog_document()
+    if document:
+        return document_response(request, document)
     raise HTTPException(status_code=500, detail="Failed to load catalog from Redis")
 
 @app.get("/api/category/{category_type}/{slug}")
-async def get_category(category_type: str, slug: str):
-    """Get category data (role or industry) by type and slug."""
-    if category_type not in ["role", "industry"]:
+async def get_category(
+    request: Request,
+    category_type: str,
+    slug: str,
+    fields: str | None = Query(None, description="Comma-separated field paths, e.g. name,slug,useCases[].name")
+):
+    """Get category data (role or industry) by type and slug.
+    
+    With ``fields`` only the listed paths are returned; a segment ending
+    in ``[]`` maps over an array. Top-level names a category does not
+    have are rejected with 400.
+    """
+    if category_type not in CATEGORY_TYPES:
         raise HTTPException(status_code=400, detail="Invalid category type. Must be 'role' or 'industry'")
     
-    data = redis_client.get_category(category_type, slug)
-    if data:
-        return data
+    if fields is not None:
+        try:
+            projection = parse_fields(fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        unknown = sorted(top_level(projection) - set(CATEGORY_FIELDS))
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+        document = await redis_client.get_category_projection(category_type, slug, projection)
+    else:
+        document = await redis_client.get_category_document(category_type, slug)
+    if document:
+        return document_response(request, document)
     raise HTTPException(status_code=404, detail=f"Category {category_type}:{slug} not found")
 
+@app.get("/api/categories")
+async def get_categories(
+    request: Request,
+    category_type: str = Query(..., alias="type"),
+    slugs: str = Query("all", description="Comma-separated slugs, or 'all'")
+):
+    """Get several categories of one type in a single request.
+    
+    Every slug is resolved with one Redis round trip, falling back to the
+    backup files per missing key. Slugs found nowhere are listed in
+    ``missing`` and the response is flagged ``partial``. At most
+    ``MAX_BULK_CATEGORIES`` slugs may be listed; ``all`` is not capped.
+    """
+    if category_type not in CATEGORY_TYPES:
+        raise HTTPException(status_code=400, detail="Invalid category type. Must be 'role' or 'industry'")
+    
+    if slugs == "all":
+        catalog = await redis_client.get_catalog_document()
+        if not catalog:
+            raise HTTPException(status_code=500, detail="Failed to load catalog from Redis")
+        requested = catalog.model.slugs(category_type)
+    else:
+        requested = list(dict.fromkeys(slug.strip() for slug in slugs.split(",") if slug.strip()))
+        if len(requested) > MAX_BULK_CATEGORIES:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_CATEGORIES} slugs per request")
+    
+    if not requested:
+        raise HTTPException(status_code=400, detail="No slugs requested")
+    
+    documents, missing, from_backup = await redis_client.get_category_documents(category_type, requested)
+    if not documents:
+        raise HTTPException(status_code=404, detail=f"No {category_type} categories found")
+    
+    members = b",".join(json.dumps(slug).encode() + b":" + document.raw for slug, document in documents.items())
+    body = b"".join([
+        b'{"type":', json.dumps(category_type).encode(),
+        b',"categories":{', members,
+        b'},"missing":', json.dumps(missing).encode(),
+        b',"fromBackup":', json.dumps(from_backup).encode(),
+        b',"partial":', b"true" if missing else b"false",
+        b"}",
+    ])
+    return document_response(request, Document(body), compress=False)
+
+@app.get("/api/explore/bundle")
+async def get_explore_bundle(request: Request):
+    """Get every catalog role and industry in one deduplicated payload.
+    
+    Solutions, links and customer evidence are stored once in the
+    ``solutions``, ``links`` and ``evidence`` tables and referenced by
+    index from each use case. The bundle is rebuilt only when a source
+    document changes.
+    """
+    document = await redis_client.get_explore_bundle()
+    if document:
+        return document_response(request, document)
+    raise HTTPException(status_code=500, detail="Failed to load catalog from Redis")
+
+@app.get("/api/search")
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=MAX_SEARCH_QUERY),
+    limit: int = Query(10, ge=1, le=MAX_SEARCH_RESULTS)
+):
+    """Search use cases across every role and industry.
+
+    Matches use-case names and descriptions, solution names and customer
+    evidence, ranked by BM25. The last word is completed as a prefix
+    unless ``q`` ends with a space; ``suggestions`` lists its completions.
+    """
+    index = await redis_client.get_search_index()
+    if index is None:
+        raise HTTPException(status_code=500, detail="Failed to load catalog from Redis")
+    tokens = tokenize(q)
+    prefix = tokens[-1] if tokens and not q[-1].isspace() else ""
+    body = {
+        "query": q,
+        "hits": [hit.to_json() for hit in index.search(q, limit)],
+        "suggestions": index.complete(prefix, MAX_SEARCH_SUGGESTIONS) if prefix else [],
+    }
+    return document_response(request, Document(json.dumps(body).encode()), compress=False)
+
+@app.get("/api/use-cases")
+async def filter_use_cases(
+    request: Request,
+    category_type: List[str] = Query([], alias="type"),
+    solution: List[str] = Query([]),
+    link: List[str] = Query([]),
+    solution_play: List[str] = Query([], alias="solutionPlay"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=0, le=MAX_FILTER_RESULTS)
+):
+    """Filter use cases across every role and industry by facet values.
+
+    Repeating a parameter ORs its values (``link=Demo&link=Video``);
+    different parameters are ANDed. ``facets`` counts every value of each
+    facet under the other facets' filters.
+    """
+    index = await redis_client.get_facet_index()
+    if index is None:
+        raise HTTPException(status_code=500, detail="Failed to load catalog from Redis")
+    selected = {"type": category_type, "solution": solution, "link": link, "solutionPlay": solution_play}
+    matches, counts = index.filter(selected)
+    page = islice(positions(matches), offset, offset + limit)
+    body = {
+        "total": matches.bit_count(),
+        "offset": offset,
+        "useCases": [category.reference(use_case) for category, use_case in (index.documents[p] for p in page)],
+        "facets": counts,
+    }
+    return document_response(request, Document(json.dumps(body).encode()), compress=False)
+
+@app.get("/api/use-cases/{use_case_id}/related")
+async def get_related_use_cases(
+    request: Request,
+    use_case_id: str,
+    limit: int = Query(MAX_RELATED_RESULTS, ge=1, le=MAX_RELATED_RESULTS)
+):
+    """List the use cases most similar to ``use_case_id`` across every role and industry.
+
+    ``use_case_id`` is the ``id`` of a use-case reference (``type:slug:index``).
+    Similarity is the cosine of hashed TF-IDF vectors of use-case names and
+    descriptions, precomputed for every use case when content changes.
+    """
+    graph = await redis_client.get_related_graph()
+    if graph is None:
+        raise HTTPException(status_code=500, detail="Failed to load catalog from Redis")
+    position = graph.position(use_case_id)
+    if position is None:
+        raise HTTPException(status_code=404, detail=f"Use case '{use_case_id}' not found")
+    category, index = graph.documents[position]
+    body = {
+        "useCase": category.reference(index),
+        "related": [hit.to_json() for hit in graph.related(position, limit)],
+    }
+    return document_response(request, Document(json.dumps(body).encode()), compress=False)
+
 @app.get("/api/settings/inspire")
-async def get_inspire_settings():
+async def get_inspire_settings(request: Request):
     """Get inspire interests settings."""
-    data = redis_client.get_settings("inspire")
-    if data:
-        return data
+    document = await redis_client.get_settings_document("inspire")
+    if document:
+        return document_response(request, document)
     raise HTTPException(status_code=500, detail="Failed to load inspire settings from Redis")
 
+def change_href(key: str) -> str | None:
+    """API path serving the Redis key ``key``, None for keys with no GET endpoint."""
+    parts = key.split(":")[1:]
+    if parts in (["catalog"], ["solutions"]):
+        return f"/api/{parts[0]}"
+    if len(parts) == 2 and parts[0] in CATEGORY_TYPES:
+        return f"/api/category/{parts[0]}/{parts[1]}"
+    if parts == ["settings", "inspire"]:
+        return "/api/settings/inspire"
+    return None
+
+@app.get("/api/content/changes")
+async def get_content_changes(since: int = Query(..., ge=0, description="Content version the client holds")):
+    """List documents changed after content version ``since``.
+    
+    Each change carries a JSON Patch (RFC 6902) against the previous
+    document when the server has one, otherwise ``patch`` is null and the
+    client should re-fetch ``href``. ``reset`` means the change log no
+    longer reaches back to ``since``, or ``since`` is ahead of the server's
+    version, and everything should be reloaded.
+    """
+    changes = await redis_client.changes_since(since)
+    version = redis_client.content_version
+    if version is None:
+        changes = []
+    body = {
+        "version": version,
+        "since": since,
+        "reset": changes is None,
+        "changes": [{**change, "href": change_href(change["key"])} for change in changes or []],
+    }
+    return JSONResponse(body, headers={"Cache-Control": "no-store", **version_headers()})
+
 @app.websocket("/ws/voice")
 async def websocket_voice_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time voice communication with avatar."""
@@ -234,7 +529,7 @@ async def generate_executive_narrative(request: NarrativeRequest):
             azure_endpoint=config.AZURE_OPENAI_ENDPOINT
         )
         
-        narrative_data = redis_client.get_content("exec_narr")
+        narrative_data = await redis_client.get_content("exec_narr")
         if narrative_data:
             pdf_context = narrative_data.get("context", "")
             urls = narrative_data.get("urls", [])
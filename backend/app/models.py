@@ -0,0 +1,240 @@
+"""Typed, immutable content model validated when documents are ingested.
+
+Catalog and category documents are parsed once per document version into
+frozen ``__slots__`` dataclasses. Short repeated strings (names, types,
+URLs) are interned with ``sys.intern``, and links, solutions and customer
+evidence are interned as objects, so a solution used by twenty use cases
+exists once in memory. Documents that do not match the model raise
+``ContentError`` naming the offending path, and the data layer refuses
+them at ingest instead of serving them to the browser.
+
+Unknown members are ignored: the stored bytes are still what clients
+receive, the model only guarantees the members the frontend relies on.
+"""
+
+import sys
+import weakref
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+CATEGORY_TYPES = ("role", "industry")
+# Top-level members of a category document, as read by Category.parse
+CATEGORY_FIELDS = ("type", "slug", "name", "personas", "priorities", "useCases")
+URL_SCHEMES = ("https://", "http://")
+
+
+class ContentError(ValueError):
+    """A content document does not match the model."""
+
+
+def _expect(value: Any, kind: type, path: str) -> Any:
+    if not isinstance(value, kind):
+        raise ContentError(f"{path}: expected {'an object' if kind is dict else f'a {kind.__name__}'}")
+    return value
+
+
+def _text(data: dict, member: str, path: str, required: bool = True, intern: bool = True) -> Optional[str]:
+    value = data.get(member)
+    if value is None and not required:
+        return None
+    value = _expect(value, str, f"{path}.{member}")
+    return sys.intern(value) if intern else value
+
+
+def _url(data: dict, member: str, path: str, required: bool = True) -> Optional[str]:
+    value = _text(data, member, path, required)
+    if value is not None and not value.startswith(URL_SCHEMES):
+        raise ContentError(f"{path}.{member}: expected an http(s) URL")
+    return value
+
+
+def _items(data: dict, member: str, path: str) -> list:
+    return _expect(data.get(member, []), list, f"{path}.{member}")
+
+
+def _strings(data: dict, member: str, path: str) -> tuple[str, ...]:
+    return tuple(
+        sys.intern(_expect(item, str, f"{path}.{member}[{index}]"))
+        for index, item in enumerate(_items(data, member, path))
+    )
+
+
+_interned: "weakref.WeakValueDictionary[tuple, Any]" = weakref.WeakValueDictionary()
+
+
+def _intern(value: Any) -> Any:
+    """Return the live instance equal to ``value``, registering it if there is none."""
+    key = (type(value), *(getattr(value, field) for field in value.__slots__ if field != "__weakref__"))
+    existing = _interned.get(key)
+    if existing is not None:
+        return existing
+    _interned[key] = value
+    return value
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class Link:
+    type: str
+    url: str
+
+    @classmethod
+    def parse(cls, data: Any, path: str) -> "Link":
+        _expect(data, dict, path)
+        return _intern(cls(_text(data, "type", path), _url(data, "url", path)))
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class Solution:
+    name: str
+    links: tuple[Link, ...]
+
+    @classmethod
+    def parse(cls, data: Any, path: str) -> "Solution":
+        _expect(data, dict, path)
+        links = tuple(Link.parse(link, f"{path}.links[{i}]") for i, link in enumerate(_items(data, "links", path)))
+        return _intern(cls(_text(data, "name", path), links))
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class CustomerEvidence:
+    name: str
+    solution_play: Optional[str]
+    story_url: Optional[str]
+
+    @classmethod
+    def parse(cls, data: Any, path: str) -> "CustomerEvidence":
+        _expect(data, dict, path)
+        return _intern(cls(
+            _text(data, "name", path),
+            _text(data, "solutionPlay", path, required=False),
+            _url(data, "storyUrl", path, required=False),
+        ))
+
+
+@dataclass(frozen=True, slots=True)
+class UseCase:
+    name: str
+    description: str
+    solutions: tuple[Solution, ...]
+    customer_evidence: tuple[CustomerEvidence, ...]
+
+    @classmethod
+    def parse(cls, data: Any, path: str) -> "UseCase":
+        _expect(data, dict, path)
+        return cls(
+            _text(data, "name", path),
+            _text(data, "description", path, required=False, intern=False) or "",
+            tuple(Solution.parse(item, f"{path}.solutions[{i}]") for i, item in enumerate(_items(data, "solutions", path))),
+            tuple(
+                CustomerEvidence.parse(item, f"{path}.customerEvidence[{i}]")
+                for i, item in enumerate(_items(data, "customerEvidence", path))
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Personas:
+    buyer: tuple[str, ...]
+    influencer: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Category:
+    type: str
+    slug: str
+    name: str
+    personas: Personas
+    priorities: tuple[str, ...]
+    use_cases: tuple[UseCase, ...]
+
+    @classmethod
+    def parse(cls, data: Any, category_type: str, slug: str) -> "Category":
+        path = f"{category_type}:{slug}"
+        _expect(data, dict, path)
+        if data.get("type") != category_type:
+            raise ContentError(f"{path}.type: expected {category_type!r}")
+        if data.get("slug") != slug:
+            raise ContentError(f"{path}.slug: expected {slug!r}")
+        personas = _expect(data.get("personas", {}), dict, f"{path}.personas")
+        return cls(
+            sys.intern(category_type),
+            sys.intern(slug),
+            _text(data, "name", path),
+            Personas(
+                _strings(personas, "buyer", f"{path}.personas"),
+                _strings(personas, "influencer", f"{path}.personas"),
+            ),
+            _strings(data, "priorities", path),
+            tuple(UseCase.parse(item, f"{path}.useCases[{i}]") for i, item in enumerate(_items(data, "useCases", path))),
+        )
+
+    def use_case_id(self, index: int) -> str:
+        """Stable id of ``useCases[index]`` in API paths: ``type:slug:index``."""
+        return f"{self.type}:{self.slug}:{index}"
+
+    def reference(self, index: int) -> dict:
+        """JSON pointer to ``useCases[index]``, with the names a result list shows."""
+        return {
+            "id": self.use_case_id(index),
+            "type": self.type,
+            "slug": self.slug,
+            "category": self.name,
+            "index": index,
+            "useCase": self.use_cases[index].name,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogEntry:
+    slug: str
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class Catalog:
+    roles: tuple[CatalogEntry, ...]
+    industries: tuple[CatalogEntry, ...]
+
+    @classmethod
+    def parse(cls, data: Any) -> "Catalog":
+        _expect(data, dict, "catalog")
+        lists = []
+        for member in ("roles", "industries"):
+            entries, seen = [], set()
+            for index, item in enumerate(_items(data, member, "catalog")):
+                path = f"catalog.{member}[{index}]"
+                _expect(item, dict, path)
+                entry = CatalogEntry(_text(item, "slug", path), _text(item, "name", path))
+                if entry.slug in seen:
+                    raise ContentError(f"{path}.slug: duplicate {entry.slug!r}")
+                seen.add(entry.slug)
+                entries.append(entry)
+            lists.append(tuple(entries))
+        return cls(*lists)
+
+    def slugs(self, category_type: str) -> list[str]:
+        """Slugs listed for ``category_type`` ('role' or 'industry'), in catalog order."""
+        return [entry.slug for entry in (self.roles if category_type == "role" else self.industries)]
+
+
+Model = Union[Catalog, Category]
+
+
+def has_model(key: str) -> bool:
+    """Whether documents stored under ``key`` (without the ``fas:`` prefix) have a model."""
+    category_type, _, slug = key.partition(":")
+    return key == "catalog" or (category_type in CATEGORY_TYPES and bool(slug))
+
+
+def parse_document(key: str, data: Any) -> Optional[Model]:
+    """Validate the document stored under ``key`` (without the ``fas:`` prefix).
+
+    Returns its model, or None for keys without one (solutions, settings,
+    content). Raises ContentError when the document is malformed.
+    """
+    if not has_model(key):
+        return None
+    if key == "catalog":
+        return Catalog.parse(data)
+    category_type, _, slug = key.partition(":")
+    return Category.parse(data, category_type, slug)
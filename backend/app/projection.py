@@ -0,0 +1,172 @@
+"""Field projections over JSON documents.
+
+A projection is a comma-separated list of field paths. Segments are
+separated by dots and a segment ending in ``[]`` maps over an array::
+
+    name,slug,priorities,useCases[].name
+
+keeps ``name``, ``slug`` and ``priorities`` and, for every element of
+``useCases``, only its ``name``. The same projection is answered either
+in Python over a decoded document (``project``) or with RedisJSON path
+queries (``redis_paths`` + ``assemble``), and both give identical results.
+"""
+
+import re
+from typing import Any, Optional
+
+_SEGMENT = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\[\])?$")
+MAX_FIELDS = 32
+
+
+def parse_fields(fields: str) -> tuple[str, ...]:
+    """Validate a ``fields=`` value and return its canonical, sorted form."""
+    paths = sorted({path.strip() for path in fields.split(",") if path.strip()})
+    if not paths:
+        raise ValueError("No fields requested")
+    if len(paths) > MAX_FIELDS:
+        raise ValueError(f"At most {MAX_FIELDS} fields per request")
+    for path in paths:
+        if not all(_SEGMENT.match(segment) for segment in path.split(".")):
+            raise ValueError(f"Invalid field path: {path}")
+
+    # A field requested whole makes deeper paths under it redundant
+    markers: dict[str, str] = {}
+    kept = []
+    for path in paths:
+        segments = path.split(".")
+        prefixes = [".".join(segments[:i]) for i in range(1, len(segments))]
+        if any(_bare(prefix) in markers and markers[_bare(prefix)] == "leaf" for prefix in prefixes):
+            continue
+        for prefix in prefixes:
+            if markers.setdefault(_bare(prefix), prefix) not in (prefix, "leaf"):
+                raise ValueError(f"Conflicting array markers in {path}")
+        markers[_bare(path)] = "leaf"
+        kept.append(path)
+    return tuple(kept)
+
+
+def top_level(fields: tuple[str, ...]) -> set[str]:
+    """Names of the top-level members a parsed projection reads."""
+    return {_bare(path.split(".")[0]) for path in fields}
+
+
+def _bare(path: str) -> str:
+    return path.replace("[]", "")
+
+
+def _tree(fields: tuple[str, ...]) -> dict:
+    """Nest field paths: ``a.b[].c`` becomes ``{"a": {"b[]": {"c": None}}}``.
+
+    None marks a leaf, which keeps the whole value.
+    """
+    tree: dict = {}
+    for path in fields:
+        node = tree
+        segments = path.split(".")
+        for segment in segments[:-1]:
+            node = node.setdefault(segment, {})
+        node[segments[-1]] = None
+    return tree
+
+
+def _project(value: dict, tree: dict) -> dict:
+    """Project an object. Paths that do not exist, or that descend into a
+    value of the wrong type, are left out, as a JSONPath query would."""
+    out = {}
+    for segment, subtree in tree.items():
+        is_array = segment.endswith("[]")
+        name = segment[:-2] if is_array else segment
+        member = value.get(name)
+        if name not in value:
+            continue
+        if subtree is None:
+            out[name] = member
+        elif is_array:
+            if isinstance(member, list):
+                out[name] = [_project(item, subtree) if isinstance(item, dict) else {} for item in member]
+        elif isinstance(member, dict):
+            projected = _project(member, subtree)
+            if projected:
+                out[name] = projected
+    return out
+
+
+def project(data: Any, fields: tuple[str, ...]) -> dict:
+    """Apply a parsed projection to a decoded document."""
+    return _project(data, _tree(fields)) if isinstance(data, dict) else {}
+
+
+def _split(path: str) -> tuple[list[str], Optional[int]]:
+    """Return a path's bare segment names and the index of its array hop."""
+    segments = path.split(".")
+    arrays = [i for i, segment in enumerate(segments[:-1]) if segment.endswith("[]")]
+    names = [segment.removesuffix("[]") for segment in segments]
+    if len(arrays) > 1:
+        return names, -1
+    return names, arrays[0] if arrays else None
+
+
+def _json_path(names: list[str]) -> str:
+    return "$" + "".join(f".{name}" for name in names)
+
+
+def redis_paths(fields: tuple[str, ...]) -> Optional[tuple[list[str], list[str]]]:
+    """Map a projection to RedisJSON paths.
+
+    Returns ``(value_paths, array_paths)``: one ``JSON.GET`` path per field
+    and the arrays whose ``JSON.ARRLEN`` is needed to regroup per-element
+    values. Returns None when a field crosses more than one array, since
+    its flattened result cannot be regrouped.
+    """
+    value_paths, array_paths = [], []
+    for path in fields:
+        names, array_at = _split(path)
+        if array_at == -1:
+            return None
+        if array_at is None:
+            value_paths.append(_json_path(names))
+            continue
+        prefix = _json_path(names[:array_at + 1])
+        value_paths.append(prefix + "[*]" + _json_path(names[array_at + 1:])[1:])
+        if prefix not in array_paths:
+            array_paths.append(prefix)
+    return value_paths, array_paths
+
+
+def _set(target: dict, names: list[str], value: Any):
+    for name in names[:-1]:
+        target = target.setdefault(name, {})
+    target[names[-1]] = value
+
+
+def assemble(fields: tuple[str, ...], values: dict[str, list], lengths: dict[str, Optional[int]]) -> Optional[dict]:
+    """Rebuild a projected document from RedisJSON multi-path results.
+
+    ``values`` maps each path from ``redis_paths`` to its JSONPath result
+    list and ``lengths`` maps each array path to its length. Returns None
+    when per-element values cannot be aligned with their array elements
+    (an element lacks a field, or the path is not an array), in which case
+    the caller should project the full document instead.
+    """
+    out: dict = {}
+    arrays: dict[str, list] = {}
+    for path, value_path in zip(fields, redis_paths(fields)[0]):
+        names, array_at = _split(path)
+        result = values.get(value_path, [])
+        if array_at is None:
+            if len(result) > 1:
+                return None
+            if result:
+                _set(out, names, result[0])
+            continue
+        prefix = _json_path(names[:array_at + 1])
+        length = lengths.get(prefix)
+        if length is None or len(result) != length:
+            return None
+        elements = arrays.get(prefix)
+        if elements is None:
+            elements = arrays[prefix] = [{} for _ in range(length)]
+            _set(out, names[:array_at + 1], elements)
+        for element, value in zip(elements, result):
+            _set(element, names[array_at + 1:], value)
+    return project(out, fields)
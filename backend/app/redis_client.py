@@ -1,96 +1,540 @@
 """Redis client for accessing cached data with local backup fallback."""
 
-import redis
+import asyncio
+import gzip
+import hashlib
 import json
 import os
-from typing import Optional, Any
+import time
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Callable, Optional, Any
 import logging
 from pathlib import Path
 
+from redis import asyncio as aioredis
+from redis.cluster import LoadBalancingStrategy
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    _json_loads = json.loads
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - gzip only
+    brotli = None
+
+from . import json_patch
+from .bundle import CATEGORY_LISTS, build_bundle
+from .facets import FacetIndex
+from .models import Model, has_model, parse_document
+from .json_spans import object_spans, skip_value
+from .projection import assemble, project, redis_paths
+from .search import SearchIndex
+from .snapshot import Snapshot, encode_document
+
+if TYPE_CHECKING:
+    from .related import RelatedGraph
+
 logger = logging.getLogger(__name__)
 
 REDIS_HOST = os.getenv("REDIS_HOST")
 REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+REDIS_SSL = os.getenv("REDIS_SSL", "true").lower() == "true"
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "20"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "2"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "2"))
+REDIS_REPLICAS = os.getenv("REDIS_REPLICAS", "")
+REPLICA_CHECK_SECONDS = float(os.getenv("REPLICA_CHECK_SECONDS", "5"))
+REPLICA_LATENCY_WINDOW_MS = float(os.getenv("REPLICA_LATENCY_WINDOW_MS", "5"))
+REDIS_CLUSTER = os.getenv("REDIS_CLUSTER", "false").lower() == "true"
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "300"))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+CACHE_STALE_WHILE_REVALIDATE = os.getenv("CACHE_STALE_WHILE_REVALIDATE", "true").lower() == "true"
+CACHE_MAX_STALE_SECONDS = float(os.getenv("CACHE_MAX_STALE_SECONDS", "600"))
+REDIS_CLIENT_TRACKING = os.getenv("REDIS_CLIENT_TRACKING", "false").lower() == "true"
+TRACKING_KEEPALIVE_SECONDS = float(os.getenv("TRACKING_KEEPALIVE_SECONDS", "30"))
+TRACKING_RETRY_SECONDS = float(os.getenv("TRACKING_RETRY_SECONDS", "5"))
+INVALIDATE_CHANNEL = b"__redis__:invalidate"
+VERSION_CHECK_SECONDS = float(os.getenv("VERSION_CHECK_SECONDS", "5"))
+CHANGE_LOG_SIZE = int(os.getenv("CHANGE_LOG_SIZE", "256"))
+CIRCUIT_FAILURE_RATE = float(os.getenv("CIRCUIT_FAILURE_RATE", "0.5"))
+CIRCUIT_WINDOW_SIZE = int(os.getenv("CIRCUIT_WINDOW_SIZE", "20"))
+CIRCUIT_MIN_CALLS = int(os.getenv("CIRCUIT_MIN_CALLS", "5"))
+CIRCUIT_OPEN_SECONDS = float(os.getenv("CIRCUIT_OPEN_SECONDS", "10"))
 BACKUP_ONLY = os.getenv("BACKUP_ONLY", "false").lower() == "true"
+BACKUP_RELOAD_SECONDS = float(os.getenv("BACKUP_RELOAD_SECONDS", "5"))
+BACKUP_SNAPSHOT = os.getenv("BACKUP_SNAPSHOT", "backup.snapshot")
+STARTUP_WARMUP = os.getenv("STARTUP_WARMUP", "true").lower() == "true"
+WARMUP_SETTINGS = ("inspire",)
+WARMUP_CONTENT = ("exec_narr",)
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "512"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "9"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "11"))
 KEY_PREFIX = "fas"
+VERSION_KEY = f"{KEY_PREFIX}:version"
+PROJECTION_SEPARATOR = "|"
+VERSIONS_KEY = f"{KEY_PREFIX}:versions"
 BACKUP_DIR = Path(__file__).parent.parent / "data"
 
+def _dump(value: Any) -> bytes:
+    """Serialize a value the way Redis and the snapshot store documents."""
+    return encode_document(value)
+
+
+def _compressors() -> dict:
+    compressors = {"gzip": lambda raw: gzip.compress(raw, compresslevel=GZIP_LEVEL, mtime=0)}
+    if brotli is not None:
+        compressors = {"br": lambda raw: brotli.compress(raw, quality=BROTLI_QUALITY), **compressors}
+    return compressors
+
+
+class Document:
+    """A JSON document as stored: serialized bytes plus lazily derived views.
+
+    One instance exists per document version, so anything derived from the
+    bytes (decoded data, ETag, compressed encodings) is computed at most
+    once per version.
+    """
+    
+    __slots__ = ("raw", "_data", "_etag", "_encodings", "_model")
+    
+    COMPRESSORS = _compressors()
+    
+    def __init__(self, raw: bytes):
+        self.raw = raw
+    
+    @property
+    def data(self) -> Any:
+        """Decoded document, parsed on first access."""
+        try:
+            return self._data
+        except AttributeError:
+            self._data = _json_loads(self.raw)
+            return self._data
+    
+    @property
+    def model(self) -> Optional[Model]:
+        """Typed model set by ``validate``; None for unvalidated or unmodeled documents."""
+        return getattr(self, "_model", None)
+    
+    def validate(self, key: str, value: Any = None) -> "Document":
+        """Check the document against the model for ``key`` (see ``app.models``).
+
+        Parses the bytes once into the typed model without keeping the
+        decoded dicts; ``value`` skips the parse when the caller already
+        decoded them. Raises ContentError if the document is malformed.
+        """
+        if has_model(key):
+            self._model = parse_document(key, _json_loads(self.raw) if value is None else value)
+        else:
+            self._model = None
+        return self
+    
+    @property
+    def etag(self) -> str:
+        """Strong ETag derived from a hash of the stored bytes."""
+        try:
+            return self._etag
+        except AttributeError:
+            self._etag = f'"{hashlib.blake2b(self.raw, digest_size=16).hexdigest()}"'
+            return self._etag
+    
+    @property
+    def precompressed(self) -> bool:
+        return hasattr(self, "_encodings")
+    
+    def precompress(self):
+        """Compress the stored bytes with every available encoding.
+
+        Documents under ``COMPRESSION_MIN_BYTES`` and encodings that do not
+        shrink the document are skipped, so they are served uncompressed.
+        """
+        encodings = {}
+        if len(self.raw) >= COMPRESSION_MIN_BYTES:
+            for encoding, compress in self.COMPRESSORS.items():
+                body = compress(self.raw)
+                if len(body) < len(self.raw):
+                    encodings[encoding] = body
+        self._encodings = encodings
+    
+    def encoded(self, encoding: str) -> Optional[bytes]:
+        """Return the document compressed with ``encoding``, or None."""
+        if not self.precompressed:
+            self.precompress()
+        return self._encodings.get(encoding)
+    
+    def projection(self, fields: tuple[str, ...]) -> "Document":
+        """Document holding only ``fields`` (see ``app.projection``).
+
+        Decodes the stored bytes without keeping the result, so projecting
+        a cached document does not pin a decoded copy of it.
+        """
+        return Document(_dump(project(_json_loads(self.raw), fields)))
+    
+    @property
+    def compressed_bytes(self) -> int:
+        """Memory held by the compressed encodings of this document."""
+        if not self.precompressed:
+            return 0
+        return sum(len(body) for body in self._encodings.values())
+    
+    @property
+    def size_bytes(self) -> int:
+        """Memory counted against the cache: the stored bytes plus every compressed encoding."""
+        return len(self.raw) + self.compressed_bytes
+
+
+def _validated(key: str, raw: bytes, source: str, normalize: bool = False) -> Optional[Document]:
+    """A validated Document for ``raw`` stored under ``key``, or None if it is malformed.
+
+    ``normalize`` re-encodes ``raw`` the way Redis returns it, so a document
+    sliced out of a hand-formatted backup file gets the same bytes (and
+    ETag) as from Redis or the snapshot.
+    """
+    try:
+        if normalize:
+            value = _json_loads(raw)
+            return Document(_dump(value)).validate(key, value)
+        return Document(raw).validate(key)
+    except ValueError as e:
+        logger.error(f"Rejected malformed {key} from {source}: {e}")
+        return None
+
+
+async def precompress(*documents: Optional[Document]):
+    """Compress documents that are not compressed yet in a worker thread."""
+    pending = [document for document in documents if document is not None and not document.precompressed]
+    if pending:
+        await asyncio.to_thread(lambda: [document.precompress() for document in pending])
+
+
+class BackupFile:
+    """Immutable snapshot of one backup file plus views derived from it.
+
+    Spans and Documents are memoized on the snapshot, so replacing the
+    snapshot as a whole is all a reload needs to do: readers holding the
+    old one keep a consistent view until they finish.
+    """
+    
+    __slots__ = ("name", "signature", "raw", "_spans", "_documents")
+    
+    def __init__(self, name: str, signature: Optional[tuple], raw: Optional[bytes]):
+        self.name = name
+        self.signature = signature
+        self.raw = raw
+        self._spans: dict[tuple, dict[str, tuple[int, int]]] = {}
+        self._documents: dict[tuple, Optional[Document]] = {}
+    
+    @classmethod
+    def read(cls, name: str, path: Path) -> "BackupFile":
+        """Read ``path``; a missing file yields a snapshot with no bytes."""
+        try:
+            signature = _file_signature(path)
+            raw = path.read_bytes().strip() if signature else None
+        except OSError as e:
+            logger.error(f"Failed to read backup file {path}: {e}")
+            return cls(name, None, None)
+        return cls(name, signature, raw)
+    
+    def validate(self):
+        """Raise ValueError unless the file is a complete JSON object."""
+        if self.raw is not None:
+            self._spans[()] = object_spans(self.raw)
+            if skip_value(self.raw, 0) != len(self.raw):
+                raise ValueError("Trailing data after top-level object")
+    
+    def member(self, *keys: str) -> Optional[bytes]:
+        """Slice a nested member out of the file without decoding it."""
+        if self.raw is None:
+            return None
+        start, end = 0, len(self.raw)
+        try:
+            for depth, key in enumerate(keys):
+                path = keys[:depth]
+                spans = self._spans.get(path)
+                if spans is None:
+                    spans = self._spans[path] = object_spans(self.raw, start)
+                if key not in spans:
+                    return None
+                start, end = spans[key]
+        except ValueError as e:
+            logger.error(f"Malformed backup file {self.name}.json: {e}")
+            return None
+        return self.raw[start:end]
+    
+    def document(self, *keys: str) -> Optional[Document]:
+        """Get a memoized Document for the file or one of its members."""
+        if keys not in self._documents:
+            raw = self.member(*keys)
+            if raw is None:
+                return None
+            self._documents[keys] = _validated(_snapshot_key(self.name, keys), raw, f"{self.name}.json", normalize=True)
+        return self._documents[keys]
+
+
+class SnapshotBackup:
+    """An opened snapshot file (see ``app.snapshot``) plus memoized Documents."""
+    
+    __slots__ = ("signature", "sources", "snapshot", "_documents")
+    
+    def __init__(self, signature: Optional[tuple], snapshot: Optional[Snapshot], sources: Optional[dict] = None):
+        self.signature = signature
+        self.sources = sources or {}
+        self.snapshot = snapshot
+        self._documents: dict[str, Optional[Document]] = {}
+    
+    @staticmethod
+    def source_signatures(directory: Path) -> dict[str, Optional[tuple]]:
+        """Signatures of the backup JSON files a snapshot is built from."""
+        return {name: _file_signature(directory / f"{name}.json") for name in BackupLoader.FILES}
+    
+    @classmethod
+    def open(cls, path: Path) -> "SnapshotBackup":
+        """Open ``path``; raises ValueError if it exists but is not a valid snapshot.
+
+        A snapshot older than any backup JSON file it is built from is not
+        used, so hand edits to the JSON files are never shadowed by a stale
+        snapshot. Other files in the directory (``manifest.json``) do not
+        count.
+        """
+        sources = cls.source_signatures(path.parent)
+        signature = _file_signature(path)
+        if signature is None:
+            return cls(None, None, sources)
+        snapshot = Snapshot(path)
+        newer = [f"{name}.json" for name, source in sources.items() if source is not None and source[0] > signature[0]]
+        if newer:
+            logger.warning(f"Backup snapshot {path.name} is older than {', '.join(sorted(newer))}; using JSON files")
+            return cls(signature, None, sources)
+        return cls(signature, snapshot, sources)
+    
+    def document(self, key: str) -> Optional[Document]:
+        if key not in self._documents:
+            raw = self.snapshot.get(key)
+            if raw is None:
+                return None
+            self._documents[key] = _validated(key, raw, "backup snapshot")
+        return self._documents[key]
+
+
+def _models(categories: dict[str, list[Document]]) -> list[Model]:
+    """Validated category models, types in ``CATEGORY_LISTS`` order."""
+    return [document.model for documents in categories.values() for document in documents]
+
+
+def _snapshot_key(name: str, keys: tuple) -> str:
+    """Map a backup file member to its snapshot key (the Redis key suffix)."""
+    if name == "categories":
+        return ":".join(keys)
+    return ":".join((name, *keys))
+
+
+def _file_signature(path: Path) -> Optional[tuple]:
+    """Return (mtime_ns, size, inode) for ``path``, or None if it is missing."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
 class BackupLoader:
-    """Loads and caches backup JSON files."""
+    """Loads backup data lazily and hot-reloads it.
+
+    When ``BACKUP_DIR/BACKUP_SNAPSHOT`` exists, documents are read from that
+    memory-mapped snapshot in O(1) each. Otherwise each JSON file is read
+    on first access only. ``reload_changed`` re-reads any file whose mtime,
+    size or inode changed and swaps in the new snapshot with a single
+    assignment; ``watch`` runs it periodically off the event loop so
+    requests are never blocked by a reload. Async callers read through
+    ``document`` and ``data``, which also do a cold read in a worker thread.
+    """
+    
+    FILES = ("catalog", "solutions", "settings", "content", "categories")
     
     def __init__(self):
-        """Initialize backup loader with in-memory cache."""
-        self._cache = {}
-        self._loaded = False
+        """Initialize backup loader with no files read yet."""
+        self._files: dict[str, BackupFile] = {}
+        self._snapshot: Optional[SnapshotBackup] = None
         self._redis_unavailable_logged = False
+        self.reloads = 0
+        self.reload_failures = 0
     
-    def _load_backups(self):
-        """Lazy-load all backup files into memory cache."""
-        if self._loaded:
-            return
-        
+    def _file(self, name: str) -> BackupFile:
+        """Get the current snapshot of one backup file, reading it on first use."""
+        snapshot = self._files.get(name)
+        if snapshot is None:
+            snapshot = self._files[name] = BackupFile.read(name, BACKUP_DIR / f"{name}.json")
+            if snapshot.raw is not None:
+                logger.info(f"Loaded backup file {name}.json from {BACKUP_DIR}")
+        return snapshot
+    
+    def _snapshot_backup(self) -> Optional[SnapshotBackup]:
+        """Get the opened snapshot file, opening it on first use."""
+        if not BACKUP_SNAPSHOT:
+            return None
+        if self._snapshot is None:
+            path = BACKUP_DIR / BACKUP_SNAPSHOT
+            try:
+                self._snapshot = SnapshotBackup.open(path)
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to open backup snapshot {path}: {e}")
+                self._snapshot = SnapshotBackup(_file_signature(path), None)
+            if self._snapshot.snapshot is not None:
+                logger.info(f"Loaded backup snapshot {path} ({len(self._snapshot.snapshot)} documents)")
+        return self._snapshot
+    
+    def _document(self, name: str, *keys: str) -> Optional[Document]:
+        snapshot = self._snapshot_backup()
+        if snapshot is not None and snapshot.snapshot is not None:
+            return snapshot.document(_snapshot_key(name, keys))
+        return self._file(name).document(*keys)
+    
+    def _data(self, name: str, *keys: str) -> Optional[Any]:
+        document = self._document(name, *keys)
+        return document.data if document is not None else None
+    
+    def _loaded(self, name: str, keys: tuple) -> bool:
+        """Whether ``_document(name, *keys)`` is answered from memory, without file I/O."""
+        if BACKUP_SNAPSHOT and self._snapshot is None:
+            return False
+        if self._snapshot is not None and self._snapshot.snapshot is not None:
+            return _snapshot_key(name, keys) in self._snapshot._documents
+        snapshot = self._files.get(name)
+        return snapshot is not None and keys in snapshot._documents
+    
+    async def document(self, name: str, *keys: str) -> Optional[Document]:
+        """``_document`` for the event loop: cold reads run in a worker thread.
+
+        Reading the file, slicing and decoding the member and validating
+        its model happen once per file version; a reload swaps in
+        unread files, so the next read after it is cold again.
+        """
+        if self._loaded(name, keys):
+            return self._document(name, *keys)
+        return await asyncio.to_thread(self._document, name, *keys)
+    
+    async def data(self, name: str, *keys: str) -> Optional[Any]:
+        """``_data`` for the event loop, decoding in the worker thread too when cold."""
+        if self._loaded(name, keys):
+            return self._data(name, *keys)
+        return await asyncio.to_thread(self._data, name, *keys)
+    
+    def reload_changed(self) -> list[str]:
+        """Re-read backup files that changed on disk; return their names.
+
+        Only files that have been read before are checked, plus, while the
+        snapshot is in use, the JSON files it is built from. A replacement
+        that is not a complete JSON object (for example a half-written
+        copy) is ignored and the previous snapshot stays in place.
+        """
+        reloaded = []
+        for name, current in list(self._files.items()):
+            path = BACKUP_DIR / f"{name}.json"
+            if _file_signature(path) == current.signature:
+                continue
+            snapshot = BackupFile.read(name, path)
+            try:
+                snapshot.validate()
+            except ValueError as e:
+                self.reload_failures += 1
+                logger.error(f"Ignoring changed backup file {path}: {e}")
+                continue
+            self._files[name] = snapshot
+            self.reloads += 1
+            reloaded.append(name)
+            logger.info(f"Reloaded backup file {name}.json")
+        if self._snapshot is not None and self._reload_snapshot():
+            reloaded.append(BACKUP_SNAPSHOT)
+        return reloaded
+    
+    def _reload_snapshot(self) -> bool:
+        """Re-open the snapshot when it or any JSON file it is built from changed.
+
+        An edited JSON file makes the snapshot stale, so the re-opened
+        loader falls back to the JSON files until the snapshot is rebuilt.
+        """
+        path = BACKUP_DIR / BACKUP_SNAPSHOT
+        if _file_signature(path) == self._snapshot.signature and (
+            self._snapshot.snapshot is None
+            or SnapshotBackup.source_signatures(BACKUP_DIR) == self._snapshot.sources
+        ):
+            return False
         try:
-            catalog_path = BACKUP_DIR / "catalog.json"
-            if catalog_path.exists():
-                with open(catalog_path, 'r') as f:
-                    self._cache['catalog'] = json.load(f)
-            
-            solutions_path = BACKUP_DIR / "solutions.json"
-            if solutions_path.exists():
-                with open(solutions_path, 'r') as f:
-                    self._cache['solutions'] = json.load(f)
-            
-            settings_path = BACKUP_DIR / "settings.json"
-            if settings_path.exists():
-                with open(settings_path, 'r') as f:
-                    settings_data = json.load(f)
-                    self._cache['settings'] = settings_data
-            
-            content_path = BACKUP_DIR / "content.json"
-            if content_path.exists():
-                with open(content_path, 'r') as f:
-                    content_data = json.load(f)
-                    self._cache['content'] = content_data
-            
-            categories_path = BACKUP_DIR / "categories.json"
-            if categories_path.exists():
-                with open(categories_path, 'r') as f:
-                    categories_data = json.load(f)
-                    self._cache['categories'] = categories_data
-            
-            self._loaded = True
-            logger.info(f"Loaded backup data from {BACKUP_DIR}")
-        except Exception as e:
-            logger.error(f"Failed to load backup files: {e}")
+            self._snapshot = SnapshotBackup.open(path)
+        except (OSError, ValueError) as e:
+            self.reload_failures += 1
+            logger.error(f"Ignoring changed backup snapshot {path}: {e}")
+            return False
+        self.reloads += 1
+        logger.info(f"Reloaded backup snapshot {path}")
+        return True
+    
+    async def watch(self, interval: float = BACKUP_RELOAD_SECONDS):
+        """Poll backup files every ``interval`` seconds and reload changes.
+
+        File reads and span validation run in a worker thread.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.reload_changed)
+            except Exception as e:
+                logger.error(f"Backup reload failed: {e}")
+    
+    def stats(self) -> dict:
+        """Return loaded files and reload counters for health checks."""
+        return {
+            "loaded": sorted(name for name, snapshot in self._files.items() if snapshot.raw is not None),
+            "snapshot": len(self._snapshot.snapshot) if self._snapshot and self._snapshot.snapshot else None,
+            "size_bytes": sum(len(snapshot.raw) for snapshot in self._files.values() if snapshot.raw is not None),
+            "compressed_bytes": sum(
+                document.compressed_bytes
+                for container in [*self._files.values(), *([self._snapshot] if self._snapshot else [])]
+                for document in container._documents.values()
+            ),
+            "reloads": self.reloads,
+            "reload_failures": self.reload_failures,
+        }
     
     def get_catalog(self) -> Optional[dict]:
         """Get catalog from backup."""
-        self._load_backups()
-        return self._cache.get('catalog')
+        return self._data('catalog')
     
     def get_solutions(self) -> Optional[dict]:
         """Get solutions from backup."""
-        self._load_backups()
-        return self._cache.get('solutions')
+        return self._data('solutions')
     
     def get_category(self, category_type: str, slug: str) -> Optional[dict]:
         """Get category from backup."""
-        self._load_backups()
-        categories = self._cache.get('categories', {})
-        return categories.get(category_type, {}).get(slug)
+        return self._data('categories', category_type, slug)
     
     def get_settings(self, setting_type: str) -> Optional[dict]:
         """Get settings from backup."""
-        self._load_backups()
-        settings = self._cache.get('settings', {})
-        return settings.get(setting_type)
+        return self._data('settings', setting_type)
     
     def get_content(self, content_type: str) -> Optional[dict]:
         """Get content from backup."""
-        self._load_backups()
-        content = self._cache.get('content', {})
-        return content.get(content_type)
+        return self._data('content', content_type)
+    
+    def get_catalog_document(self) -> Optional[Document]:
+        """Get catalog Document from backup."""
+        return self._document('catalog')
+    
+    def get_solutions_document(self) -> Optional[Document]:
+        """Get solutions Document from backup."""
+        return self._document('solutions')
+    
+    def get_category_document(self, category_type: str, slug: str) -> Optional[Document]:
+        """Get category Document from backup."""
+        return self._document('categories', category_type, slug)
+    
+    def get_settings_document(self, setting_type: str) -> Optional[Document]:
+        """Get settings Document from backup."""
+        return self._document('settings', setting_type)
     
     def log_redis_unavailable(self):
         """Log Redis unavailability once per process."""
@@ -99,13 +543,442 @@ class BackupLoader:
             self._redis_unavailable_logged = True
 
 
+class DocumentCache:
+    """Memory-capped LRU cache with a per-key TTL for JSON documents.
+
+    Entry size is the length of the serialized JSON as returned by Redis,
+    which keeps accounting cheap and proportional to real memory use.
+    Projections are entries of their own under ``key|fields``; storing or
+    invalidating ``key`` drops them.
+    """
+    
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES, ttl: float = CACHE_TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_hits = 0
+        self._entries: OrderedDict[str, tuple[Any, int, float]] = OrderedDict()
+        # Projection keys cached per document key
+        self._derived: dict[str, set[str]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+    
+    def get(self, key: str, honor_ttl: bool = True, max_stale: float = 0.0) -> Optional[Any]:
+        """Return a cached value and mark it most recently used.
+
+        Entries up to ``max_stale`` seconds past expiry are still returned
+        (counted as stale hits). With ``honor_ttl=False`` expiry is ignored
+        entirely; used while server-side invalidation keeps the cache coherent.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, size, expires_at = entry
+        if honor_ttl:
+            overdue = time.monotonic() - expires_at
+            if overdue > max_stale:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            if overdue >= 0:
+                self.stale_hits += 1
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, key: str, value: Any, size: int, ttl: Optional[float] = None):
+        """Store a value, evicting least recently used entries to fit."""
+        if key in self._entries:
+            self._remove(key)
+        base, separator, _ = key.partition(PROJECTION_SEPARATOR)
+        if not separator:
+            self._remove_derived(key)
+        if size > self.max_bytes:
+            return
+        while self._entries and self.size_bytes + size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (value, size, expires_at)
+        self.size_bytes += size
+        if separator:
+            self._derived.setdefault(base, set()).add(key)
+    
+    def peek(self, key: str) -> Optional[Any]:
+        """Return a cached value without touching recency, expiry or counters."""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+    
+    def overdue(self, key: str) -> Optional[float]:
+        """Seconds since the entry expired (negative while fresh), None if absent."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return time.monotonic() - entry[2]
+    
+    def invalidate(self, key: str) -> bool:
+        """Drop a key and any projections cached for it. Returns True if it was cached."""
+        self._remove_derived(key)
+        if key in self._entries:
+            self._remove(key)
+            return True
+        return False
+    
+    def clear(self):
+        """Drop every entry."""
+        self._entries.clear()
+        self._derived.clear()
+        self.size_bytes = 0
+    
+    def _remove(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self.size_bytes -= size
+        base, separator, _ = key.partition(PROJECTION_SEPARATOR)
+        derived = self._derived.get(base) if separator else None
+        if derived is not None:
+            derived.discard(key)
+            if not derived:
+                del self._derived[base]
+    
+    def _remove_derived(self, key: str):
+        for derived in self._derived.pop(key, ()):
+            self._remove(derived)
+    
+    def stats(self) -> dict:
+        """Return counters and current usage."""
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "compressed_bytes": sum(getattr(value, "compressed_bytes", 0) for value, _, _ in self._entries.values()),
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "stale_hits": self.stale_hits,
+        }
+
+
+class ChangeLog:
+    """Bounded log of document changes, newest last, for delta sync.
+
+    Each entry is ``(version, key, patch, removed)`` where ``patch`` is a
+    JSON Patch from the previous document, or None when the previous
+    document was not cached or the patch would be larger than the
+    document. ``floor`` is the oldest version the log can answer from:
+    the version it started at, raised as entries fall off the end.
+    """
+    
+    def __init__(self, size: int = CHANGE_LOG_SIZE):
+        self._entries: deque[tuple[int, str, Optional[list], bool]] = deque(maxlen=size)
+        self.floor: Optional[int] = None
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def reset(self, version: Optional[int]):
+        """Forget every entry; clients older than ``version`` must reload."""
+        self._entries.clear()
+        self.floor = version
+    
+    def record(self, version: int, key: str, patch: Optional[list], removed: bool = False):
+        if len(self._entries) == self._entries.maxlen:
+            self.floor = max(self.floor or 0, self._entries[0][0])
+        self._entries.append((version, key, patch, removed))
+    
+    def since(self, version: int) -> Optional[list[dict]]:
+        """Changes after ``version``, one per key, or None if the log does not reach back that far.
+
+        Several changes to one key are merged by concatenating their
+        patches; if any of them has no patch the merged change has none.
+        """
+        if self.floor is None or version < self.floor:
+            return None
+        changes: dict[str, dict] = {}
+        for entry_version, key, patch, removed in self._entries:
+            if entry_version <= version:
+                continue
+            change = changes.get(key)
+            if change is None:
+                changes[key] = {"key": key, "version": entry_version, "patch": patch, "removed": removed}
+                continue
+            change["version"] = entry_version
+            change["removed"] = removed
+            change["patch"] = change["patch"] + patch if change["patch"] is not None and patch is not None else None
+        return list(changes.values())
+    
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._entries.maxlen,
+            "floor": self.floor,
+        }
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker guarding Redis calls.
+
+    Closed: calls flow and outcomes are recorded in a rolling window; once
+    at least ``min_calls`` outcomes are in and the failure rate reaches
+    ``failure_rate`` the breaker opens. Open: calls fail fast. After
+    ``open_seconds`` a single half-open probe is allowed; success closes the
+    breaker, failure re-opens it for another cooldown.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(
+        self,
+        failure_rate: float = CIRCUIT_FAILURE_RATE,
+        window_size: int = CIRCUIT_WINDOW_SIZE,
+        min_calls: int = CIRCUIT_MIN_CALLS,
+        open_seconds: float = CIRCUIT_OPEN_SECONDS
+    ):
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.state = self.CLOSED
+        self.opened_at: Optional[float] = None
+        self.times_opened = 0
+        self.rejected = 0
+        self._window: deque[bool] = deque(maxlen=window_size)
+    
+    def allow_request(self) -> bool:
+        """Return True if a regular call may go to Redis."""
+        if self.state == self.CLOSED:
+            return True
+        self.rejected += 1
+        return False
+    
+    def probe_due(self) -> bool:
+        """Move to half-open and return True once the cooldown has passed."""
+        if self.state != self.OPEN or time.monotonic() - self.opened_at < self.open_seconds:
+            return False
+        self.state = self.HALF_OPEN
+        return True
+    
+    def record_success(self):
+        if self.state == self.HALF_OPEN:
+            self._close()
+            return
+        self._window.append(True)
+    
+    def record_failure(self):
+        if self.state == self.HALF_OPEN:
+            self.trip()
+            return
+        if self.state == self.OPEN:
+            return
+        self._window.append(False)
+        if len(self._window) >= self.min_calls and self._current_failure_rate() >= self.failure_rate:
+            self.trip()
+    
+    def trip(self):
+        """Open the breaker immediately."""
+        if self.state == self.CLOSED:
+            self.times_opened += 1
+            logger.warning(f"Redis circuit breaker open, probing again in {self.open_seconds}s")
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self._window.clear()
+    
+    def _close(self):
+        self.state = self.CLOSED
+        self.opened_at = None
+        self._window.clear()
+        logger.info("Redis circuit breaker closed, Redis reads restored")
+    
+    def _current_failure_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        return self._window.count(False) / len(self._window)
+    
+    def stats(self) -> dict:
+        """Return breaker state for health checks and metrics."""
+        return {
+            "state": self.state,
+            "failure_rate": round(self._current_failure_rate(), 3),
+            "window_calls": len(self._window),
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "open_for_seconds": round(time.monotonic() - self.opened_at, 1) if self.opened_at else None,
+        }
+
+
+class ReadReplica:
+    """One read replica and its measured health."""
+    
+    __slots__ = ("name", "client", "latency", "healthy", "failures")
+    
+    def __init__(self, name: str, client: Any):
+        self.name = name
+        self.client = client
+        self.latency: Optional[float] = None
+        self.healthy = False
+        self.failures = 0
+
+
+class ReplicaSet:
+    """Read replicas ranked by PING latency, with reads pinned to one of them.
+
+    Every ``REPLICA_CHECK_SECONDS`` each replica is PINGed and its latency
+    folded into a moving average; a replica that fails the PING or whose
+    link to the primary is down is skipped. Reads stay on the selected
+    replica while it is healthy and within ``latency_window`` of the
+    fastest one, so the ``fas:version`` stamp and the documents it
+    validates come from the same replication stream.
+    """
+    
+    SMOOTHING = 0.3
+    
+    def __init__(self, replicas: list[ReadReplica], latency_window: float = REPLICA_LATENCY_WINDOW_MS / 1000):
+        self.replicas = replicas
+        self.latency_window = latency_window
+        self.selected: Optional[ReadReplica] = None
+        self.fallbacks = 0
+    
+    def select(self) -> Optional[ReadReplica]:
+        """Return the replica reads should go to, or None for the primary."""
+        return self.selected
+    
+    def _choose(self):
+        healthy = [replica for replica in self.replicas if replica.healthy and replica.latency is not None]
+        if not healthy:
+            self.selected = None
+            return
+        fastest = min(healthy, key=lambda replica: replica.latency)
+        current = self.selected
+        if current is None or current not in healthy or current.latency > fastest.latency + self.latency_window:
+            if current is not fastest:
+                logger.info(f"Reading from replica {fastest.name} ({fastest.latency * 1000:.1f}ms)")
+            self.selected = fastest
+    
+    def mark_down(self, replica: ReadReplica):
+        """Take a replica out of rotation until its next successful check."""
+        replica.healthy = False
+        replica.failures += 1
+        self.fallbacks += 1
+        self._choose()
+    
+    async def _measure(self, replica: ReadReplica):
+        try:
+            started = time.perf_counter()
+            await replica.client.ping()
+            latency = time.perf_counter() - started
+            info = await replica.client.info("replication")
+        except Exception as e:
+            if replica.healthy:
+                logger.warning(f"Read replica {replica.name} unavailable: {e}")
+            replica.healthy = False
+            replica.failures += 1
+            return
+        replica.latency = latency if replica.latency is None else (
+            self.SMOOTHING * latency + (1 - self.SMOOTHING) * replica.latency
+        )
+        # A node promoted to primary has no link to check
+        replica.healthy = info.get("role") != "slave" or info.get("master_link_status") == "up"
+    
+    async def measure(self):
+        """Check every replica concurrently and re-select."""
+        await asyncio.gather(*(self._measure(replica) for replica in self.replicas))
+        self._choose()
+    
+    async def watch(self, interval: float = REPLICA_CHECK_SECONDS):
+        """Re-check replicas every ``interval`` seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.measure()
+    
+    async def close(self):
+        for replica in self.replicas:
+            await replica.client.aclose()
+            await replica.client.connection_pool.aclose()
+    
+    def stats(self) -> dict:
+        """Return replica health for health checks and metrics."""
+        return {
+            "selected": self.selected.name if self.selected else None,
+            "fallbacks": self.fallbacks,
+            "replicas": {
+                replica.name: {
+                    "healthy": replica.healthy,
+                    "latency_ms": round(replica.latency * 1000, 2) if replica.latency is not None else None,
+                    "failures": replica.failures,
+                }
+                for replica in self.replicas
+            },
+        }
+
+
+def _parse_hosts(value: str, default_port: int) -> list[tuple[str, int]]:
+    """Parse ``host[:port],host[:port]`` into (host, port) pairs."""
+    hosts = []
+    for entry in value.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        host, _, port = entry.rpartition(":")
+        if host and port.isdigit():
+            hosts.append((host, int(port)))
+        else:
+            hosts.append((entry, default_port))
+    return hosts
+
+
+def _unwrap_root(result: Any) -> bytes:
+    """Strip the one-element array RedisJSON wraps around a ``$`` query."""
+    raw = result.encode() if isinstance(result, str) else bytes(result)
+    raw = raw.strip()
+    if raw[:1] == b"[" and raw[-1:] == b"]":
+        raw = raw[1:-1].strip()
+    return raw
+
+
 class RedisClient:
-    """Redis client wrapper for JSON operations with backup fallback."""
+    """Async Redis client wrapper for JSON operations with backup fallback.
+
+    Commands are issued through ``redis.asyncio`` over a bounded connection
+    pool, so a slow Redis round trip suspends only the awaiting request
+    instead of the whole event loop.
+    """
     
     def __init__(self):
-        """Initialize Redis client."""
-        self.redis_available = False
+        """Initialize Redis connection pool. Call ``connect()`` before use."""
+        self.client = None
+        self.connected = False
+        self.breaker = CircuitBreaker()
+        self._probe_task: Optional[asyncio.Task] = None
         self.backup_loader = BackupLoader()
+        self.cache = DocumentCache()
+        self.tracking_active = False
+        self.invalidations = 0
+        self.content_version: Optional[int] = None
+        self.version_checked_at: Optional[float] = None
+        self.version_changes = 0
+        self.change_log = ChangeLog()
+        self.rejected = 0
+        self._tracking_task: Optional[asyncio.Task] = None
+        self._version_task: Optional[asyncio.Task] = None
+        self._backup_watch_task: Optional[asyncio.Task] = None
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+        self.refresh_stats: dict[str, dict] = {}
+        self.replicas: Optional[ReplicaSet] = None
+        self._derived_values: dict[str, tuple[tuple, Any]] = {}
+        self._replica_task: Optional[asyncio.Task] = None
         
         if BACKUP_ONLY:
             logger.info("BACKUP_ONLY mode enabled, skipping Redis connection")
@@ -115,88 +988,848 @@ class RedisClient:
             logger.warning("REDIS_HOST or REDIS_PASSWORD not set, will use backup files only")
             return
         
+        self._connection_class = aioredis.SSLConnection if REDIS_SSL else aioredis.Connection
+        self._connection_kwargs = {
+            "host": REDIS_HOST,
+            "port": REDIS_PORT,
+            "password": REDIS_PASSWORD,
+            "username": "default",
+            "decode_responses": False,
+            "socket_connect_timeout": REDIS_SOCKET_TIMEOUT,
+            "socket_timeout": REDIS_SOCKET_TIMEOUT,
+        }
         try:
-            self.client = redis.Redis(
-                host=REDIS_HOST,
-                port=REDIS_PORT,
-                password=REDIS_PASSWORD,
-                username="default",
-                ssl=True,
-                decode_responses=False,
-                socket_connect_timeout=2,
-                socket_timeout=2
-            )
-            self._test_connection()
+            if REDIS_CLUSTER:
+                self.client = self._cluster_client()
+            else:
+                self.client = self._pooled_client(**self._connection_kwargs)
+                replicas = [
+                    ReadReplica(f"{host}:{port}", self._pooled_client(**{**self._connection_kwargs, "host": host, "port": port}))
+                    for host, port in _parse_hosts(REDIS_REPLICAS, REDIS_PORT)
+                ]
+                if replicas:
+                    self.replicas = ReplicaSet(replicas)
         except Exception as e:
             logger.warning(f"Failed to initialize Redis client: {e}. Will use backup files.")
             self.client = None
     
-    def _test_connection(self):
+    def _pooled_client(self, **connection_kwargs) -> aioredis.Redis:
+        pool = aioredis.BlockingConnectionPool(
+            connection_class=self._connection_class,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT,
+            **connection_kwargs
+        )
+        return aioredis.Redis(connection_pool=pool)
+    
+    def _cluster_client(self) -> aioredis.RedisCluster:
+        """Cluster client seeded from ``REDIS_HOST`` that reads from replicas.
+
+        Reads are spread round-robin over each shard's replicas; writes and
+        shards without replicas use the shard primary.
+        """
+        kwargs = {k: v for k, v in self._connection_kwargs.items() if k not in ("host", "port")}
+        return aioredis.RedisCluster(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            ssl=REDIS_SSL,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            load_balancing_strategy=LoadBalancingStrategy.ROUND_ROBIN_REPLICAS,
+            **kwargs
+        )
+    
+    async def connect(self):
+        """Test the Redis connection and start background watchers."""
+        if BACKUP_RELOAD_SECONDS > 0 and self._backup_watch_task is None:
+            self._backup_watch_task = asyncio.create_task(self.backup_loader.watch())
+        if self.client:
+            await self._test_connection()
+            if self.replicas is not None and self._replica_task is None:
+                await self.replicas.measure()
+                self._replica_task = asyncio.create_task(self.replicas.watch())
+            if REDIS_CLIENT_TRACKING and self._tracking_task is None:
+                if REDIS_CLUSTER or self.replicas is not None:
+                    # Invalidations come from the primary before replicas apply the write
+                    logger.warning("REDIS_CLIENT_TRACKING is ignored with read replicas or cluster mode")
+                else:
+                    self._tracking_task = asyncio.create_task(self._track_invalidations())
+            if VERSION_CHECK_SECONDS > 0 and self._version_task is None:
+                await self.check_version()
+                self._version_task = asyncio.create_task(self._watch_version())
+    
+    @property
+    def redis_available(self) -> bool:
+        """True once Redis has answered a PING and the circuit breaker is closed."""
+        return self.connected and self.breaker.state == CircuitBreaker.CLOSED
+    
+    async def _test_connection(self):
         """Test Redis connection."""
         try:
-            self.client.ping()
-            self.redis_available = True
+            await self.client.ping()
+            self.connected = True
             logger.info("Successfully connected to Redis")
         except Exception as e:
             logger.warning(f"Redis connection test failed: {e}. Will use backup files.")
-            self.redis_available = False
+            self._trip_breaker()
+    
+    def _record_failure(self):
+        """Record a failed Redis call, starting probes if the breaker opens."""
+        self.breaker.record_failure()
+        if self.breaker.state == CircuitBreaker.OPEN:
+            self._start_probing()
+    
+    def _trip_breaker(self):
+        self.breaker.trip()
+        self._start_probing()
+    
+    def _start_probing(self):
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = asyncio.create_task(self._probe_until_closed())
+    
+    async def _probe_until_closed(self):
+        """Periodically PING Redis while the breaker is open.
+
+        Probes run in the background so no request waits on a Redis that
+        may still be hung; requests keep using cache and backup until a
+        probe succeeds and closes the breaker.
+        """
+        while self.breaker.state != CircuitBreaker.CLOSED:
+            await asyncio.sleep(self.breaker.open_seconds)
+            if not self.breaker.probe_due():
+                continue
+            try:
+                await self.client.ping()
+                self.connected = True
+                self.breaker.record_success()
+            except Exception as e:
+                logger.warning(f"Redis half-open probe failed: {e}")
+                self.breaker.record_failure()
+    
+    async def _open_tracking(self) -> tuple:
+        """Open a subscriber connection and enable BCAST tracking for ``fas:``.
+
+        Tracking state lives on the connection that enabled it, so both
+        connections are created outside the pool and held for the lifetime
+        of the listener. RESP2 is used with ``REDIRECT`` so the subscriber
+        receives invalidations as ordinary pub/sub messages.
+        """
+        listener = self._connection_class(**self._connection_kwargs, protocol=2)
+        tracker = self._connection_class(**self._connection_kwargs, protocol=2)
+        try:
+            await listener.connect()
+            await listener.send_command("CLIENT", "ID")
+            listener_id = await listener.read_response()
+            await listener.send_command("SUBSCRIBE", INVALIDATE_CHANNEL)
+            await listener.read_response()
+            
+            await tracker.connect()
+            await tracker.send_command(
+                "CLIENT", "TRACKING", "ON", "REDIRECT", listener_id,
+                "BCAST", "PREFIX", f"{KEY_PREFIX}:"
+            )
+            await tracker.read_response()
+        except Exception:
+            await listener.disconnect()
+            await tracker.disconnect()
+            raise
+        return listener, tracker
+    
+    @property
+    def cache_validated(self) -> bool:
+        """True while cached documents are known to be current.
+
+        Either CLIENT TRACKING is delivering invalidations, or a recent
+        ``fas:version`` check matched the version the cache was built at.
+        In both cases entries are served past their TTL.
+        """
+        if self.tracking_active:
+            return True
+        if self.content_version is None or self.version_checked_at is None:
+            return False
+        return time.monotonic() - self.version_checked_at <= 2 * VERSION_CHECK_SECONDS
+    
+    async def check_version(self) -> Optional[int]:
+        """Validate the whole cache with one ``GET fas:version``.
+
+        When the version moved, only documents whose ``fas:versions`` entry
+        is newer than the cached version are evicted; without per-document
+        versions, or when no entry records the new version, the whole cache
+        is dropped. The cache counts as validated only after that.
+        """
+        if not self.connected or not self.breaker.allow_request():
+            return None
+        try:
+            raw = await self._read(lambda client: client.execute_command('GET', VERSION_KEY))
+            self.breaker.record_success()
+        except Exception as e:
+            logger.warning(f"Error checking {VERSION_KEY}: {e}")
+            self._record_failure()
+            return None
+        
+        try:
+            version = int(raw) if raw is not None else None
+        except ValueError:
+            logger.warning(f"Ignoring non-integer {VERSION_KEY}: {raw[:32]!r}")
+            return None
+        if version != self.content_version:
+            await self._apply_version_change(self.content_version, version)
+        self.version_checked_at = time.monotonic()
+        return version
     
-    def get_json(self, key: str) -> Optional[Any]:
-        """Get JSON document from Redis with backup fallback."""
-        if self.redis_available and self.client:
+    async def _apply_version_change(self, old: Optional[int], new: Optional[int]):
+        self.invalidations += 1
+        changed = None
+        if old is not None and new is not None and new > old:
+            try:
+                versions = await self._read(lambda client: client.execute_command('HGETALL', VERSIONS_KEY))
+            except Exception as e:
+                logger.warning(f"Error reading {VERSIONS_KEY}: {e}")
+                versions = None
+            if versions:
+                pairs = versions.items() if isinstance(versions, dict) else zip(versions[::2], versions[1::2])
+                changed = {key.decode(): int(doc_version) for key, doc_version in pairs if int(doc_version) > old}
+                if new not in changed.values():
+                    # No key was written at the new version, so the hash lags behind
+                    # fas:version and cannot tell which documents changed
+                    changed = None
+        if changed is None:
+            self.cache.clear()
+            self.change_log.reset(new)
+        else:
+            previous = {key: self.cache.peek(key) for key in changed}
+            for key in changed:
+                self.cache.invalidate(key)
+            await self._record_changes(changed, previous)
+        if old is not None:
+            logger.info(f"Content version {old} -> {new}, evicted {'all' if changed is None else len(changed)} documents")
+        self.content_version = new
+        self.version_changes += 1
+    
+    async def _record_changes(self, changed: dict[str, int], previous: dict[str, Optional[Document]]):
+        """Append changed keys to the change log, with patches for documents that were cached.
+
+        The new versions of previously cached documents are fetched with one
+        JSON.MGET and cached, since this instance was serving them. A key
+        that no longer exists is logged as removed.
+        """
+        cached = [key for key, document in previous.items() if document is not None]
+        current: dict[str, Optional[Document]] = {}
+        if cached:
+            invalidations = self.invalidations
             try:
-                result = self.client.execute_command('JSON.GET', key, '$')
+                results = await self._read(lambda client: self._json_mget(client, cached))
+                current = {key: None for key, result in zip(cached, results) if not result}
+                current.update(await self._ingest(
+                    {key: Document(_unwrap_root(result)) for key, result in zip(cached, results) if result}
+                ))
+                for key, document in current.items():
+                    if document is not None and invalidations == self.invalidations:
+                        self.cache.set(key, document, document.size_bytes)
+            except Exception as e:
+                logger.warning(f"Error fetching {len(cached)} changed documents for the change log: {e}")
+        
+        def diff_all() -> dict[str, Optional[list]]:
+            patches = {}
+            for key, document in current.items():
+                if document is None:
+                    continue
+                patch = json_patch.diff(previous[key].data, document.data)
+                patches[key] = patch if len(_dump(patch)) < len(document.raw) else None
+            return patches
+        
+        patches = await asyncio.to_thread(diff_all) if current else {}
+        for key, version in sorted(changed.items(), key=lambda item: item[1]):
+            removed = key in current and current[key] is None
+            self.change_log.record(version, key, patches.get(key), removed)
+    
+    async def changes_since(self, version: int) -> Optional[list[dict]]:
+        """Changes after ``version`` from the change log, None if the client has to reload.
+
+        A client ahead of the current version also has to reload: its
+        version was issued before ``fas:version`` restarted lower, e.g.
+        after Redis was rebuilt.
+        """
+        if self.content_version is not None and version > self.content_version:
+            return None
+        return self.change_log.since(version)
+    
+    async def _watch_version(self):
+        """Re-check ``fas:version`` every ``VERSION_CHECK_SECONDS``."""
+        while True:
+            await asyncio.sleep(VERSION_CHECK_SECONDS)
+            await self.check_version()
+    
+    def _handle_invalidation(self, message: Any):
+        """Evict keys named in an ``__redis__:invalidate`` message."""
+        if not isinstance(message, list) or len(message) < 3:
+            return
+        if message[0] != b"message" or message[1] != INVALIDATE_CHANNEL:
+            return
+        self.invalidations += 1
+        keys = message[2]
+        if keys is None:
+            # Sent on FLUSHDB/FLUSHALL: every tracked key is gone
+            self.cache.clear()
+            return
+        for key in keys:
+            self.cache.invalidate(key.decode() if isinstance(key, bytes) else key)
+    
+    async def _track_invalidations(self):
+        """Keep the cache coherent with Redis via CLIENT TRACKING.
+
+        While tracking is active cached documents never expire by TTL; they
+        are evicted only when Redis reports a write. Any connection problem
+        drops the cache (invalidations may have been missed) and falls back
+        to TTL expiry until tracking is re-established.
+        """
+        while True:
+            listener = tracker = None
+            try:
+                listener, tracker = await self._open_tracking()
+                self.cache.clear()
+                self.tracking_active = True
+                logger.info(f"Client tracking enabled for {KEY_PREFIX}:* keys")
+                while True:
+                    message = await listener.read_response(timeout=TRACKING_KEEPALIVE_SECONDS)
+                    if message is None:
+                        await tracker.send_command("PING")
+                        await tracker.read_response()
+                        continue
+                    self._handle_invalidation(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Client tracking interrupted: {e}. Retrying in {TRACKING_RETRY_SECONDS}s")
+            finally:
+                self.tracking_active = False
+                self.cache.clear()
+                for conn in (listener, tracker):
+                    if conn is not None:
+                        await conn.disconnect()
+            await asyncio.sleep(TRACKING_RETRY_SECONDS)
+    
+    async def close(self):
+        """Close the Redis client and release pooled connections."""
+        if self._tracking_task is not None:
+            self._tracking_task.cancel()
+            try:
+                await self._tracking_task
+            except asyncio.CancelledError:
+                pass
+            self._tracking_task = None
+        for task in [*self._refresh_tasks.values(), self._probe_task, self._backup_watch_task, self._version_task,
+                     self._replica_task]:
+            if task is not None:
+                task.cancel()
+        if self.replicas is not None:
+            await self.replicas.close()
+        if self.client:
+            await self.client.aclose()
+            if not REDIS_CLUSTER:
+                await self.client.connection_pool.aclose()
+    
+    async def _read(self, call):
+        """Run ``call(client)`` on the selected read replica, else the primary.
+
+        A replica that errors is taken out of rotation and the call is
+        retried once on the primary, so only a primary failure surfaces.
+        """
+        replica = self.replicas.select() if self.replicas is not None else None
+        if replica is not None:
+            try:
+                return await call(replica.client)
+            except Exception as e:
+                logger.warning(f"Read from replica {replica.name} failed: {e}. Retrying on primary.")
+                self.replicas.mark_down(replica)
+        return await call(self.client)
+    
+    async def _json_mget(self, client: Any, keys: list[str]) -> list:
+        """``JSON.MGET`` keys, one call per hash slot in cluster mode."""
+        if not REDIS_CLUSTER:
+            return await client.execute_command('JSON.MGET', *keys, '$')
+        by_slot: dict[int, list[str]] = {}
+        for key in keys:
+            by_slot.setdefault(client.keyslot(key), []).append(key)
+        replies = await asyncio.gather(
+            *(client.execute_command('JSON.MGET', *group, '$') for group in by_slot.values())
+        )
+        found = {key: result for group, reply in zip(by_slot.values(), replies) for key, result in zip(group, reply)}
+        return [found[key] for key in keys]
+    
+    async def get_json(self, key: str, stale_while_revalidate: bool = False) -> Optional[Any]:
+        """Get JSON document from the cache or Redis, None when unavailable.
+
+        With ``stale_while_revalidate`` an expired cached copy younger than
+        ``CACHE_MAX_STALE_SECONDS`` past expiry is returned immediately and a
+        single background task per key refreshes it from Redis.
+        """
+        document = await self.get_document(key, stale_while_revalidate)
+        return document.data if document is not None else None
+    
+    async def get_json_raw(self, key: str, stale_while_revalidate: bool = False) -> Optional[bytes]:
+        """Get the serialized JSON bytes of a document, never decoding them."""
+        document = await self.get_document(key, stale_while_revalidate)
+        return document.raw if document is not None else None
+    
+    async def get_document(self, key: str, stale_while_revalidate: bool = False) -> Optional[Document]:
+        """Get a cached or freshly fetched Document for key."""
+        swr = stale_while_revalidate and CACHE_STALE_WHILE_REVALIDATE
+        cached = self.cache.get(
+            key,
+            honor_ttl=not self.cache_validated,
+            max_stale=CACHE_MAX_STALE_SECONDS if swr else 0.0
+        )
+        if cached is not None:
+            if swr and not self.cache_validated and self.cache.overdue(key) >= 0:
+                self._schedule_refresh(key)
+            return cached
+        
+        return await self._fetch(key)
+    
+    async def _fetch(self, key: str) -> Optional[Document]:
+        """Read a document from Redis and cache it."""
+        if self.connected and self.breaker.allow_request():
+            try:
+                invalidations = self.invalidations
+                result = await self._read(lambda client: client.execute_command('JSON.GET', key, '$'))
+                self.breaker.record_success()
                 if result:
-                    data = json.loads(result)
-                    return data[0] if isinstance(data, list) and len(data) > 0 else data
+                    document = (await self._ingest({key: Document(_unwrap_root(result))})).get(key)
+                    # Skip caching if an invalidation raced with this read
+                    if document is not None and invalidations == self.invalidations:
+                        self.cache.set(key, document, document.size_bytes)
+                    return document
                 logger.debug(f"Key not found in Redis: {key}")
             except Exception as e:
                 logger.warning(f"Error getting key {key} from Redis: {e}. Falling back to backup.")
-                self.redis_available = False
+                self._record_failure()
         
         return None
     
-    def get_catalog(self) -> Optional[dict]:
+    async def _ingest(self, documents: dict[str, Document]) -> dict[str, Document]:
+        """Validate and precompress documents read from Redis in one worker thread.
+
+        Documents that do not match their model (see ``app.models``) are
+        logged, counted in ``rejected`` and left out of the result, so the
+        caller falls back to the backup copy instead of serving them.
+        """
+        if not documents:
+            return {}
+        
+        def ingest() -> dict[str, Document]:
+            accepted = {}
+            for key, document in documents.items():
+                try:
+                    document.validate(key.removeprefix(f"{KEY_PREFIX}:"))
+                except ValueError as e:
+                    logger.error(f"Rejected malformed {key} from Redis: {e}")
+                    continue
+                document.precompress()
+                accepted[key] = document
+            return accepted
+        
+        accepted = await asyncio.to_thread(ingest)
+        self.rejected += len(documents) - len(accepted)
+        return accepted
+    
+    async def get_projected_document(self, key: str, fields: tuple[str, ...]) -> Optional[Document]:
+        """Get only ``fields`` of a document, cached under ``key|fields``.
+
+        A cached full document is projected in memory. Otherwise the fields
+        are read with RedisJSON path queries (``JSON.GET key $.a $.b[*].c``
+        plus ``JSON.ARRLEN`` to regroup array elements). Either way the
+        projection is cached as its own entry, counted against the cache
+        budget. A projection that paths cannot express exactly falls back
+        to fetching and projecting the full document.
+        """
+        honor_ttl = not self.cache_validated
+        projection_key = key + PROJECTION_SEPARATOR + ",".join(fields)
+        cached = self.cache.get(projection_key, honor_ttl=honor_ttl)
+        if cached is not None:
+            return cached
+        base = self.cache.get(key, honor_ttl=honor_ttl)
+        if base is not None:
+            invalidations = self.invalidations
+            projected = await asyncio.to_thread(base.projection, fields)
+            await precompress(projected)
+            if invalidations == self.invalidations and self.cache.peek(key) is base:
+                self.cache.set(projection_key, projected, projected.size_bytes)
+            return projected
+        
+        if not self.connected or not self.breaker.allow_request():
+            return None
+        
+        paths = redis_paths(fields)
+        try:
+            invalidations = self.invalidations
+            projected = await self._fetch_paths(key, fields, *paths) if paths else None
+            self.breaker.record_success()
+        except Exception as e:
+            logger.warning(f"Error projecting key {key} from Redis: {e}. Falling back to backup.")
+            self._record_failure()
+            return None
+        if projected is False:
+            return None
+        if projected is None:
+            full = await self._fetch(key)
+            return full.projection(fields) if full is not None else None
+        
+        document = Document(_dump(projected))
+        await precompress(document)
+        if invalidations == self.invalidations:
+            self.cache.set(projection_key, document, document.size_bytes)
+        return document
+    
+    async def _fetch_paths(self, key: str, fields: tuple[str, ...], value_paths: list[str], array_paths: list[str]):
+        """Run the path queries for a projection in one round trip.
+
+        Returns the projected value, None if the result cannot be aligned,
+        or False if the key does not exist.
+        """
+        async def query(client):
+            if not array_paths:
+                return [await client.execute_command('JSON.GET', key, *value_paths)]
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.execute_command('JSON.GET', key, *value_paths)
+                for path in array_paths:
+                    pipe.execute_command('JSON.ARRLEN', key, path)
+                return await pipe.execute()
+        
+        result, *lengths = await self._read(query)
+        if result is None:
+            return False
+        values = _json_loads(result)
+        if len(value_paths) == 1:
+            values = {value_paths[0]: values}
+        array_lengths = {
+            path: reply[0] if isinstance(reply, list) and reply else None
+            for path, reply in zip(array_paths, lengths)
+        }
+        return assemble(fields, values, array_lengths)
+    
+    async def get_documents(self, keys: list[str], stale_while_revalidate: bool = False) -> dict[str, Optional[Document]]:
+        """Get many documents, fetching every cache miss with one JSON.MGET."""
+        swr = stale_while_revalidate and CACHE_STALE_WHILE_REVALIDATE
+        documents: dict[str, Optional[Document]] = {}
+        misses = []
+        for key in keys:
+            cached = self.cache.get(
+                key,
+                honor_ttl=not self.cache_validated,
+                max_stale=CACHE_MAX_STALE_SECONDS if swr else 0.0
+            )
+            if cached is not None:
+                if swr and not self.cache_validated and self.cache.overdue(key) >= 0:
+                    self._schedule_refresh(key)
+                documents[key] = cached
+            else:
+                documents[key] = None
+                misses.append(key)
+        
+        if misses and self.connected and self.breaker.allow_request():
+            try:
+                invalidations = self.invalidations
+                results = await self._read(lambda client: self._json_mget(client, misses))
+                fetched = await self._ingest({key: Document(_unwrap_root(result)) for key, result in zip(misses, results) if result})
+                for key, document in fetched.items():
+                    if invalidations == self.invalidations:
+                        self.cache.set(key, document, document.size_bytes)
+                    documents[key] = document
+                self.breaker.record_success()
+            except Exception as e:
+                logger.warning(f"Error getting {len(misses)} keys from Redis: {e}. Falling back to backup.")
+                self._record_failure()
+        
+        return documents
+    
+    def _schedule_refresh(self, key: str):
+        """Start a background refresh for key unless one is already running."""
+        if key in self._refresh_tasks:
+            return
+        task = asyncio.create_task(self._refresh(key))
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+    
+    async def _refresh(self, key: str):
+        """Refresh a stale entry and record how long it was served stale."""
+        started = time.monotonic()
+        overdue_at_start = self.cache.overdue(key) or 0.0
+        data = await self._fetch(key)
+        finished = time.monotonic()
+        
+        stats = self.refresh_stats.setdefault(key, {
+            "refreshes": 0,
+            "failures": 0,
+            "last_lag_ms": None,
+            "max_lag_ms": 0.0,
+            "last_duration_ms": None,
+        })
+        if data is None:
+            stats["failures"] += 1
+            return
+        lag_ms = round((overdue_at_start + finished - started) * 1000, 2)
+        stats["refreshes"] += 1
+        stats["last_lag_ms"] = lag_ms
+        stats["max_lag_ms"] = max(stats["max_lag_ms"], lag_ms)
+        stats["last_duration_ms"] = round((finished - started) * 1000, 2)
+    
+    def stats(self) -> dict:
+        """Return data layer state for health checks and metrics."""
+        return {
+            "redis_available": self.redis_available,
+            "circuit": self.breaker.stats(),
+            "tracking_active": self.tracking_active,
+            "cluster": REDIS_CLUSTER,
+            "replicas": self.replicas.stats() if self.replicas is not None else None,
+            "content_version": self.content_version,
+            "version_changes": self.version_changes,
+            "invalidations": self.invalidations,
+            "change_log": self.change_log.stats(),
+            "rejected": self.rejected,
+            "cache": self.cache.stats(),
+            "refresh": self.refresh_stats,
+            "backup": self.backup_loader.stats(),
+        }
+    
+    async def get_catalog(self) -> Optional[dict]:
         """Get catalog index from Redis or backup."""
-        result = self.get_json(f"{KEY_PREFIX}:catalog")
+        result = await self.get_json(f"{KEY_PREFIX}:catalog", stale_while_revalidate=True)
         if result is None:
             self.backup_loader.log_redis_unavailable()
-            result = self.backup_loader.get_catalog()
+            result = await self.backup_loader.data('catalog')
         return result
     
-    def get_solutions(self) -> Optional[dict]:
+    async def get_solutions(self) -> Optional[dict]:
         """Get solutions document from Redis or backup."""
-        result = self.get_json(f"{KEY_PREFIX}:solutions")
+        result = await self.get_json(f"{KEY_PREFIX}:solutions")
         if result is None:
             self.backup_loader.log_redis_unavailable()
-            result = self.backup_loader.get_solutions()
+            result = await self.backup_loader.data('solutions')
         return result
     
-    def get_category(self, category_type: str, slug: str) -> Optional[dict]:
+    async def get_category(self, category_type: str, slug: str) -> Optional[dict]:
         """Get category document from Redis or backup."""
         key = f"{KEY_PREFIX}:{category_type}:{slug}"
-        result = self.get_json(key)
+        result = await self.get_json(key, stale_while_revalidate=True)
         if result is None:
             self.backup_loader.log_redis_unavailable()
-            result = self.backup_loader.get_category(category_type, slug)
+            result = await self.backup_loader.data('categories', category_type, slug)
         return result
     
-    def get_settings(self, setting_type: str) -> Optional[dict]:
+    async def get_settings(self, setting_type: str) -> Optional[dict]:
         """Get settings document from Redis or backup."""
         key = f"{KEY_PREFIX}:settings:{setting_type}"
-        result = self.get_json(key)
+        result = await self.get_json(key)
         if result is None:
             self.backup_loader.log_redis_unavailable()
-            result = self.backup_loader.get_settings(setting_type)
+            result = await self.backup_loader.data('settings', setting_type)
         return result
     
-    def get_content(self, content_type: str) -> Optional[dict]:
+    async def get_content(self, content_type: str) -> Optional[dict]:
         """Get content document from Redis or backup."""
         key = f"{KEY_PREFIX}:content:{content_type}"
-        result = self.get_json(key)
+        result = await self.get_json(key)
+        if result is None:
+            self.backup_loader.log_redis_unavailable()
+            result = await self.backup_loader.data('content', content_type)
+        return result
+    
+    async def get_catalog_document(self) -> Optional[Document]:
+        """Get catalog Document from Redis or backup."""
+        result = await self.get_document(f"{KEY_PREFIX}:catalog", stale_while_revalidate=True)
+        if result is None:
+            self.backup_loader.log_redis_unavailable()
+            result = await self.backup_loader.document('catalog')
+            await precompress(result)
+        return result
+    
+    async def get_solutions_document(self) -> Optional[Document]:
+        """Get solutions Document from Redis or backup."""
+        result = await self.get_document(f"{KEY_PREFIX}:solutions")
+        if result is None:
+            self.backup_loader.log_redis_unavailable()
+            result = await self.backup_loader.document('solutions')
+            await precompress(result)
+        return result
+    
+    async def get_category_document(self, category_type: str, slug: str) -> Optional[Document]:
+        """Get category Document from Redis or backup."""
+        key = f"{KEY_PREFIX}:{category_type}:{slug}"
+        result = await self.get_document(key, stale_while_revalidate=True)
+        if result is None:
+            self.backup_loader.log_redis_unavailable()
+            result = await self.backup_loader.document('categories', category_type, slug)
+            await precompress(result)
+        return result
+    
+    async def get_category_projection(self, category_type: str, slug: str, fields: tuple[str, ...]) -> Optional[Document]:
+        """Get a projected category Document from Redis or backup."""
+        key = f"{KEY_PREFIX}:{category_type}:{slug}"
+        result = await self.get_projected_document(key, fields)
+        if result is None:
+            self.backup_loader.log_redis_unavailable()
+            document = await self.backup_loader.document('categories', category_type, slug)
+            if document is not None:
+                result = await asyncio.to_thread(document.projection, fields)
+                await precompress(result)
+        return result
+    
+    async def warm_up(self) -> dict:
+        """Load every document the content routes serve into memory.
+
+        Reads the catalog, solutions, settings and content documents and
+        all role and industry categories listed in the catalog, from Redis
+        where possible and otherwise from the backup files.
+        """
+        started = time.perf_counter()
+        catalog = await self.get_catalog_document()
+        names = ["solutions", *(f"settings:{t}" for t in WARMUP_SETTINGS), *(f"content:{t}" for t in WARMUP_CONTENT)]
+        results = await asyncio.gather(
+            self.get_solutions_document(),
+            *(self.get_settings_document(t) for t in WARMUP_SETTINGS),
+            *(self.get_content(t) for t in WARMUP_CONTENT),
+        )
+        missing = [name for name, result in zip(["catalog", *names], [catalog, *results]) if result is None]
+        loaded = 1 + len(names) - len(missing)
+        from_backup = 0
+        if catalog is not None:
+            for category_type, _ in CATEGORY_LISTS:
+                slugs = catalog.model.slugs(category_type)
+                if not slugs:
+                    continue
+                documents, absent, backup = await self.get_category_documents(category_type, slugs)
+                loaded += len(documents)
+                from_backup += len(backup)
+                missing.extend(f"{category_type}:{slug}" for slug in absent)
+        bundle = await self.get_explore_bundle()
+        index = await self.get_search_index()
+        await self.get_facet_index()
+        graph = await self.get_related_graph()
+        report = {
+            "documents": loaded,
+            "missing": missing,
+            "from_backup": from_backup,
+            "explore_bundle_bytes": len(bundle.raw) if bundle is not None else None,
+            "search_documents": len(index) if index is not None else None,
+            "related_documents": len(graph) if graph is not None else None,
+            "redis_available": self.redis_available,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+        logger.info(f"Warm-up loaded {loaded} documents in {report['duration_ms']} ms ({len(missing)} missing)")
+        return report
+    
+    async def get_category_documents(self, category_type: str, slugs: list[str]) -> tuple[dict[str, Document], list[str], list[str]]:
+        """Get several category Documents with one Redis round trip.
+
+        Returns ``(documents, missing, from_backup)``: documents by slug in
+        request order, slugs found nowhere, and slugs served from backup
+        because Redis did not have them.
+        """
+        keys = {slug: f"{KEY_PREFIX}:{category_type}:{slug}" for slug in slugs}
+        found = await self.get_documents(list(keys.values()), stale_while_revalidate=True)
+        
+        documents, missing, from_backup = {}, [], []
+        for slug, key in keys.items():
+            document = found.get(key)
+            if document is None:
+                self.backup_loader.log_redis_unavailable()
+                document = await self.backup_loader.document('categories', category_type, slug)
+                if document is None:
+                    missing.append(slug)
+                    continue
+                from_backup.append(slug)
+            documents[slug] = document
+        await precompress(*(documents[slug] for slug in from_backup))
+        return documents, missing, from_backup
+    
+    async def _catalog_categories(self) -> Optional[tuple[tuple, dict[str, list[Document]], list[str]]]:
+        """Every category the catalog lists, with a signature that changes with any of them.
+
+        Returns ``(signature, categories, missing)``: the ETags of the
+        catalog and every category, category Documents per type in catalog
+        order, and "type:slug" for entries found nowhere. None without a
+        catalog.
+        """
+        catalog = await self.get_catalog_document()
+        if catalog is None:
+            return None
+        categories: dict[str, list[Document]] = {}
+        missing = []
+        for category_type, _ in CATEGORY_LISTS:
+            slugs = catalog.model.slugs(category_type)
+            documents, absent, _ = await self.get_category_documents(category_type, slugs) if slugs else ({}, [], [])
+            categories[category_type] = list(documents.values())
+            missing.extend(f"{category_type}:{slug}" for slug in absent)
+        signature = (catalog.etag, *(document.etag for documents in categories.values() for document in documents))
+        return signature, categories, missing
+    
+    async def _derived(self, name: str, build: Callable[[dict[str, list[Document]], list[str]], Any]) -> Any:
+        """Memoized ``build(categories, missing)`` over every catalog category.
+
+        Source documents come from the cache, Redis or backup like any other
+        read. ``build`` runs in a worker thread, and only when the catalog
+        or one of the categories changed ETag since the last build.
+        """
+        sources = await self._catalog_categories()
+        if sources is None:
+            return None
+        signature, categories, missing = sources
+        previous = self._derived_values.get(name)
+        if previous is not None and previous[0] == signature:
+            return previous[1]
+        value = await asyncio.to_thread(build, categories, missing)
+        self._derived_values[name] = (signature, value)
+        return value
+    
+    async def get_explore_bundle(self) -> Optional[Document]:
+        """Every catalog role and industry as one deduplicated Document (see ``app.bundle``).
+
+        Sources are decoded from their bytes rather than through
+        ``Document.data``, so cached category documents keep only their
+        model, not a decoded dict as well.
+        """
+        def build(categories: dict[str, list[Document]], missing: list[str]) -> Document:
+            bundle = build_bundle({t: [_json_loads(document.raw) for document in documents] for t, documents in categories.items()}, missing)
+            document = Document(_dump(bundle))
+            document.precompress()
+            return document
+        
+        return await self._derived("bundle", build)
+    
+    async def get_search_index(self) -> Optional[SearchIndex]:
+        """BM25 index over every catalog category's use cases (see ``app.search``)."""
+        return await self._derived("search", lambda categories, _: SearchIndex(_models(categories)))
+    
+    async def get_facet_index(self) -> Optional[FacetIndex]:
+        """Facet bitsets over every catalog category's use cases (see ``app.facets``)."""
+        return await self._derived("facets", lambda categories, _: FacetIndex(_models(categories)))
+    
+    async def get_related_graph(self) -> Optional["RelatedGraph"]:
+        """Top-k similar use cases of every catalog use case (see ``app.related``).
+
+        Updates the previous graph when it can, so a change to one
+        category only re-vectorizes that category. ``app.related`` needs
+        NumPy and is imported here, so scripts that only read documents
+        (e.g. the static API export) do not.
+        """
+        from .related import RelatedGraph
+        
+        previous = self._derived_values.get("related")
+        
+        def build(categories: dict[str, list[Document]], _) -> RelatedGraph:
+            sources = [(document.etag, document.model) for documents in categories.values() for document in documents]
+            return previous[1].updated(sources) if previous is not None else RelatedGraph(sources)
+        
+        return await self._derived("related", build)
+    
+    async def get_settings_document(self, setting_type: str) -> Optional[Document]:
+        """Get settings Document from Redis or backup."""
+        key = f"{KEY_PREFIX}:settings:{setting_type}"
+        result = await self.get_document(key)
         if result is None:
             self.backup_loader.log_redis_unavailable()
-            result = self.backup_loader.get_content(content_type)
+            result = await self.backup_loader.document('settings', setting_type)
+            await precompress(result)
         return result
 
 class LazyRedisClient:
@@ -204,25 +1837,108 @@ class LazyRedisClient:
     
     def __init__(self):
         self._client = None
+        self._lock = asyncio.Lock()
+        self._startup_task: Optional[asyncio.Task] = None
+        self.ready = False
+        self.warmup: Optional[dict] = None
     
-    def _get_client(self) -> RedisClient:
+    def start(self):
+        """Connect and warm caches in the background.
+
+        Called from the app lifespan so the first request after a deploy
+        does not pay for connection setup and cold document loads.
+        """
+        if self._startup_task is None:
+            self._startup_task = asyncio.create_task(self._start())
+    
+    async def _start(self):
+        started = time.perf_counter()
+        try:
+            client = await self._get_client()
+            self.warmup = await client.warm_up() if STARTUP_WARMUP else None
+        except Exception as e:
+            logger.error(f"Startup warm-up failed: {e}")
+            self.warmup = {"error": str(e)}
+        self.ready = True
+        logger.info(f"Data layer ready after {(time.perf_counter() - started) * 1000:.0f} ms")
+    
+    @property
+    def content_version(self) -> Optional[int]:
+        """Last ``fas:version`` seen by the client, None if unknown."""
+        return self._client.content_version if self._client is not None else None
+    
+    async def _get_client(self) -> RedisClient:
         if self._client is None:
-            self._client = RedisClient()
+            async with self._lock:
+                if self._client is None:
+                    client = RedisClient()
+                    await client.connect()
+                    self._client = client
         return self._client
     
-    def get_catalog(self):
-        return self._get_client().get_catalog()
+    async def close(self):
+        """Cancel startup and close the underlying client, if one was created."""
+        if self._startup_task is not None:
+            self._startup_task.cancel()
+            try:
+                await self._startup_task
+            except asyncio.CancelledError:
+                pass
+            self._startup_task = None
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.close()
+    
+    def stats(self) -> Optional[dict]:
+        """Return client stats, or None before the first request."""
+        return self._client.stats() if self._client is not None else None
+    
+    async def get_catalog(self):
+        return await (await self._get_client()).get_catalog()
+    
+    async def get_solutions(self):
+        return await (await self._get_client()).get_solutions()
+    
+    async def get_category(self, category_type: str, slug: str):
+        return await (await self._get_client()).get_category(category_type, slug)
+    
+    async def get_settings(self, setting_type: str):
+        return await (await self._get_client()).get_settings(setting_type)
+    
+    async def get_content(self, content_type: str):
+        return await (await self._get_client()).get_content(content_type)
+    
+    async def get_catalog_document(self):
+        return await (await self._get_client()).get_catalog_document()
+    
+    async def get_solutions_document(self):
+        return await (await self._get_client()).get_solutions_document()
+    
+    async def get_category_document(self, category_type: str, slug: str):
+        return await (await self._get_client()).get_category_document(category_type, slug)
+    
+    async def get_category_documents(self, category_type: str, slugs: list[str]):
+        return await (await self._get_client()).get_category_documents(category_type, slugs)
+    
+    async def get_category_projection(self, category_type: str, slug: str, fields: tuple[str, ...]):
+        return await (await self._get_client()).get_category_projection(category_type, slug, fields)
+    
+    async def get_settings_document(self, setting_type: str):
+        return await (await self._get_client()).get_settings_document(setting_type)
+    
+    async def changes_since(self, version: int):
+        return await (await self._get_client()).changes_since(version)
     
-    def get_solutions(self):
-        return self._get_client().get_solutions()
+    async def get_explore_bundle(self):
+        return await (await self._get_client()).get_explore_bundle()
     
-    def get_category(self, category_type: str, slug: str):
-        return self._get_client().get_category(category_type, slug)
+    async def get_search_index(self):
+        return await (await self._get_client()).get_search_index()
     
-    def get_settings(self, setting_type: str):
-        return self._get_client().get_settings(setting_type)
+    async def get_facet_index(self):
+        return await (await self._get_client()).get_facet_index()
     
-    def get_content(self, content_type: str):
-        return self._get_client().get_content(content_type)
+    async def get_related_graph(self):
+        return await (await self._get_client()).get_related_graph()
 
 redis_client = LazyRedisClient()
@@ -0,0 +1,191 @@
+"""Related use cases from hashed TF-IDF vectors.
+
+Every use case of every catalog category is a row vector: the words of its
+name (counted ``NAME_WEIGHT`` times) and description are hashed into
+``DIMENSIONS`` buckets, term counts are damped with ``log1p`` and weighted
+by inverse document frequency, and rows are L2-normalized so a dot product
+is a cosine similarity. The graph keeps the ``NEIGHBORS`` most similar
+other use cases of each row, across roles and industries alike.
+
+Building the graph compares every pair of use cases, block by block. When
+a single category document changes, ``RelatedGraph.updated`` only
+re-vectorizes that category's use cases: rows that listed one of its old
+use cases are recomputed, and every other row merges the new use cases
+into the neighbours it already has. The IDF weights stay those of the last
+full build until the set of catalog categories changes or several
+categories change at once, so an incremental update gives the neighbour
+scores a full build with those weights would (use cases tied on the k-th
+score may be picked differently).
+"""
+
+import zlib
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .models import Category
+from .search import Hit, tokenize
+
+DIMENSIONS = 1 << 10
+NEIGHBORS = 8
+NAME_WEIGHT = 2
+# Rows compared against the whole matrix at once; bounds memory to BLOCK_ROWS x use cases
+BLOCK_ROWS = 512
+
+Source = tuple[str, Category]
+
+
+def _counts(categories: Iterable[Category]) -> np.ndarray:
+    rows, buckets, weights = [], [], []
+    row = 0
+    for category in categories:
+        for use_case in category.use_cases:
+            for text, weight in ((use_case.name, NAME_WEIGHT), (use_case.description, 1)):
+                for token in tokenize(text):
+                    rows.append(row)
+                    buckets.append(zlib.crc32(token.encode()) % DIMENSIONS)
+                    weights.append(weight)
+            row += 1
+    counts = np.zeros((row, DIMENSIONS), dtype=np.float32)
+    np.add.at(counts, (np.array(rows, dtype=np.intp), np.array(buckets, dtype=np.intp)), np.array(weights, dtype=np.float32))
+    return counts
+
+
+def _idf(counts: np.ndarray) -> np.ndarray:
+    frequency = np.count_nonzero(counts, axis=0)
+    return (np.log((1 + len(counts)) / (1 + frequency)) + 1).astype(np.float32)
+
+
+def _vectors(counts: np.ndarray, idf: np.ndarray) -> np.ndarray:
+    weighted = np.log1p(counts) * idf
+    norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+    return np.divide(weighted, norms, out=np.zeros_like(weighted), where=norms > 0)
+
+
+def _select(scores: np.ndarray, candidates: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """The ``k`` best positive ``scores`` per row with their ``candidates``, best first.
+
+    Rows with fewer than ``k`` positive scores are padded with index -1 and
+    score 0. Equal scores are listed lower index first; which of several
+    candidates tied on the k-th score make the cut is unspecified.
+    """
+    if scores.shape[1] > k:
+        chosen = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(scores, chosen, axis=1)
+        candidates = np.take_along_axis(candidates, chosen, axis=1)
+    order = np.lexsort((candidates, -scores), axis=1)
+    scores = np.take_along_axis(scores, order, axis=1)
+    candidates = np.take_along_axis(candidates, order, axis=1)
+    neighbors = np.full((len(scores), k), -1, dtype=np.int32)
+    values = np.zeros((len(scores), k), dtype=np.float32)
+    width = scores.shape[1]
+    positive = scores > 0
+    neighbors[:, :width] = np.where(positive, candidates, -1)
+    values[:, :width] = np.where(positive, scores, 0)
+    return neighbors, values
+
+
+def _nearest(vectors: np.ndarray, rows: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Neighbours of ``rows`` among all of ``vectors``, excluding themselves."""
+    neighbors = np.full((len(rows), k), -1, dtype=np.int32)
+    values = np.zeros((len(rows), k), dtype=np.float32)
+    everyone = np.arange(len(vectors), dtype=np.int32)
+    for start in range(0, len(rows), BLOCK_ROWS):
+        block = rows[start:start + BLOCK_ROWS]
+        scores = vectors[block] @ vectors.T
+        scores[np.arange(len(block)), block] = -1
+        candidates = np.broadcast_to(everyone, scores.shape)
+        neighbors[start:start + len(block)], values[start:start + len(block)] = _select(scores, candidates, k)
+    return neighbors, values
+
+
+class RelatedGraph:
+    """Top-k most similar use cases of every use case of ``sources``.
+
+    ``sources`` lists ``(etag, category)`` pairs in catalog order; the
+    ETags tell ``updated`` which categories changed.
+    """
+
+    __slots__ = ("documents", "etags", "vectors", "neighbors", "scores", "_idf", "_offsets", "_positions")
+
+    def __init__(self, sources: list[Source], k: int = NEIGHBORS):
+        counts = _counts(category for _, category in sources)
+        idf = _idf(counts)
+        vectors = _vectors(counts, idf)
+        self._set(sources, idf, vectors, *_nearest(vectors, np.arange(len(vectors)), k))
+
+    def _set(self, sources: list[Source], idf: np.ndarray, vectors: np.ndarray,
+             neighbors: np.ndarray, scores: np.ndarray):
+        self.documents: list[tuple[Category, int]] = [
+            (category, index) for _, category in sources for index in range(len(category.use_cases))
+        ]
+        self.etags = {(category.type, category.slug): etag for etag, category in sources}
+        self.vectors = vectors
+        self.neighbors = neighbors
+        self.scores = scores
+        self._idf = idf
+        self._offsets = np.cumsum([0] + [len(category.use_cases) for _, category in sources])
+        self._positions = {category.use_case_id(index): position for position, (category, index) in enumerate(self.documents)}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def position(self, use_case_id: str) -> Optional[int]:
+        """Row of the use case with id ``use_case_id`` (see ``Category.use_case_id``), None if unknown."""
+        return self._positions.get(use_case_id)
+
+    def related(self, position: int, limit: int = NEIGHBORS) -> list[Hit]:
+        """The ``limit`` use cases most similar to the one at ``position``, most similar first."""
+        return [
+            Hit(*self.documents[neighbor], float(score))
+            for neighbor, score in zip(self.neighbors[position, :limit], self.scores[position, :limit])
+            if neighbor >= 0
+        ]
+
+    def updated(self, sources: list[Source]) -> "RelatedGraph":
+        """The graph for ``sources``, updated in place of a rebuild when only one category changed."""
+        if list(self.etags) != [(category.type, category.slug) for _, category in sources]:
+            return RelatedGraph(sources, self.neighbors.shape[1])
+        changed = [i for i, (etag, category) in enumerate(sources) if self.etags[category.type, category.slug] != etag]
+        if not changed:
+            return self
+        if len(changed) > 1:
+            return RelatedGraph(sources, self.neighbors.shape[1])
+
+        source = changed[0]
+        start, end = self._offsets[source], self._offsets[source + 1]
+        added = _vectors(_counts([sources[source][1]]), self._idf)
+        shift = len(added) - (end - start)
+        vectors = np.concatenate([self.vectors[:start], added, self.vectors[end:]])
+        k = self.neighbors.shape[1]
+
+        # Old position -> new position, -1 for the changed category's old rows
+        # (and, as the last element, for the -1 padding of neighbour lists)
+        moved = np.arange(len(self.vectors) + 1, dtype=np.int32)
+        moved[end:] += shift
+        moved[start:end] = -1
+        moved[-1] = -1
+        kept = np.concatenate([np.arange(start), np.arange(end, len(self.vectors))]).astype(np.intp)
+        old_neighbors = self.neighbors[kept]
+        stale = ((old_neighbors >= start) & (old_neighbors < end)).any(axis=1)
+
+        neighbors = np.empty((len(vectors), k), dtype=np.int32)
+        scores = np.empty((len(vectors), k), dtype=np.float32)
+        kept_positions = moved[kept]
+
+        # Rows that lost a neighbour may have had more candidates than they kept
+        recompute = np.concatenate([np.arange(start, start + len(added)), kept_positions[stale]]).astype(np.intp)
+        neighbors[recompute], scores[recompute] = _nearest(vectors, recompute, k)
+
+        merge = kept_positions[~stale]
+        if len(merge):
+            fresh = vectors[merge] @ added.T
+            candidates = np.hstack([
+                moved[old_neighbors[~stale]],
+                np.broadcast_to(np.arange(start, start + len(added), dtype=np.int32), fresh.shape),
+            ])
+            neighbors[merge], scores[merge] = _select(np.hstack([self.scores[kept][~stale], fresh]), candidates, k)
+
+        graph = RelatedGraph.__new__(RelatedGraph)
+        graph._set(sources, self._idf, vectors, neighbors, scores)
+        return graph
@@ -0,0 +1,146 @@
+"""In-memory BM25 search over role and industry use cases.
+
+Every use case of every category is one search document. Its text is the
+use-case name and description, the names of its solutions and the
+customer names and solution plays of its evidence. Fields are weighted
+by counting each of their terms ``FIELD_WEIGHTS`` times, so a match in a
+use-case name outranks the same word in a description.
+
+BM25 scores depend only on the index, so each posting stores its final
+score contribution (impact) at build time and a query just adds impacts
+up. The last query term is matched as a prefix unless the query ends
+with a space, which is what autocompletion while typing needs.
+"""
+
+import bisect
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Iterable
+
+from .models import Category, UseCase
+
+K1 = 1.2
+B = 0.75
+FIELD_WEIGHTS = {"name": 3, "solutions": 2, "customers": 2, "description": 1, "solution_plays": 1}
+# Terms a query prefix may expand to, most frequent first
+MAX_PREFIX_TERMS = 64
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word tokens of ``text``."""
+    return TOKEN_PATTERN.findall(text.casefold())
+
+
+def _fields(use_case: UseCase) -> dict[str, Iterable[str]]:
+    return {
+        "name": (use_case.name,),
+        "description": (use_case.description,),
+        "solutions": (solution.name for solution in use_case.solutions),
+        "customers": (evidence.name for evidence in use_case.customer_evidence),
+        "solution_plays": (evidence.solution_play for evidence in use_case.customer_evidence if evidence.solution_play),
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class Hit:
+    """A matching use case: its category, position in ``useCases`` and score."""
+    category: Category
+    index: int
+    score: float
+
+    @property
+    def use_case(self) -> UseCase:
+        return self.category.use_cases[self.index]
+
+    def to_json(self) -> dict:
+        return {**self.category.reference(self.index), "score": round(self.score, 4)}
+
+
+class SearchIndex:
+    """Immutable inverted index over the use cases of ``categories``."""
+
+    __slots__ = ("documents", "_postings", "_terms", "_frequency")
+
+    def __init__(self, categories: Iterable[Category]):
+        self.documents: list[tuple[Category, int]] = []
+        counts: list[Counter] = []
+        for category in categories:
+            for index, use_case in enumerate(category.use_cases):
+                terms = Counter()
+                for field, texts in _fields(use_case).items():
+                    for text in texts:
+                        for token in tokenize(text):
+                            terms[token] += FIELD_WEIGHTS[field]
+                self.documents.append((category, index))
+                counts.append(terms)
+
+        lengths = [sum(terms.values()) for terms in counts]
+        average = sum(lengths) / len(lengths) if lengths else 0.0
+        postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for document, terms in enumerate(counts):
+            for term, frequency in terms.items():
+                postings[term].append((document, frequency))
+
+        total = len(self.documents)
+        self._postings: dict[str, tuple[tuple[int, ...], tuple[float, ...]]] = {}
+        for term, entries in postings.items():
+            idf = math.log(1 + (total - len(entries) + 0.5) / (len(entries) + 0.5))
+            impacts = tuple(
+                idf * frequency * (K1 + 1) / (frequency + K1 * (1 - B + B * lengths[document] / average))
+                for document, frequency in entries
+            )
+            self._postings[term] = (tuple(document for document, _ in entries), impacts)
+        self._terms = sorted(self._postings)
+        self._frequency = {term: len(documents) for term, (documents, _) in self._postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def complete(self, prefix: str, limit: int = MAX_PREFIX_TERMS) -> list[str]:
+        """Indexed terms starting with ``prefix``, most frequent first."""
+        start = bisect.bisect_left(self._terms, prefix)
+        end = bisect.bisect_left(self._terms, prefix + "\U0010ffff", lo=start)
+        matches = self._terms[start:end]
+        if len(matches) > limit:
+            matches = heapq.nsmallest(limit, matches, key=lambda term: (-self._frequency[term], term))
+        else:
+            matches.sort(key=lambda term: (-self._frequency[term], term))
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> list[Hit]:
+        """The ``limit`` best use cases for ``query``, best first."""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        prefix = None if query[-1:].isspace() else tokens.pop()
+
+        # Dense accumulators stay fast when common terms match most use cases
+        scores = [0.0] * len(self.documents)
+        matched: set[int] = set()
+        for token in dict.fromkeys(tokens):
+            posting = self._postings.get(token)
+            if posting is not None:
+                matched.update(posting[0])
+                for document, impact in zip(*posting):
+                    scores[document] += impact
+        if prefix is not None:
+            # A document matching several expansions counts its best one, as a single term would
+            best = [0.0] * len(self.documents)
+            expanded: set[int] = set()
+            for term in self.complete(prefix):
+                documents, impacts = self._postings[term]
+                expanded.update(documents)
+                for document, impact in zip(documents, impacts):
+                    if impact > best[document]:
+                        best[document] = impact
+            for document in expanded:
+                scores[document] += best[document]
+            matched |= expanded
+
+        top = heapq.nlargest(limit, matched, key=scores.__getitem__)
+        top.sort(key=lambda document: (-scores[document], document))
+        return [Hit(*self.documents[document], scores[document]) for document in top]
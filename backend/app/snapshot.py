@@ -0,0 +1,158 @@
+"""Single-file indexed snapshot of the backup data.
+
+Layout::
+
+    b"FASSNAP1"                      magic, 8 bytes
+    <uint64 little-endian>           length of the index
+    {"documents": {key: [offset, length], ...}}   index, compact JSON
+    document bytes ...               compact JSON blobs, back to back
+
+Documents are encoded with ``encode_document``, byte for byte what
+``JSON.GET`` returns for them, so a document has the same ETag whichever
+source it is served from.
+
+Offsets are relative to the first byte after the index.
+
+Keys are Redis keys without the ``fas:`` prefix (``catalog``,
+``role:legal``, ``settings:inspire``, ...). The file is memory-mapped, so
+reading one document is an index lookup and a slice; nothing else in the
+file is touched or parsed.
+"""
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, Optional
+
+MAGIC = b"FASSNAP1"
+_LENGTH = struct.Struct("<Q")
+HEADER_SIZE = len(MAGIC) + _LENGTH.size
+
+# Backup JSON file -> how its members map to snapshot keys
+_FILE_LAYOUT = {
+    "catalog": (),
+    "solutions": (),
+    "settings": ("settings",),
+    "content": ("content",),
+    "categories": (None,),
+}
+
+
+def encode_document(value) -> bytes:
+    """Serialize a document the way RedisJSON returns it: compact, non-ASCII as UTF-8."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def write_atomic(path: Path, chunks: Iterable[bytes]):
+    """Write ``chunks`` to ``path`` through a temp file, fsync and rename.
+
+    Readers (including the backend's hot reload) see either the old file or
+    the complete new one, never a truncated write.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    # Persist the rename itself
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def write_snapshot(path: Path, documents: dict[str, bytes]):
+    """Write ``documents`` (key -> serialized JSON) to ``path`` atomically."""
+    index, offset = {}, 0
+    for key, raw in documents.items():
+        index[key] = [offset, len(raw)]
+        offset += len(raw)
+    index_bytes = json.dumps({"documents": index}, separators=(",", ":")).encode()
+    write_atomic(path, [MAGIC, _LENGTH.pack(len(index_bytes)), index_bytes, *documents.values()])
+
+
+def documents_from_backup_dir(backup_dir: Path) -> dict[str, bytes]:
+    """Collect snapshot documents from the backup JSON files in ``backup_dir``."""
+    documents = {}
+    for name, layout in _FILE_LAYOUT.items():
+        path = backup_dir / f"{name}.json"
+        if not path.exists():
+            continue
+        with open(path) as f:
+            data = json.load(f)
+        for key, value in _flatten(name, layout, data):
+            documents[key] = encode_document(value)
+    return documents
+
+
+def _flatten(name: str, layout: tuple, data) -> Iterable[tuple[str, object]]:
+    if not layout:
+        yield name, data
+    elif layout == (None,):
+        for category_type, members in data.items():
+            for slug, value in members.items():
+                yield f"{category_type}:{slug}", value
+    else:
+        for member, value in data.items():
+            yield f"{layout[0]}:{member}", value
+
+
+class Snapshot:
+    """Read-only, memory-mapped view of a snapshot file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.index = self._read_index()
+        except ValueError:
+            self._mmap.close()
+            raise
+
+    def _read_index(self) -> dict[str, tuple[int, int]]:
+        size = len(self._mmap)
+        if size < HEADER_SIZE or self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path} is not a snapshot file")
+        (index_length,) = _LENGTH.unpack_from(self._mmap, len(MAGIC))
+        if HEADER_SIZE + index_length > size:
+            raise ValueError(f"{self.path} is truncated")
+        try:
+            index = json.loads(self._mmap[HEADER_SIZE:HEADER_SIZE + index_length])["documents"]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"{self.path} has a malformed index") from e
+        if not isinstance(index, dict):
+            raise ValueError(f"{self.path} has a malformed index")
+        base = HEADER_SIZE + index_length
+        entries = {}
+        for key, entry in index.items():
+            if not (isinstance(entry, list) and len(entry) == 2 and all(type(n) is int for n in entry)):
+                raise ValueError(f"{self.path} entry {key} is malformed")
+            offset, length = entry
+            if offset < 0 or length < 0 or base + offset + length > size:
+                raise ValueError(f"{self.path} entry {key} is out of bounds")
+            entries[key] = (base + offset, length)
+        return entries
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the serialized JSON stored under ``key``, or None."""
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        offset, length = entry
+        return self._mmap[offset:offset + length]
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
@@ -0,0 +1,70 @@
+"""Measure memory held by parsed content as dicts versus the typed model.
+
+Parses every catalog and category document in ``data/`` twice and reports
+the bytes allocated (``tracemalloc``) while each representation is alive:
+
+- dicts: ``json.loads`` of each document, as the data layer kept them
+  before validation existed
+- model: ``app.models.parse_document`` of each document, with interned
+  strings and shared Solution/Link/CustomerEvidence instances
+
+Parse time per full load is reported alongside.
+
+Usage:
+    python backend/scripts/benchmark_content_model.py [--copies 1]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.models import parse_document  # noqa: E402
+from app.snapshot import documents_from_backup_dir  # noqa: E402
+
+
+def measure(load) -> tuple[int, float]:
+    """Bytes still allocated after ``load()`` while its result is alive, and its duration."""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = load()
+    duration = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size, duration
+
+
+def main(copies: int):
+    documents = {
+        key: raw for key, raw in documents_from_backup_dir(BACKEND_DIR / "data").items()
+        if key == "catalog" or key.startswith(("role:", "industry:"))
+    }
+    # Several copies stand in for as many distinct document versions held at once
+    sources = [(key, raw) for _ in range(copies) for key, raw in documents.items()]
+    total = sum(len(raw) for _, raw in sources)
+
+    rows = [
+        ("dicts (json.loads)", lambda: [json.loads(raw) for _, raw in sources]),
+        ("model (parse_document)", lambda: [parse_document(key, json.loads(raw)) for key, raw in sources]),
+    ]
+    print(f"{len(sources)} documents, {total} bytes of JSON\n")
+    baseline = None
+    for name, load in rows:
+        size, duration = measure(load)
+        baseline = baseline or size
+        print(f"{name:<24} {size / 1024:>9.1f} KiB  {size / baseline:>5.0%}  {duration * 1000:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=1)
+    args = parser.parse_args()
+    main(args.copies)
@@ -0,0 +1,105 @@
+"""Benchmark event loop latency while Redis is slow.
+
+Runs a batch of concurrent catalog reads against a local RESP stand-in that
+delays every reply, once through a blocking ``redis.Redis`` client (the
+previous implementation) and once through the async ``RedisClient``. A
+ticker coroutine measures how late the event loop wakes it up, which is the
+delay every open WebSocket would see.
+
+Usage:
+    python backend/scripts/benchmark_event_loop_latency.py [--requests 50] [--delay 0.05]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import redis
+
+from slow_redis_stub import SlowRedisStub
+
+BACKEND_DIR = Path(__file__).parent.parent
+CATALOG_KEY = "fas:catalog"
+VERSION_KEY = "fas:version"
+
+
+async def measure_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> list:
+    """Record how late each ``interval`` sleep wakes up, in milliseconds."""
+    lags = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - start - interval) * 1000)
+    return lags
+
+
+async def run_scenario(name: str, read, requests: int) -> dict:
+    """Fire ``requests`` concurrent reads while sampling loop lag."""
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_loop_lag(stop))
+    await asyncio.sleep(0.02)
+    start = time.perf_counter()
+    await asyncio.gather(*(read() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    lags = await ticker
+    return {
+        "scenario": name,
+        "wall_s": round(elapsed, 3),
+        "ticks": len(lags),
+        "loop_lag_mean_ms": round(statistics.mean(lags), 2),
+        "loop_lag_max_ms": round(max(lags), 2),
+    }
+
+
+async def main(requests: int, delay: float):
+    with open(BACKEND_DIR / "data" / "catalog.json") as f:
+        catalog = json.load(f)
+
+    with SlowRedisStub({CATALOG_KEY: catalog}, delay=delay, strings={VERSION_KEY: 1}) as stub:
+        os.environ.update({
+            "REDIS_HOST": stub.host,
+            "REDIS_PORT": str(stub.port),
+            "REDIS_PASSWORD": "benchmark",
+            "REDIS_SSL": "false",
+            "BACKUP_ONLY": "false",
+        })
+        sys.path.insert(0, str(BACKEND_DIR))
+        from app.redis_client import RedisClient
+
+        blocking = redis.Redis(host=stub.host, port=stub.port, password="benchmark",
+                               username="default", socket_timeout=2)
+
+        async def blocking_read():
+            result = blocking.execute_command('JSON.GET', CATALOG_KEY, '$')
+            return json.loads(result)[0]
+
+        client = RedisClient()
+        await client.connect()
+
+        results = [
+            await run_scenario("blocking redis.Redis", blocking_read, requests),
+            await run_scenario("async RedisClient", client.get_catalog, requests),
+        ]
+        blocking.close()
+        await client.close()
+
+    print(f"{requests} concurrent reads, Redis reply delay {delay * 1000:.0f} ms\n")
+    for row in results:
+        print(f"{row['scenario']:<22} wall {row['wall_s']:>7.3f}s  "
+              f"ticks {row['ticks']:>5}  "
+              f"loop lag mean {row['loop_lag_mean_ms']:>8.2f} ms  "
+              f"max {row['loop_lag_max_ms']:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--delay", type=float, default=0.05)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.delay))
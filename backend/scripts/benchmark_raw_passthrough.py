@@ -0,0 +1,74 @@
+"""Benchmark decode/re-encode versus raw-bytes passthrough for content routes.
+
+Compares the per-request work for the largest category document:
+
+- before: ``json.loads`` of the ``JSON.GET $`` reply (or a dict from the
+  parsed backup file) followed by FastAPI's ``jsonable_encoder`` and
+  ``JSONResponse`` rendering
+- after: slicing the ``$`` wrapper (or the backup file bytes) straight into
+  a ``Response``
+
+Usage:
+    python backend/scripts/benchmark_raw_passthrough.py [--iterations 2000]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.redis_client import BackupLoader, _unwrap_root  # noqa: E402
+
+
+def main(iterations: int):
+    with open(BACKEND_DIR / "data" / "categories.json") as f:
+        categories = json.load(f)
+    category_type, slug, document = max(
+        ((t, s, doc) for t, docs in categories.items() for s, doc in docs.items()),
+        key=lambda item: len(json.dumps(item[2]))
+    )
+    redis_reply = json.dumps([document], separators=(",", ":")).encode()
+
+    loader = BackupLoader()
+    loader.get_category_document(category_type, slug)
+
+    def redis_before():
+        data = json.loads(redis_reply)[0]
+        return JSONResponse(content=jsonable_encoder(data)).body
+
+    def redis_after():
+        return Response(content=_unwrap_root(redis_reply), media_type="application/json").body
+
+    def backup_before():
+        data = categories[category_type][slug]
+        return JSONResponse(content=jsonable_encoder(data)).body
+
+    def backup_after():
+        document = loader.get_category_document(category_type, slug)
+        return Response(content=document.raw, media_type="application/json").body
+
+    print(f"Document {category_type}:{slug}, {len(redis_reply)} bytes, {iterations} iterations\n")
+    rows = [
+        ("redis  decode + re-encode", redis_before),
+        ("redis  raw passthrough", redis_after),
+        ("backup dict + encode", backup_before),
+        ("backup raw passthrough", backup_after),
+    ]
+    for name, func in rows:
+        seconds = min(timeit.repeat(func, number=iterations, repeat=3))
+        print(f"{name:<28} {seconds / iterations * 1e6:>9.1f} µs/request")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,56 @@
+"""Benchmark building and incrementally updating the related-use-cases graph.
+
+Builds ``app.related.RelatedGraph`` from the categories in ``data/`` and
+from ``--scale`` copies of them (see ``benchmark_search.categories``), then
+times ``RelatedGraph.updated`` after one category gains a use case, against
+building the whole graph again.
+
+Usage:
+    python backend/scripts/benchmark_related.py [--scale 100] [--iterations 5]
+"""
+
+import argparse
+import dataclasses
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.related import RelatedGraph  # noqa: E402
+from benchmark_search import categories  # noqa: E402
+
+
+def _median_ms(run, iterations: int) -> float:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def main(scale: int, iterations: int):
+    for size in (1, scale):
+        sources = [(f"etag-{i}", category) for i, category in enumerate(categories(size))]
+        graph = RelatedGraph(sources)
+        changed = list(sources)
+        middle = len(sources) // 2
+        category = sources[middle][1]
+        changed[middle] = ("changed", dataclasses.replace(category, use_cases=category.use_cases + category.use_cases[:1]))
+
+        full_ms = _median_ms(lambda: RelatedGraph(changed), iterations)
+        update_ms = _median_ms(lambda: graph.updated(changed), iterations)
+        print(f"\n{size}x: {len(sources)} categories, {len(graph)} use cases")
+        print(f"  full build          median {full_ms:>8.1f} ms")
+        print(f"  one category update median {update_ms:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    main(args.scale, args.iterations)
@@ -0,0 +1,73 @@
+"""Benchmark building and querying the use-case search index.
+
+Builds ``app.search.SearchIndex`` from the categories in ``data/`` and from
+``--scale`` copies of them (each copy under new slugs, with a copy number
+appended to every use-case description so the vocabulary grows too), then
+reports build time and per-query latency for full-word, multi-word and
+prefix queries.
+
+Usage:
+    python backend/scripts/benchmark_search.py [--scale 100] [--iterations 200]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.models import Category  # noqa: E402
+from app.search import SearchIndex  # noqa: E402
+
+QUERIES = ["contract", "fraud", "copilot studio", "patient engagement", "contr", "customer serv", "azure ai f"]
+
+
+def categories(scale: int) -> list[Category]:
+    with open(BACKEND_DIR / "data" / "categories.json") as f:
+        documents = json.load(f)
+    result = []
+    for copy in range(scale):
+        for category_type, members in documents.items():
+            for slug, document in members.items():
+                if copy:
+                    slug = f"{slug}-{copy}"
+                    document = {
+                        **document,
+                        "slug": slug,
+                        "useCases": [
+                            {**use_case, "description": f"{use_case.get('description', '')} variant{copy}"}
+                            for use_case in document.get("useCases", [])
+                        ],
+                    }
+                result.append(Category.parse(document, category_type, slug))
+    return result
+
+
+def main(scale: int, iterations: int):
+    for size in (1, scale):
+        models = categories(size)
+        started = time.perf_counter()
+        index = SearchIndex(models)
+        build_ms = (time.perf_counter() - started) * 1000
+        print(f"\n{size}x: {len(models)} categories, {len(index)} use cases, built in {build_ms:.1f} ms")
+        for query in QUERIES:
+            timings = []
+            for _ in range(iterations):
+                started = time.perf_counter()
+                index.search(query)
+                timings.append(time.perf_counter() - started)
+            timings.sort()
+            print(f"  {query!r:<22} median {statistics.median(timings) * 1e6:>8.1f} µs"
+                  f"  p99 {timings[int(len(timings) * 0.99) - 1] * 1e6:>8.1f} µs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    main(args.scale, args.iterations)
@@ -1,141 +1,415 @@
 """Export Redis data to local backup JSON files.
 
 This script reads all data from Redis and writes it to backup JSON files
-in backend/data/. Run this after making changes to Redis data to keep
-the backup files in sync.
+in backend/data/, plus an indexed snapshot (backup.snapshot) that the
+backend reads one document at a time. Run this after making changes to
+Redis data to keep the backup files in sync.
+
+Exports are incremental. data/manifest.json records, per Redis key, a hash
+of its Redis value, its ``fas:versions`` entry and a hash of the copy in
+the backup files. A re-export reads only keys whose version moved (or,
+for keys without a version, whose hash computed inside Redis differs),
+that are new, or whose backup copy was edited. Files whose content did
+not change are left untouched.
+
+Keys are listed with SCAN and read with pipelined JSON.MGET batches, and
+every file is replaced atomically (temp file, fsync, rename) only after
+all documents have been read.
 
 Usage:
     python backend/scripts/export_redis_to_backup.py
+    python backend/scripts/export_redis_to_backup.py --check       # report drift, write nothing
+    python backend/scripts/export_redis_to_backup.py --full        # re-read every document
+    python backend/scripts/export_redis_to_backup.py --from-json   # rebuild snapshot only
 
 Environment variables required:
     REDIS_HOST: Redis server hostname
     REDIS_PORT: Redis server port (default: 6379)
     REDIS_PASSWORD: Redis password
+    REDIS_SSL: Use TLS (default: true)
+    EXPORT_BATCH_SIZE: Keys per JSON.MGET (default: 200)
+    EXPORT_SCAN_COUNT: SCAN COUNT hint (default: 1000)
 """
 
+import argparse
+import copy
+import hashlib
 import redis
 import json
 import os
+import sys
+import time
 from pathlib import Path
+from typing import Any, Optional
 import logging
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.snapshot import documents_from_backup_dir, write_atomic, write_snapshot  # noqa: E402
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 REDIS_HOST = os.getenv("REDIS_HOST")
 REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+REDIS_SSL = os.getenv("REDIS_SSL", "true").lower() == "true"
+EXPORT_SCAN_COUNT = int(os.getenv("EXPORT_SCAN_COUNT", "1000"))
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "200"))
 KEY_PREFIX = "fas"
+VERSION_KEY = f"{KEY_PREFIX}:version"
+VERSIONS_KEY = f"{KEY_PREFIX}:versions"
 BACKUP_DIR = Path(__file__).parent.parent / "data"
+SNAPSHOT_PATH = BACKUP_DIR / os.getenv("BACKUP_SNAPSHOT", "backup.snapshot")
+MANIFEST_PATH = BACKUP_DIR / "manifest.json"
+BACKUP_FILES = ("catalog", "solutions", "settings", "content", "categories")
 
+# SHA-1 of the JSON.GET reply, computed inside Redis so unchanged documents never cross the network
+HASH_SCRIPT = "return redis.sha1hex(redis.call('JSON.GET', KEYS[1], '$') or '')"
 
-def export_redis_to_backup():
-    """Export all Redis data to backup JSON files."""
-    logger.info("🚀 Starting Redis export to backup files...\n")
 
-    if not REDIS_HOST or not REDIS_PASSWORD:
-        logger.error("❌ REDIS_HOST and REDIS_PASSWORD environment variables must be set")
+def write_backup_snapshot():
+    """Rebuild the indexed snapshot from the backup JSON files."""
+    documents = documents_from_backup_dir(BACKUP_DIR)
+    write_snapshot(SNAPSHOT_PATH, documents)
+    logger.info(f"  ✅ Exported: {SNAPSHOT_PATH.name} ({len(documents)} documents)")
+
+
+def is_backed_up(key: str) -> bool:
+    """True for Redis keys the backup files hold."""
+    parts = key.split(":")
+    if parts[0] != KEY_PREFIX or len(parts) < 2:
         return False
+    if parts[1] in ("catalog", "solutions"):
+        return len(parts) == 2
+    return parts[1] in ("settings", "content", "role", "industry") and len(parts) == 3
+
+
+def _location(key: str, document: Any) -> Optional[list[str]]:
+    """Path of a document inside the backup files, e.g. ``["categories", "role", "legal"]``.
+
+    Categories are filed under their ``slug``; one without a slug is not
+    backed up.
+    """
+    parts = key.split(":")
+    if len(parts) == 2:
+        return [parts[1]]
+    if parts[1] in ("settings", "content"):
+        return [parts[1], parts[2]]
+    slug = document.get('slug') if isinstance(document, dict) else None
+    return ["categories", parts[1], slug] if slug else None
+
+
+def _lookup(files: dict, path: list[str]) -> Any:
+    node = files
+    for name in path:
+        if not isinstance(node, dict) or name not in node:
+            return None
+        node = node[name]
+    return node
+
+
+def _store(files: dict, path: list[str], value: Any):
+    node = files
+    for name in path[:-1]:
+        node = node.setdefault(name, {})
+    node[path[-1]] = value
+
+
+def _discard(files: dict, path: list[str]):
+    parent = _lookup(files, path[:-1]) if len(path) > 1 else files
+    if isinstance(parent, dict):
+        parent.pop(path[-1], None)
 
-    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
-    logger.info(f"✅ Backup directory ready: {BACKUP_DIR}\n")
 
+def _document_paths(files: dict) -> list[list[str]]:
+    """Paths of the settings, content and category documents held in ``files``."""
+    paths = []
+    for name in ("settings", "content"):
+        if isinstance(files.get(name), dict):
+            paths += [[name, key] for key in files[name]]
+    categories = files.get("categories")
+    if isinstance(categories, dict):
+        for category_type, members in categories.items():
+            if isinstance(members, dict):
+                paths += [["categories", category_type, slug] for slug in members]
+    return paths
+
+
+def _key(path: list[str]) -> str:
+    """Redis key of the document at ``path``, the inverse of ``_location``."""
+    return ":".join([KEY_PREFIX, *(path[1:] if path[0] == "categories" else path)])
+
+
+def _local_hash(value: Any) -> str:
+    """Hash of a document as held in the backup files."""
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def empty_backup() -> dict:
+    return {"settings": {}, "content": {}, "categories": {"role": {}, "industry": {}}}
+
+
+def load_backup_files() -> dict:
+    """Read the current backup files, grouped by file name."""
+    files = empty_backup()
+    for name in BACKUP_FILES:
+        path = BACKUP_DIR / f"{name}.json"
+        if path.exists():
+            with open(path) as f:
+                files[name] = json.load(f)
+    return files
+
+
+def load_manifest() -> dict:
+    """Read data/manifest.json; a missing or unreadable manifest is empty."""
     try:
-        client = redis.Redis(
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            password=REDIS_PASSWORD,
-            username="default",
-            ssl=True,
-            decode_responses=False
-        )
-        client.ping()
-        logger.info("✅ Connected to Redis\n")
-    except Exception as e:
-        logger.error(f"❌ Failed to connect to Redis: {e}")
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+        if isinstance(manifest.get("documents"), dict):
+            return manifest
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"version": None, "documents": {}}
+
+
+def scan_keys(client, pattern: str) -> list[str]:
+    """List keys matching ``pattern`` with SCAN, which never blocks Redis the way KEYS does."""
+    return sorted(key.decode() for key in client.scan_iter(match=pattern, count=EXPORT_SCAN_COUNT))
+
+
+def fetch_documents(client, keys: list[str], batch_size: int = EXPORT_BATCH_SIZE) -> dict[str, bytes]:
+    """Read ``keys`` with one JSON.MGET per batch, all batches in one pipeline.
+
+    Returns each key's raw ``$`` reply; keys that no longer exist are left out.
+    """
+    batches = [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+    pipe = client.pipeline(transaction=False)
+    for batch in batches:
+        pipe.execute_command('JSON.MGET', *batch, '$')
+    documents = {}
+    for batch, results in zip(batches, pipe.execute()):
+        for key, result in zip(batch, results):
+            if result:
+                documents[key] = result if isinstance(result, bytes) else result.encode()
+    return documents
+
+
+def redis_hashes(client, keys: list[str]) -> list[str]:
+    """SHA-1 of each key's JSON.GET reply, computed by Redis in one pipeline."""
+    if not keys:
+        return []
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.execute_command('EVAL', HASH_SCRIPT, 1, key)
+    return [digest.decode() if isinstance(digest, bytes) else digest for digest in pipe.execute()]
+
+
+def document_versions(client) -> dict[str, int]:
+    """Per-document versions recorded by the content tooling in ``fas:versions``."""
+    versions = client.execute_command('HGETALL', VERSIONS_KEY) or {}
+    pairs = versions.items() if isinstance(versions, dict) else zip(versions[::2], versions[1::2])
+    return {key.decode(): int(version) for key, version in pairs}
+
+
+def plan_export(client, files: dict, manifest: dict, full: bool = False) -> dict:
+    """Find the keys whose Redis value may differ from the backup and read only those.
+
+    A key is read when it is not in the manifest, its backup copy no longer
+    matches the manifest, its ``fas:versions`` entry moved, or it has no
+    version and its Redis hash changed. With ``full`` every key is read.
+    """
+    entries = manifest["documents"]
+    keys = [key for key in scan_keys(client, f"{KEY_PREFIX}:*") if is_backed_up(key)]
+    versions = document_versions(client)
+    reasons, to_hash = {}, []
+    for key in keys:
+        entry = entries.get(key)
+        if entry is None:
+            reasons[key] = "added"
+        elif entry["path"] is not None and _local_hash(_lookup(files, entry["path"])) != entry["local"]:
+            reasons[key] = "edited locally"
+        elif full:
+            reasons[key] = "changed in Redis"
+        elif versions.get(key) is not None and entry.get("version") is not None:
+            if versions[key] != entry["version"]:
+                reasons[key] = "changed in Redis"
+        else:
+            to_hash.append(key)
+    for key, digest in zip(to_hash, redis_hashes(client, to_hash)):
+        if digest != entries[key]["hash"]:
+            reasons[key] = "changed in Redis"
+
+    fetched = fetch_documents(client, list(reasons))
+    logger.info(f"  {len(keys)} keys, {len(to_hash)} hash-checked, {len(fetched)} read")
+    present = set(keys)
+    return {
+        "version": client.get(VERSION_KEY),
+        "versions": versions,
+        "reasons": reasons,
+        "fetched": fetched,
+        "removed": [key for key in entries if key not in present],
+        "full": full,
+    }
+
+
+def apply_plan(files: dict, manifest: dict, plan: dict) -> tuple[dict, dict, list[tuple[str, str]]]:
+    """Fold fetched documents into copies of ``files`` and ``manifest``.
+
+    Returns the new files, the new manifest and ``(key, reason)`` for every
+    document whose backup copy differed from Redis.
+    """
+    files = copy.deepcopy(files)
+    entries = dict(manifest["documents"])
+    drift = []
+    for key in plan["removed"]:
+        entry = entries.pop(key)
+        if entry["path"] is not None and _lookup(files, entry["path"]) is not None:
+            _discard(files, entry["path"])
+            drift.append((key, "removed from Redis"))
+    for key, raw in plan["fetched"].items():
+        document = json.loads(raw)[0]
+        path = _location(key, document)
+        old = entries.pop(key, None)
+        if old is not None and old["path"] not in (None, path):
+            _discard(files, old["path"])
+        if path is not None and _lookup(files, path) != document:
+            drift.append((key, plan["reasons"][key]))
+            _store(files, path, document)
+        # Documents that are not backed up are still recorded, so they are not re-read every run
+        entries[key] = {
+            "path": path,
+            "hash": hashlib.sha1(raw).hexdigest(),
+            "version": plan["versions"].get(key),
+            "local": _local_hash(document) if path is not None else None,
+        }
+    if plan.get("full"):
+        # Every key was read, so documents none of them maps to are not in Redis
+        # (e.g. left behind when the manifest was lost)
+        held = {tuple(entry["path"]) for entry in entries.values() if entry["path"] is not None}
+        for path in _document_paths(files):
+            if tuple(path) not in held:
+                _discard(files, path)
+                drift.append((_key(path), "not in Redis"))
+    version = plan["version"]
+    new_manifest = {
+        "version": int(version) if version is not None else None,
+        "documents": dict(sorted(entries.items())),
+    }
+    return files, new_manifest, sorted(drift)
+
+
+def write_backup_files(files: dict) -> list[str]:
+    """Atomically rewrite the backup files whose content changed; return their names."""
+    written = []
+    for name, data in files.items():
+        path = BACKUP_DIR / f"{name}.json"
+        content = json.dumps(data, indent=2).encode()
+        if path.exists() and path.read_bytes() == content:
+            continue
+        write_atomic(path, [content])
+        written.append(name)
+        logger.info(f"  ✅ Exported: {name}.json")
+    return written
+
+
+def write_manifest(manifest: dict) -> bool:
+    content = json.dumps(manifest, indent=2).encode()
+    if MANIFEST_PATH.exists() and MANIFEST_PATH.read_bytes() == content:
         return False
+    write_atomic(MANIFEST_PATH, [content])
+    return True
+
+
+def connect_redis():
+    client = redis.Redis(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        password=REDIS_PASSWORD,
+        username="default",
+        ssl=REDIS_SSL,
+        decode_responses=False
+    )
+    client.ping()
+    return client
+
+
+def export_redis_to_backup(check: bool = False, full: bool = False, client=None) -> bool:
+    """Export changed Redis documents to the backup files.
+
+    With ``check`` nothing is written; differences between Redis and the
+    backup files are reported and the result is False if there are any.
+    ``full`` re-reads every document instead of only those the manifest
+    marks as possibly changed, and drops documents no Redis key maps to.
+    """
+    logger.info("🔍 Checking backup files against Redis...\n" if check else "🚀 Starting Redis export to backup files...\n")
+
+    owns_client = client is None
+    if owns_client:
+        if not REDIS_HOST or not REDIS_PASSWORD:
+            logger.error("❌ REDIS_HOST and REDIS_PASSWORD environment variables must be set")
+            return False
+        try:
+            client = connect_redis()
+            logger.info("✅ Connected to Redis\n")
+        except Exception as e:
+            logger.error(f"❌ Failed to connect to Redis: {e}")
+            return False
 
     try:
-        logger.info("📋 Exporting catalog...")
-        catalog_result = client.execute_command('JSON.GET', f'{KEY_PREFIX}:catalog', '$')
-        if catalog_result:
-            catalog_data = json.loads(catalog_result)[0]
-            with open(BACKUP_DIR / "catalog.json", 'w') as f:
-                json.dump(catalog_data, f, indent=2)
-            logger.info("  ✅ Exported: catalog.json")
-
-        logger.info("📋 Exporting solutions...")
-        solutions_result = client.execute_command('JSON.GET', f'{KEY_PREFIX}:solutions', '$')
-        if solutions_result:
-            solutions_data = json.loads(solutions_result)[0]
-            with open(BACKUP_DIR / "solutions.json", 'w') as f:
-                json.dump(solutions_data, f, indent=2)
-            logger.info("  ✅ Exported: solutions.json")
-
-        logger.info("📋 Exporting settings...")
-        settings_backup = {}
-        
-        inspire_result = client.execute_command('JSON.GET', f'{KEY_PREFIX}:settings:inspire', '$')
-        if inspire_result:
-            settings_backup['inspire'] = json.loads(inspire_result)[0]
-        
-        avatar_result = client.execute_command('JSON.GET', f'{KEY_PREFIX}:settings:avatar', '$')
-        if avatar_result:
-            settings_backup['avatar'] = json.loads(avatar_result)[0]
-        
-        with open(BACKUP_DIR / "settings.json", 'w') as f:
-            json.dump(settings_backup, f, indent=2)
-        logger.info("  ✅ Exported: settings.json")
-
-        logger.info("📋 Exporting content...")
-        content_backup = {}
-        
-        exec_narr_result = client.execute_command('JSON.GET', f'{KEY_PREFIX}:content:exec_narr', '$')
-        if exec_narr_result:
-            content_backup['exec_narr'] = json.loads(exec_narr_result)[0]
-        
-        with open(BACKUP_DIR / "content.json", 'w') as f:
-            json.dump(content_backup, f, indent=2)
-        logger.info("  ✅ Exported: content.json")
-
-        logger.info("📋 Exporting categories...")
-        categories_backup = {'role': {}, 'industry': {}}
-        
-        role_keys = [key.decode() for key in client.keys(f'{KEY_PREFIX}:role:*')]
-        for key in role_keys:
-            result = client.execute_command('JSON.GET', key, '$')
-            if result:
-                data = json.loads(result)[0]
-                slug = data.get('slug')
-                if slug:
-                    categories_backup['role'][slug] = data
-        
-        industry_keys = [key.decode() for key in client.keys(f'{KEY_PREFIX}:industry:*')]
-        for key in industry_keys:
-            result = client.execute_command('JSON.GET', key, '$')
-            if result:
-                data = json.loads(result)[0]
-                slug = data.get('slug')
-                if slug:
-                    categories_backup['industry'][slug] = data
-        
-        with open(BACKUP_DIR / "categories.json", 'w') as f:
-            json.dump(categories_backup, f, indent=2)
-        logger.info("  ✅ Exported: categories.json")
-        logger.info(f"     - {len(categories_backup['role'])} roles")
-        logger.info(f"     - {len(categories_backup['industry'])} industries")
-
-        logger.info("\n✨ Export complete! All backup files written to " + str(BACKUP_DIR))
+        started = time.perf_counter()
+        files = load_backup_files()
+        manifest = load_manifest()
+
+        logger.info("📋 Comparing with manifest...")
+        plan = plan_export(client, files, manifest, full)
+        new_files, new_manifest, drift = apply_plan(files, manifest, plan)
+        for key, reason in drift:
+            logger.info(f"  ~ {key}: {reason}")
+
+        if check:
+            if drift:
+                logger.info(f"\n⚠️  {len(drift)} documents differ between Redis and {BACKUP_DIR}")
+            else:
+                logger.info("\n✨ Backup files match Redis")
+            return not drift
+
+        # Nothing is written until every changed document has been read
+        BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+        logger.info("📋 Writing backup files...")
+        written = write_backup_files(new_files)
+        if written or not SNAPSHOT_PATH.exists():
+            logger.info("📋 Writing snapshot...")
+            write_backup_snapshot()
+        write_manifest(new_manifest)
+
+        logger.info(f"\n✨ Export complete in {time.perf_counter() - started:.1f}s! "
+                    f"{len(written)} backup files updated in {BACKUP_DIR}")
         return True
 
     except Exception as e:
         logger.error(f"\n❌ Export failed: {e}")
         return False
     finally:
-        client.close()
-        logger.info("👋 Disconnected from Redis")
+        if owns_client:
+            client.close()
+            logger.info("👋 Disconnected from Redis")
 
 
 if __name__ == "__main__":
-    success = export_redis_to_backup()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--from-json", action="store_true",
+                      help="Rebuild the snapshot from the existing JSON files without Redis")
+    mode.add_argument("--check", action="store_true",
+                      help="Report drift between Redis and the backup files without writing")
+    parser.add_argument("--full", action="store_true",
+                        help="Re-read every document instead of trusting the manifest")
+    args = parser.parse_args()
+    if args.from_json:
+        write_backup_snapshot()
+        success = True
+    else:
+        success = export_redis_to_backup(check=args.check, full=args.full)
     exit(0 if success else 1)
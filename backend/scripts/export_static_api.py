@@ -0,0 +1,226 @@
+"""Render the read-only content API to precompressed static files.
+
+/api/catalog, /api/solutions, /api/settings/inspire and every
+/api/category/{type}/{slug} are pure functions of the content documents,
+so nginx can serve them without the backend (see frontend/nginx.conf,
+static API mode). This script writes, under the output directory:
+
+    api/catalog.json, api/catalog.json.gz, api/catalog.json.br, ...
+    static-api.conf    nginx maps picking the file, ETag and encoding per request
+
+Bodies, ETags and compressed variants come from the backend's own
+``Document`` class. Every source encodes documents the way RedisJSON
+returns them (see ``app.snapshot.encode_document``), so each file holds
+exactly the bytes the API sends for the same content, and its ETag
+validates against the backend whether it reads Redis, the snapshot or the
+backup JSON files. Files
+whose bytes did not change are left untouched; files for routes that no
+longer exist are removed.
+
+Usage:
+    python backend/scripts/export_static_api.py --out build/static-api
+    python backend/scripts/export_static_api.py --out build/static-api --from-redis
+
+Environment variables (--from-redis only): as for export_redis_to_backup.py.
+CONTENT_CACHE_CONTROL, COMPRESSION_MIN_BYTES, GZIP_LEVEL and BROTLI_QUALITY
+are read the same way the backend reads them.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Optional
+import logging
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import export_redis_to_backup as export  # noqa: E402
+from app.config import config  # noqa: E402
+from app.redis_client import Document, _unwrap_root  # noqa: E402
+from app.snapshot import documents_from_backup_dir, write_atomic  # noqa: E402
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+API_DIR = "api"
+NGINX_CONF = "static-api.conf"
+EXTENSIONS = {"br": ".br", "gzip": ".gz"}
+SLUG_PATTERN = re.compile(r"^[A-Za-z0-9_-][A-Za-z0-9_.-]*$")
+# Accept-Encoding classes the nginx map sorts requests into, in map order
+ACCEPT_CLASSES = {
+    "br,gzip": r"~*\bbr\b.*\bgzip\b|\bgzip\b.*\bbr\b",
+    "br": r"~*\bbr\b",
+    "gzip": r"~*\bgzip\b",
+}
+
+
+def api_path(key: str) -> Optional[str]:
+    """API path serving the document stored under ``key`` (without the ``fas:`` prefix)."""
+    parts = key.split(":")
+    if parts in (["catalog"], ["solutions"], ["settings", "inspire"]):
+        return "/api/" + "/".join(parts)
+    if len(parts) == 2 and parts[0] in ("role", "industry") and SLUG_PATTERN.match(parts[1]):
+        return f"/api/category/{parts[0]}/{parts[1]}"
+    return None
+
+
+def backup_documents() -> dict[str, bytes]:
+    """Documents from the backup files, as the backend serves them in backup mode."""
+    return documents_from_backup_dir(export.BACKUP_DIR)
+
+
+def redis_documents(client) -> tuple[dict[str, bytes], Optional[int]]:
+    """Documents and ``fas:version`` from Redis, as the backend serves them from Redis."""
+    keys = [key for key in export.scan_keys(client, f"{export.KEY_PREFIX}:*") if api_path(key.split(":", 1)[1])]
+    fetched = export.fetch_documents(client, keys)
+    version = client.get(export.VERSION_KEY)
+    documents = {key.split(":", 1)[1]: _unwrap_root(raw) for key, raw in fetched.items()}
+    return documents, int(version) if version is not None else None
+
+
+def render(documents: dict[str, bytes]) -> dict[str, Document]:
+    """Precompressed documents keyed by API path."""
+    rendered = {}
+    for key, raw in sorted(documents.items()):
+        path = api_path(key)
+        if path is not None:
+            document = Document(raw)
+            document.precompress()
+            rendered[path] = document
+    return rendered
+
+
+def variants(document: Document) -> dict[str, tuple[bytes, str]]:
+    """File suffix -> (body, ETag) for the identity body and every compressed encoding."""
+    files = {".json": (document.raw, document.etag)}
+    for encoding, extension in EXTENSIONS.items():
+        body = document.encoded(encoding)
+        if body is not None:
+            files[".json" + extension] = (body, f'{document.etag[:-1]}-{encoding}"')
+    return files
+
+
+def _quote(value: str) -> str:
+    return '"' + value.replace('"', '\\"') + '"'
+
+
+def nginx_maps(rendered: dict[str, Document], version: Optional[int]) -> str:
+    """nginx ``map`` blocks choosing the file, ETag and Content-Encoding per request.
+
+    Each request is sorted into an Accept-Encoding class and gets the best
+    variant in that class the export has (brotli, then gzip, then
+    identity), the same preference order as the backend.
+    """
+    longest = max(len(f"br,gzip:{path}.json.gz") for path in rendered)
+    lines = [
+        "# Generated by backend/scripts/export_static_api.py. Do not edit.",
+        f"map_hash_bucket_size {max(64, 1 << (longest + 16).bit_length())};",
+        f"map_hash_max_size {max(2048, 8 * len(rendered))};",
+        "",
+        "map $http_accept_encoding $static_api_accept {",
+        '    default "";',
+        *(f"    {_quote(pattern)} {_quote(name)};" for name, pattern in ACCEPT_CLASSES.items()),
+        "}",
+        "",
+        'map "$static_api_accept:$uri" $static_api_file {',
+    ]
+    etags = []
+    for path, document in rendered.items():
+        files = variants(document)
+        for accept in ("", *ACCEPT_CLASSES):
+            suffix = next(
+                (".json" + EXTENSIONS[encoding] for encoding in accept.split(",") if encoding and ".json" + EXTENSIONS[encoding] in files),
+                ".json"
+            )
+            lines.append(f"    {_quote(f'{accept}:{path}')} {_quote(path + suffix)};")
+        etags.extend(f"    {_quote(path + suffix)} {_quote(etag)};" for suffix, (_, etag) in files.items())
+    lines += [
+        "}",
+        "",
+        "map $static_api_file $static_api_etag {",
+        *etags,
+        "}",
+        "",
+        "map $static_api_file $static_api_encoding {",
+        '    default "";',
+        *(f'    "~\\{extension}$" {_quote(encoding)};' for encoding, extension in EXTENSIONS.items()),
+        "}",
+        "",
+        "map $uri $static_api_cache_control {",
+        f"    default {_quote(config.CONTENT_CACHE_CONTROL)};",
+        "}",
+        "",
+        "map $uri $static_api_version {",
+        f"    default {_quote(str(version) if version is not None else '')};",
+        "}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def write_static_api(out_dir: Path, rendered: dict[str, Document], version: Optional[int]) -> tuple[list[str], list[str]]:
+    """Write every variant and the nginx maps, returning (written, removed) file names."""
+    files = {}
+    for path, document in rendered.items():
+        for suffix, (body, _) in variants(document).items():
+            files[out_dir / (path.lstrip("/") + suffix)] = body
+    files[out_dir / NGINX_CONF] = nginx_maps(rendered, version).encode()
+
+    written = []
+    for path, body in files.items():
+        if path.exists() and path.read_bytes() == body:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, [body])
+        written.append(str(path.relative_to(out_dir)))
+
+    removed = []
+    api_dir = out_dir / API_DIR
+    if api_dir.exists():
+        for path in sorted(api_dir.rglob("*")):
+            if path.is_file() and path not in files:
+                path.unlink()
+                removed.append(str(path.relative_to(out_dir)))
+    return written, removed
+
+
+def export_static_api(out_dir: Path, from_redis: bool = False, client=None) -> bool:
+    """Render the read-only routes from the backup files or Redis into ``out_dir``."""
+    version = None
+    if from_redis:
+        owns_client = client is None
+        try:
+            if owns_client:
+                if not export.REDIS_HOST or not export.REDIS_PASSWORD:
+                    logger.error("❌ REDIS_HOST and REDIS_PASSWORD environment variables must be set")
+                    return False
+                client = export.connect_redis()
+            documents, version = redis_documents(client)
+        except Exception as e:
+            logger.error(f"❌ Failed to read documents from Redis: {e}")
+            return False
+        finally:
+            if owns_client and client is not None:
+                client.close()
+    else:
+        documents = backup_documents()
+
+    rendered = render(documents)
+    if not rendered:
+        logger.error("❌ No documents to export")
+        return False
+    written, removed = write_static_api(out_dir, rendered, version)
+    logger.info(f"✨ Rendered {len(rendered)} routes to {out_dir}: "
+                f"{len(written)} files written, {len(removed)} removed")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, required=True, help="Output directory")
+    parser.add_argument("--from-redis", action="store_true",
+                        help="Read documents from Redis instead of the backup files")
+    args = parser.parse_args()
+    exit(0 if export_static_api(args.out, from_redis=args.from_redis) else 1)
@@ -0,0 +1,241 @@
+"""Load the local backup JSON files into Redis.
+
+The reverse of export_redis_to_backup.py: validates backend/data/, diffs it
+against Redis and writes every changed document in one MULTI/EXEC
+transaction, together with a ``fas:version`` bump and the new version for
+each written key in ``fas:versions``, so running backends evict exactly
+those documents. Unchanged documents are not rewritten, and a run with no
+changes leaves Redis and the version untouched.
+
+The transaction WATCHes ``fas:version``, every key it compares and, with
+``--prune``, every key it deletes, so a concurrent write between the diff
+and EXEC makes the load start over.
+
+Usage:
+    python backend/scripts/load_backup_to_redis.py --dry-run   # validate and print the diff
+    python backend/scripts/load_backup_to_redis.py
+    python backend/scripts/load_backup_to_redis.py --prune     # also delete keys missing locally
+
+Environment variables required:
+    REDIS_HOST: Redis server hostname
+    REDIS_PORT: Redis server port (default: 6379)
+    REDIS_PASSWORD: Redis password
+    REDIS_SSL: Use TLS (default: true)
+"""
+
+import argparse
+import difflib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+import logging
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import export_redis_to_backup as export  # noqa: E402
+from app.models import CATEGORY_TYPES, ContentError, parse_document  # noqa: E402
+from app.snapshot import documents_from_backup_dir  # noqa: E402
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = export.KEY_PREFIX
+VERSION_KEY = export.VERSION_KEY
+VERSIONS_KEY = export.VERSIONS_KEY
+DIFF_CONTEXT_LINES = 2
+DIFF_MAX_LINES = 40
+
+
+def read_backup_files(backup_dir: Path) -> tuple[dict, list[str]]:
+    """Parse every backup file, returning the files and any parse errors."""
+    files, errors = {}, []
+    for name in export.BACKUP_FILES:
+        path = backup_dir / f"{name}.json"
+        if not path.exists():
+            errors.append(f"{path.name}: missing")
+            continue
+        try:
+            with open(path) as f:
+                files[name] = json.load(f)
+        except ValueError as e:
+            errors.append(f"{path.name}: invalid JSON ({e})")
+    return files, errors
+
+
+def validate_backup(files: dict) -> list[str]:
+    """Check the structure the backend and frontend rely on; return every problem found.
+
+    Catalog and category documents are checked against ``app.models``, the
+    same validation the backend applies when it reads them, so a load
+    never writes a document the backend would refuse to serve.
+    """
+    errors = []
+    for name, data in files.items():
+        if not isinstance(data, dict):
+            errors.append(f"{name}.json: top level must be an object")
+    if errors:
+        return errors
+
+    categories = files.get("categories", {})
+    for category_type, members in categories.items():
+        if category_type not in CATEGORY_TYPES:
+            errors.append(f"categories.json: unknown category type {category_type!r}")
+            continue
+        for slug, document in members.items():
+            try:
+                parse_document(f"{category_type}:{slug}", document)
+            except ContentError as e:
+                errors.append(f"categories.json {category_type}/{slug}: {e}")
+
+    try:
+        catalog = parse_document("catalog", files.get("catalog", {}))
+    except ContentError as e:
+        errors.append(f"catalog.json: {e}")
+    else:
+        for category_type, entries_key in (("role", "roles"), ("industry", "industries")):
+            for slug in catalog.slugs(category_type):
+                if slug not in categories.get(category_type, {}):
+                    errors.append(f"catalog.json {entries_key}: {slug!r} has no document in categories.json")
+
+    for name in ("settings", "content"):
+        for member, value in files.get(name, {}).items():
+            if not isinstance(value, dict):
+                errors.append(f"{name}.json {member}: must be an object")
+    return errors
+
+
+def redis_documents(backup_dir: Path) -> dict[str, bytes]:
+    """Serialized documents keyed by their Redis key."""
+    return {f"{KEY_PREFIX}:{key}": raw for key, raw in documents_from_backup_dir(backup_dir).items()}
+
+
+def plan_load(client, documents: dict[str, bytes], prune: bool = False) -> dict:
+    """Compare local documents with Redis using pipelined JSON.MGET batches."""
+    current = export.fetch_documents(client, list(documents))
+    plan = {"added": [], "changed": [], "unchanged": [], "removed": [], "current": current}
+    for key, raw in documents.items():
+        if key not in current:
+            plan["added"].append(key)
+        elif json.loads(current[key])[0] != json.loads(raw):
+            plan["changed"].append(key)
+        else:
+            plan["unchanged"].append(key)
+    if prune:
+        remote = [key for key in export.scan_keys(client, f"{KEY_PREFIX}:*") if export.is_backed_up(key)]
+        plan["removed"] = [key for key in remote if key not in documents]
+    return plan
+
+
+def format_diff(plan: dict, documents: dict[str, bytes]) -> list[str]:
+    """Human-readable summary plus a truncated unified diff per changed document."""
+    lines = []
+    for key in plan["added"]:
+        lines.append(f"  + {key}")
+    for key in plan["removed"]:
+        lines.append(f"  - {key}")
+    for key in plan["changed"]:
+        lines.append(f"  ~ {key}")
+        before = json.dumps(json.loads(plan["current"][key])[0], indent=2, sort_keys=True).splitlines()
+        after = json.dumps(json.loads(documents[key]), indent=2, sort_keys=True).splitlines()
+        diff = list(difflib.unified_diff(before, after, "redis", "local", n=DIFF_CONTEXT_LINES, lineterm=""))[2:]
+        lines.extend(f"      {line}" for line in diff[:DIFF_MAX_LINES])
+        if len(diff) > DIFF_MAX_LINES:
+            lines.append(f"      ... {len(diff) - DIFF_MAX_LINES} more lines")
+    return lines
+
+
+def load(client, documents: dict[str, bytes], prune: bool = False) -> tuple[dict, Optional[int]]:
+    """Write changed documents and bump the content version in one transaction.
+
+    Returns the plan that was applied and the new version, or None when
+    nothing changed.
+    """
+    def write(pipe):
+        plan = plan_load(pipe, documents, prune)
+        writes = plan["added"] + plan["changed"]
+        if not writes and not plan["removed"]:
+            return plan, None
+        if plan["removed"]:
+            # Prune candidates come from a SCAN, so they are watched only now
+            pipe.watch(*plan["removed"])
+        version = int(pipe.get(VERSION_KEY) or 0) + 1
+        pipe.multi()
+        for key in writes:
+            pipe.execute_command('JSON.SET', key, '$', documents[key])
+        if plan["removed"]:
+            pipe.delete(*plan["removed"])
+        pipe.set(VERSION_KEY, version)
+        pipe.hset(VERSIONS_KEY, mapping={key: version for key in writes + plan["removed"]})
+        return plan, version
+
+    watched = [VERSION_KEY, *documents]
+    return client.transaction(write, *watched, value_from_callable=True)
+
+
+def load_backup_to_redis(dry_run: bool = False, prune: bool = False, client=None) -> bool:
+    """Validate the backup files and load the changes into Redis."""
+    logger.info("🔍 Diffing backup files against Redis (dry run)...\n" if dry_run else "🚀 Loading backup files into Redis...\n")
+
+    files, errors = read_backup_files(export.BACKUP_DIR)
+    errors += validate_backup(files)
+    if errors:
+        logger.error("❌ Backup files failed validation:")
+        for error in errors:
+            logger.error(f"  - {error}")
+        return False
+    documents = redis_documents(export.BACKUP_DIR)
+    logger.info(f"✅ Validated {len(documents)} documents\n")
+
+    owns_client = client is None
+    if owns_client:
+        if not export.REDIS_HOST or not export.REDIS_PASSWORD:
+            logger.error("❌ REDIS_HOST and REDIS_PASSWORD environment variables must be set")
+            return False
+        try:
+            client = export.connect_redis()
+            logger.info("✅ Connected to Redis\n")
+        except Exception as e:
+            logger.error(f"❌ Failed to connect to Redis: {e}")
+            return False
+
+    try:
+        started = time.perf_counter()
+        if dry_run:
+            plan = plan_load(client, documents, prune)
+            version = None
+        else:
+            plan, version = load(client, documents, prune)
+        for line in format_diff(plan, documents):
+            logger.info(line)
+        summary = (f"{len(plan['added'])} added, {len(plan['changed'])} changed, "
+                   f"{len(plan['removed'])} removed, {len(plan['unchanged'])} unchanged")
+        if dry_run:
+            logger.info(f"\n📝 Dry run: {summary}. Nothing written.")
+        elif version is None:
+            logger.info(f"\n✨ Redis already matches the backup files ({summary})")
+        else:
+            logger.info(f"\n✨ Loaded in {time.perf_counter() - started:.2f}s: {summary}")
+            logger.info(f"🔖 Content version: {version}")
+        return True
+
+    except Exception as e:
+        logger.error(f"\n❌ Load failed: {e}")
+        return False
+    finally:
+        if owns_client:
+            client.close()
+            logger.info("👋 Disconnected from Redis")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Validate and print the diff against Redis without writing")
+    parser.add_argument("--prune", action="store_true",
+                        help="Delete backed-up keys that no longer exist in the backup files")
+    args = parser.parse_args()
+    success = load_backup_to_redis(dry_run=args.dry_run, prune=args.prune)
+    exit(0 if success else 1)
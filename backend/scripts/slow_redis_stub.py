@@ -0,0 +1,99 @@
+"""Minimal RESP server that answers like Redis after a fixed delay.
+
+Used by the benchmark scripts to reproduce a slow Redis without a real
+server. It runs on its own event loop in a background thread so a client
+that blocks the caller's loop cannot also stall the server.
+
+Supported commands: HELLO, PING, JSON.GET (returns the configured
+documents), GET (returns the configured strings, e.g. ``fas:version``, or
+nil), anything else replies +OK.
+"""
+
+import asyncio
+import json
+import threading
+from typing import Optional
+
+
+class SlowRedisStub:
+    """RESP2 stand-in that delays every reply by ``delay`` seconds."""
+
+    def __init__(self, documents: dict, delay: float = 0.05, host: str = "127.0.0.1", strings: Optional[dict] = None):
+        self.documents = {key: json.dumps([doc]).encode() for key, doc in documents.items()}
+        self.strings = {key: str(value).encode() for key, value in (strings or {}).items()}
+        self.delay = delay
+        self.host = host
+        self.port: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def __exit__(self, *exc):
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        self._thread.join(timeout=5)
+
+    async def _shutdown(self):
+        self._server.close()
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop.stop()
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, self.host, 0)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _read_command(self, reader: asyncio.StreamReader) -> Optional[list]:
+        header = await reader.readline()
+        if not header:
+            return None
+        count = int(header[1:].strip())
+        args = []
+        for _ in range(count):
+            length = int((await reader.readline())[1:].strip())
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def _reply(self, args: list) -> bytes:
+        command = args[0].upper()
+        if command == b"HELLO":
+            proto = int(args[1]) if len(args) > 1 else 2
+            if proto == 3:
+                return b"%1\r\n$5\r\nproto\r\n:3\r\n"
+            return b"*2\r\n$5\r\nproto\r\n:2\r\n"
+        if command == b"PING":
+            return b"+PONG\r\n"
+        if command in (b"JSON.GET", b"GET"):
+            values = self.documents if command == b"JSON.GET" else self.strings
+            payload = values.get(args[1].decode())
+            if payload is None:
+                return b"$-1\r\n"
+            return b"$%d\r\n%s\r\n" % (len(payload), payload)
+        return b"+OK\r\n"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                args = await self._read_command(reader)
+                if args is None:
+                    break
+                await asyncio.sleep(self.delay)
+                writer.write(self._reply(args))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
@@ -1,6 +1,10 @@
 """Shared test fixtures for Frontier AI Solutions backend tests."""
 
 import os
+import shutil
+import socket
+import subprocess
+import time
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import MagicMock, AsyncMock
@@ -72,6 +76,43 @@ def mock_redis():
     return mock_client
 
 
+@pytest.fixture
+def redis_module(monkeypatch):
+    """Factory reloading ``app.redis_client`` configured for a test Redis host.
+
+    Keyword arguments set further environment variables before the reload,
+    e.g. ``redis_module(CACHE_TTL_SECONDS="0.01")``. Returns the module.
+    """
+    import importlib
+    import app.redis_client
+    
+    def reload(**env):
+        settings = {"REDIS_HOST": "test-redis.com", "REDIS_PASSWORD": "test-password", "BACKUP_ONLY": "false", **env}
+        for name, value in settings.items():
+            monkeypatch.setenv(name, str(value))
+        return importlib.reload(app.redis_client)
+    
+    return reload
+
+
+@pytest.fixture
+def mock_redis_client(redis_module):
+    """Factory for a connected ``RedisClient`` whose connection is a MagicMock.
+
+    ``execute_command`` replaces the connection's ``execute_command``;
+    keyword arguments are passed on to ``redis_module``.
+    """
+    def create(execute_command=None, **env):
+        client = redis_module(**env).RedisClient()
+        client.client = MagicMock()
+        if execute_command is not None:
+            client.client.execute_command = execute_command
+        client.connected = True
+        return client
+    
+    return create
+
+
 @pytest.fixture
 def mock_websocket():
     """Mock WebSocket for testing."""
@@ -93,3 +134,149 @@ def mock_azure_websocket():
     mock_ws.__aenter__ = AsyncMock(return_value=mock_ws)
     mock_ws.__aexit__ = AsyncMock()
     return mock_ws
+
+
+def category_document(category_type: str, slug: str, *use_cases: dict, **members) -> dict:
+    """A minimal category document that passes validation (see app.models)."""
+    document = {"type": category_type, "slug": slug, "name": slug.title()}
+    if use_cases:
+        document["useCases"] = list(use_cases)
+    return {**document, **members}
+
+
+def category_model(category_type: str, slug: str, *use_cases: dict, **members):
+    """``category_document`` parsed into an ``app.models.Category``."""
+    from app.models import Category
+    return Category.parse(category_document(category_type, slug, *use_cases, **members), category_type, slug)
+
+
+def _port_free(port: int) -> bool:
+    with socket.socket() as sock:
+        try:
+            sock.bind(("127.0.0.1", port))
+        except OSError:
+            return False
+    return True
+
+
+def _free_port(cluster: bool = False) -> int:
+    """Pick a free port; cluster nodes also need port + 10000 for the cluster bus."""
+    while True:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        if not cluster or (port + 10000 < 65536 and _port_free(port + 10000)):
+            return port
+
+
+def _start_redis(binary: str, workdir, password: str, *args: str):
+    """Start redis-server on a free port and wait until it answers PING."""
+    import redis
+    
+    workdir.mkdir(parents=True, exist_ok=True)
+    port = _free_port(cluster="--cluster-enabled" in args)
+    proc = subprocess.Popen(
+        [binary, "--port", str(port), "--requirepass", password, "--masterauth", password,
+         "--save", "", "--appendonly", "no", "--dir", str(workdir), *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    admin = redis.Redis(host="127.0.0.1", port=port, password=password)
+    for _ in range(50):
+        if proc.poll() is not None:
+            raise RuntimeError(f"redis-server exited on port {port}")
+        try:
+            admin.ping()
+            break
+        except redis.ConnectionError:
+            time.sleep(0.1)
+    return {"host": "127.0.0.1", "port": port, "password": password, "admin": admin, "process": proc}
+
+
+def _stop_redis(*servers):
+    for server in servers:
+        server["admin"].close()
+        server["process"].terminate()
+        server["process"].wait()
+
+
+def _wait_for(condition, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError("redis-server did not reach the expected state")
+        time.sleep(0.05)
+
+
+def _link_up(server) -> bool:
+    return server["admin"].info("replication").get("master_link_status") == "up"
+
+
+@pytest.fixture
+def plain_redis_server(tmp_path):
+    """Start a throwaway local redis-server without modules; skips when it is not installed."""
+    binary = shutil.which("redis-server")
+    if not binary:
+        pytest.skip("redis-server not installed")
+    
+    server = _start_redis(binary, tmp_path, "test-password")
+    
+    yield server
+    
+    _stop_redis(server)
+
+
+@pytest.fixture
+def redis_replication(tmp_path):
+    """Start a local primary with two replicas attached and in sync."""
+    binary = shutil.which("redis-server")
+    if not binary:
+        pytest.skip("redis-server not installed")
+    
+    password = "test-password"
+    primary = _start_redis(binary, tmp_path / "primary", password)
+    replicas = [
+        _start_redis(binary, tmp_path / f"replica{i}", password, "--replicaof", "127.0.0.1", str(primary["port"]))
+        for i in range(2)
+    ]
+    try:
+        for replica in replicas:
+            _wait_for(lambda: _link_up(replica))
+    except TimeoutError:
+        _stop_redis(primary, *replicas)
+        raise
+    
+    yield {"primary": primary, "replicas": replicas, "password": password}
+    
+    _stop_redis(primary, *replicas)
+
+
+@pytest.fixture
+def redis_cluster(tmp_path):
+    """Start a one-shard local Redis Cluster: a primary owning every slot plus one replica."""
+    binary = shutil.which("redis-server")
+    if not binary:
+        pytest.skip("redis-server not installed")
+    
+    password = "test-password"
+    nodes = [
+        _start_redis(binary, tmp_path / name, password, "--cluster-enabled", "yes",
+                     "--cluster-config-file", f"{name}.conf")
+        for name in ("primary", "replica")
+    ]
+    primary, replica = nodes
+    try:
+        primary["admin"].execute_command("CLUSTER", "ADDSLOTS", *range(16384))
+        primary_id = primary["admin"].execute_command("CLUSTER", "MYID").decode()
+        replica["admin"].execute_command("CLUSTER", "MEET", "127.0.0.1", primary["port"])
+        _wait_for(lambda: primary_id.encode() in replica["admin"].execute_command("CLUSTER", "NODES"))
+        replica["admin"].execute_command("CLUSTER", "REPLICATE", primary_id)
+        _wait_for(lambda: _link_up(replica))
+        _wait_for(lambda: b"cluster_state:ok" in primary["admin"].execute_command("CLUSTER", "INFO"))
+    except Exception:
+        _stop_redis(*nodes)
+        raise
+    
+    yield {"primary": primary, "replica": replica, "password": password}
+    
+    _stop_redis(*nodes)
@@ -0,0 +1,69 @@
+"""Tests for app/bundle.py."""
+
+import json
+from pathlib import Path
+
+from app.bundle import build_bundle, expand_category
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def _repository_categories() -> dict:
+    catalog = json.loads((DATA_DIR / "catalog.json").read_text())
+    categories = json.loads((DATA_DIR / "categories.json").read_text())
+    return {
+        "role": [categories["role"][entry["slug"]] for entry in catalog["roles"]],
+        "industry": [categories["industry"][entry["slug"]] for entry in catalog["industries"]],
+    }
+
+
+class TestBuildBundle:
+    """Tests for interning solutions, links and evidence."""
+    
+    def test_round_trips_every_category(self):
+        """Test expanding each bundled category restores the stored document."""
+        categories = _repository_categories()
+        
+        bundle = build_bundle(categories, missing=[])
+        
+        for category_type, list_key in (("role", "roles"), ("industry", "industries")):
+            assert [expand_category(bundle, c) for c in bundle[list_key]] == categories[category_type]
+    
+    def test_shared_values_are_stored_once(self):
+        """Test repeated solutions and links collapse into their tables."""
+        bundle = build_bundle(_repository_categories(), missing=[])
+        
+        names = [solution["name"] for solution in bundle["solutions"]]
+        assert "Microsoft 365 Copilot" in names
+        assert len(bundle["links"]) == len({json.dumps(link, sort_keys=True) for link in bundle["links"]})
+        compact = len(json.dumps(bundle, separators=(",", ":")))
+        full = len(json.dumps(_repository_categories(), separators=(",", ":")))
+        assert compact < full * 0.8
+    
+    def test_ids_follow_first_use(self):
+        """Test use cases reference table rows by position, distinguishing link lists."""
+        demo = {"type": "Demo", "url": "https://example.com/a"}
+        video = {"type": "Video", "url": "https://example.com/a"}
+        use_cases = [
+            {"name": "A", "solutions": [{"name": "S", "links": [demo]}], "customerEvidence": [{"name": "E"}]},
+            {"name": "B", "solutions": [{"name": "S", "links": [demo, video]}, {"name": "S", "links": [demo]}],
+             "customerEvidence": [{"name": "E"}]},
+        ]
+        
+        bundle = build_bundle({"role": [{"slug": "r", "useCases": use_cases}]}, missing=["industry:x"])
+        
+        assert bundle["roles"][0]["useCases"][0]["solutions"] == [0]
+        assert bundle["roles"][0]["useCases"][1]["solutions"] == [1, 0]
+        assert bundle["solutions"] == [{"name": "S", "links": [0]}, {"name": "S", "links": [0, 1]}]
+        assert bundle["links"] == [demo, video]
+        assert bundle["evidence"] == [{"name": "E"}]
+        assert bundle["industries"] == []
+        assert bundle["missing"] == ["industry:x"]
+    
+    def test_irregular_documents_pass_through(self):
+        """Test categories or use cases without the expected lists are kept as stored."""
+        categories = {"role": [{"slug": "r"}, {"slug": "s", "useCases": ["text", {"name": "no lists"}]}]}
+        
+        bundle = build_bundle(categories, missing=[])
+        
+        assert [expand_category(bundle, c) for c in bundle["roles"]] == categories["role"]
@@ -0,0 +1,232 @@
+"""Tests for scripts/export_redis_to_backup.py."""
+
+import fnmatch
+import hashlib
+import importlib.util
+import json
+import pytest
+from pathlib import Path
+
+
+@pytest.fixture
+def exporter(tmp_path, monkeypatch):
+    """Load the export script with its backup directory pointed at tmp_path."""
+    path = Path(__file__).parent.parent / "scripts" / "export_redis_to_backup.py"
+    spec = importlib.util.spec_from_file_location("export_redis_to_backup", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "BACKUP_DIR", tmp_path)
+    monkeypatch.setattr(module, "SNAPSHOT_PATH", tmp_path / "backup.snapshot")
+    monkeypatch.setattr(module, "MANIFEST_PATH", tmp_path / "manifest.json")
+    return module
+
+
+class FakeRedis:
+    """In-memory stand-in answering SCAN, GET, HGETALL and pipelined JSON.MGET / EVAL."""
+
+    def __init__(self, documents: dict):
+        self.documents = {}
+        self.versions = {}
+        self.version = None
+        self.commands = []
+        for key, value in documents.items():
+            self.set(key, value)
+
+    def set(self, key, value, version=None):
+        self.documents[key] = json.dumps([value], separators=(",", ":")).encode()
+        if version is not None:
+            self.versions[key] = version
+            self.version = max(self.version or 0, version)
+
+    def scan_iter(self, match: str, count: int):
+        return (key.encode() for key in self.documents if fnmatch.fnmatchcase(key, match))
+
+    def keys(self, pattern):
+        raise AssertionError("KEYS must not be used")
+
+    def get(self, key):
+        return str(self.version).encode() if self.version is not None else None
+
+    def execute_command(self, *args):
+        assert args == ("HGETALL", "fas:versions")
+        return {key.encode(): str(version).encode() for key, version in self.versions.items()}
+
+    def pipeline(self, transaction: bool):
+        fake = self
+
+        class Pipeline:
+            def __init__(self):
+                self.queued = []
+
+            def execute_command(self, *args):
+                self.queued.append(args)
+                fake.commands.append(args)
+
+            def execute(self):
+                replies = []
+                for command, *args in self.queued:
+                    if command == "JSON.MGET":
+                        replies.append([fake.documents.get(key) for key in args[:-1]])
+                    else:
+                        raw = fake.documents.get(args[-1], b"")
+                        replies.append(hashlib.sha1(raw).hexdigest().encode())
+                return replies
+
+        return Pipeline()
+
+    def read(self, command: str) -> list:
+        """Keys passed to ``command`` since the last call."""
+        keys = []
+        for name, *args in self.commands:
+            if name == command:
+                keys.extend(args[:-1] if name == "JSON.MGET" else args[-1:])
+        self.commands = []
+        return keys
+
+
+DOCUMENTS = {
+    "fas:catalog": {"roles": [{"slug": "legal"}]},
+    "fas:solutions": {"engage": {}},
+    "fas:settings:inspire": {"a": 1},
+    "fas:content:exec_narr": {"context": "x"},
+    "fas:role:legal": {"slug": "legal", "name": "Legal"},
+    "fas:role:hr": {"slug": "hr", "name": "HR"},
+    "fas:role:noslug": {"name": "ignored"},
+    "fas:industry:retail": {"slug": "retail"},
+}
+
+
+class TestExport:
+    """Tests for the SCAN + pipelined JSON.MGET exporter."""
+
+    def test_first_export_writes_backup_files(self, exporter, tmp_path):
+        """Test documents are grouped into backup files the way the backend reads them."""
+        client = FakeRedis(DOCUMENTS)
+
+        assert exporter.export_redis_to_backup(client=client)
+
+        categories = json.loads((tmp_path / "categories.json").read_text())
+        assert categories == {
+            "role": {"hr": {"slug": "hr", "name": "HR"}, "legal": {"slug": "legal", "name": "Legal"}},
+            "industry": {"retail": {"slug": "retail"}},
+        }
+        assert json.loads((tmp_path / "settings.json").read_text()) == {"inspire": {"a": 1}}
+        assert json.loads((tmp_path / "catalog.json").read_text()) == DOCUMENTS["fas:catalog"]
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert manifest["documents"]["fas:role:legal"]["path"] == ["categories", "role", "legal"]
+        assert (tmp_path / "backup.snapshot").exists()
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_fetches_in_batches_in_one_pipeline(self, exporter):
+        """Test thousands of categories cost one round trip of batched JSON.MGETs."""
+        client = FakeRedis({f"fas:role:r{i}": {"slug": f"r{i}"} for i in range(2500)})
+
+        documents = exporter.fetch_documents(client, sorted(client.documents), batch_size=200)
+
+        assert len(documents) == 2500
+        assert len(client.commands) == 13
+        assert all(args[0] == "JSON.MGET" and len(args) <= 202 for args in client.commands)
+
+
+class TestIncrementalExport:
+    """Tests for manifest-driven incremental export and --check."""
+
+    @staticmethod
+    def _exported(exporter, versions: bool) -> FakeRedis:
+        client = FakeRedis({})
+        for number, (key, value) in enumerate(DOCUMENTS.items(), start=1):
+            client.set(key, value, version=number if versions else None)
+        assert exporter.export_redis_to_backup(client=client)
+        client.read("JSON.MGET")
+        return client
+
+    @staticmethod
+    def _mtimes(tmp_path) -> dict:
+        return {path.name: path.stat().st_mtime_ns for path in tmp_path.iterdir()}
+
+    def test_unchanged_export_reads_and_writes_nothing(self, exporter, tmp_path):
+        """Test a re-export with matching versions fetches no document and touches no file."""
+        client = self._exported(exporter, versions=True)
+        before = self._mtimes(tmp_path)
+
+        assert exporter.export_redis_to_backup(client=client)
+
+        assert client.read("JSON.MGET") == []
+        assert self._mtimes(tmp_path) == before
+
+    def test_bumped_version_reads_only_that_key(self, exporter, tmp_path):
+        """Test only the re-versioned document is fetched and only its file rewritten."""
+        client = self._exported(exporter, versions=True)
+        before = self._mtimes(tmp_path)
+        client.set("fas:role:hr", {"slug": "hr", "name": "People"}, version=20)
+
+        assert exporter.export_redis_to_backup(client=client)
+
+        assert client.read("JSON.MGET") == ["fas:role:hr"]
+        after = self._mtimes(tmp_path)
+        assert {name for name in after if after[name] != before.get(name)} == {
+            "categories.json", "backup.snapshot", "manifest.json"
+        }
+        assert json.loads((tmp_path / "categories.json").read_text())["role"]["hr"]["name"] == "People"
+
+    def test_unversioned_change_found_by_redis_hash(self, exporter, tmp_path):
+        """Test keys without versions are compared by a hash computed in Redis."""
+        client = self._exported(exporter, versions=False)
+        client.commands = []
+        client.set("fas:settings:inspire", {"a": 2})
+
+        assert exporter.export_redis_to_backup(client=client)
+
+        hashed = [args[-1] for args in client.commands if args[0] == "EVAL"]
+        assert len(hashed) == len(DOCUMENTS)
+        assert client.read("JSON.MGET") == ["fas:settings:inspire"]
+        assert json.loads((tmp_path / "settings.json").read_text()) == {"inspire": {"a": 2}}
+
+    def test_removed_key_is_dropped(self, exporter, tmp_path):
+        """Test documents deleted from Redis disappear from the backup."""
+        client = self._exported(exporter, versions=True)
+        del client.documents["fas:role:legal"]
+
+        assert exporter.export_redis_to_backup(client=client)
+
+        assert "legal" not in json.loads((tmp_path / "categories.json").read_text())["role"]
+        assert "fas:role:legal" not in json.loads((tmp_path / "manifest.json").read_text())["documents"]
+
+    def test_check_reports_drift_without_writing(self, exporter, tmp_path):
+        """Test --check finds Redis changes and local edits but writes nothing."""
+        client = self._exported(exporter, versions=True)
+        assert exporter.export_redis_to_backup(check=True, client=client)
+
+        client.set("fas:role:hr", {"slug": "hr", "name": "People"}, version=20)
+        settings = tmp_path / "settings.json"
+        settings.write_text(json.dumps({"inspire": {"a": "edited"}}, indent=2))
+        before = self._mtimes(tmp_path)
+        plan = exporter.plan_export(client, exporter.load_backup_files(), exporter.load_manifest())
+        _, _, drift = exporter.apply_plan(exporter.load_backup_files(), exporter.load_manifest(), plan)
+
+        assert not exporter.export_redis_to_backup(check=True, client=client)
+
+        assert drift == [("fas:role:hr", "changed in Redis"), ("fas:settings:inspire", "edited locally")]
+        assert self._mtimes(tmp_path) == before
+
+    def test_full_check_passes_after_clean_export(self, exporter, tmp_path):
+        """Test --check --full re-reads every document and compares it with the backup files."""
+        client = self._exported(exporter, versions=True)
+        before = self._mtimes(tmp_path)
+
+        assert exporter.export_redis_to_backup(check=True, full=True, client=client)
+
+        assert sorted(client.read("JSON.MGET")) == sorted(DOCUMENTS)
+        assert self._mtimes(tmp_path) == before
+
+    def test_full_export_drops_documents_missing_from_redis(self, exporter, tmp_path):
+        """Test --full removes backup documents no Redis key maps to, even without a manifest."""
+        client = self._exported(exporter, versions=True)
+        (tmp_path / "manifest.json").unlink()
+        del client.documents["fas:role:legal"]
+
+        assert not exporter.export_redis_to_backup(check=True, full=True, client=client)
+        assert exporter.export_redis_to_backup(full=True, client=client)
+
+        assert "legal" not in json.loads((tmp_path / "categories.json").read_text())["role"]
+        assert exporter.export_redis_to_backup(check=True, full=True, client=client)
@@ -0,0 +1,74 @@
+"""Tests for app/facets.py."""
+
+from app.facets import FacetIndex, positions
+from tests.conftest import category_model
+
+
+def _use_case(name: str, solutions: dict[str, list[str]], plays: tuple[str, ...] = ()) -> dict:
+    return {
+        "name": name,
+        "solutions": [
+            {"name": solution, "links": [{"type": link, "url": "https://example.com"} for link in links]}
+            for solution, links in solutions.items()
+        ],
+        "customerEvidence": [{"name": "Contoso", "solutionPlay": play} for play in plays],
+    }
+
+
+def _index() -> FacetIndex:
+    return FacetIndex([
+        category_model("role", "legal",
+                       _use_case("Contracts", {"Foundry": ["Demo", "Video"]}, ("Apps",)),
+                       _use_case("Research", {"Copilot": ["Demo"]})),
+        category_model("industry", "retail",
+                       _use_case("Fraud", {"Foundry": ["Demo"], "Fabric": ["Video"]}, ("Data",)),
+                       _use_case("Stores", {"Copilot": ["Video"]}, ("Apps",))),
+    ])
+
+
+def _names(index: FacetIndex, bits: int) -> list[str]:
+    return [category.use_cases[position].name for category, position in (index.documents[p] for p in positions(bits))]
+
+
+class TestFacetIndex:
+    """Tests for bitset filtering and disjunctive facet counts."""
+
+    def test_facets_are_anded_and_values_ored(self):
+        """Test values of one facet widen and other facets narrow the result."""
+        index = _index()
+
+        foundry_video, _ = index.filter({"solution": ["Foundry"], "link": ["Video"]})
+        either, _ = index.filter({"solution": ["Foundry", "Fabric"]})
+        plays, _ = index.filter({"type": ["industry"], "solutionPlay": ["Apps"]})
+
+        # A link of any of the use case's solutions counts
+        assert _names(index, foundry_video) == ["Contracts", "Fraud"]
+        assert _names(index, either) == ["Contracts", "Fraud"]
+        assert _names(index, plays) == ["Stores"]
+
+    def test_no_selection_matches_everything(self):
+        """Test empty or missing facets do not filter."""
+        index = _index()
+
+        matches, counts = index.filter({"solution": [], "link": []})
+
+        assert matches.bit_count() == len(index) == 4
+        assert counts["type"] == {"industry": 2, "role": 2}
+        assert counts["link"] == {"Demo": 3, "Video": 3}
+
+    def test_counts_exclude_their_own_facet(self):
+        """Test each facet is counted under the other facets' filters only."""
+        index = _index()
+
+        _, counts = index.filter({"type": ["role"], "solution": ["Foundry"]})
+
+        assert counts["type"] == {"industry": 1, "role": 1}
+        assert counts["solution"] == {"Copilot": 1, "Foundry": 1, "Fabric": 0}
+        assert counts["solutionPlay"] == {"Apps": 1, "Data": 0}
+
+    def test_unknown_values_match_nothing(self):
+        """Test a value no use case has yields an empty result."""
+        matches, _ = _index().filter({"solution": ["Nothing"]})
+
+        assert matches == 0
+        assert list(positions(matches)) == []
@@ -0,0 +1,66 @@
+"""Tests for app/json_patch.py."""
+
+import copy
+import pytest
+
+from app.json_patch import apply, diff
+
+
+CATEGORY = {
+    "slug": "legal",
+    "name": "Legal",
+    "useCases": [{"name": "Contracts", "tags": ["a"]}, {"name": "Discovery"}],
+    "a/b": {"~c": 1},
+}
+
+
+class TestDiff:
+    """Tests for patch generation."""
+    
+    def test_equal_documents_give_empty_patch(self):
+        """Test no operations are emitted for identical documents."""
+        assert diff(CATEGORY, copy.deepcopy(CATEGORY)) == []
+    
+    def test_changed_member_is_replaced_in_place(self):
+        """Test a nested edit produces one replace at its path."""
+        new = copy.deepcopy(CATEGORY)
+        new["useCases"][1]["name"] = "eDiscovery"
+        
+        assert diff(CATEGORY, new) == [{"op": "replace", "path": "/useCases/1/name", "value": "eDiscovery"}]
+    
+    def test_paths_are_escaped(self):
+        """Test '/' and '~' in member names are escaped per RFC 6901."""
+        new = copy.deepcopy(CATEGORY)
+        new["a/b"]["~c"] = 2
+        
+        assert diff(CATEGORY, new) == [{"op": "replace", "path": "/a~1b/~0c", "value": 2}]
+    
+    def test_type_change_replaces_value(self):
+        """Test a member changing type is replaced wholesale."""
+        assert diff({"a": [1]}, {"a": {"x": 1}}) == [{"op": "replace", "path": "/a", "value": {"x": 1}}]
+    
+    @pytest.mark.parametrize("new", [
+        {**CATEGORY, "useCases": CATEGORY["useCases"] + [{"name": "Privacy"}]},
+        {**CATEGORY, "useCases": CATEGORY["useCases"][:1]},
+        {**CATEGORY, "useCases": [{"name": "First"}] + CATEGORY["useCases"]},
+        {"slug": "legal", "extra": [None, True, 1.5]},
+        [],
+    ])
+    def test_apply_round_trips(self, new):
+        """Test applying the diff to the old document yields the new one."""
+        patch = diff(CATEGORY, new)
+        
+        assert apply(copy.deepcopy(CATEGORY), patch) == new
+
+
+class TestApply:
+    """Tests for patch application."""
+    
+    def test_append_marker_adds_to_end(self):
+        """Test '-' appends to an array."""
+        assert apply({"a": [1]}, [{"op": "add", "path": "/a/-", "value": 2}]) == {"a": [1, 2]}
+    
+    def test_unresolvable_path_raises(self):
+        """Test a patch against the wrong document fails loudly."""
+        with pytest.raises(ValueError):
+            apply({"a": 1}, [{"op": "remove", "path": "/b/c"}])
@@ -0,0 +1,71 @@
+"""Tests for app/json_spans.py raw JSON span scanning."""
+
+import json
+import pytest
+from pathlib import Path
+from app.json_spans import object_spans, skip_value
+
+
+class TestSkipValue:
+    """Tests for skip_value."""
+    
+    @pytest.mark.parametrize("value", [
+        '"plain"',
+        '"with \\"escaped\\" quotes and ] braces }"',
+        '123.5e-2',
+        'true',
+        'null',
+        '[1, [2, 3], {"a": "]"}]',
+        '{"nested": {"deep": ["}", "{"]}}',
+    ])
+    def test_returns_end_of_value(self, value):
+        """Test skip_value stops exactly at the end of each value type."""
+        buf = (value + ', "next": 1').encode()
+        
+        end = skip_value(buf, 0)
+        
+        assert buf[:end].decode() == value
+    
+    def test_unterminated_value_raises(self):
+        """Test a truncated container raises ValueError."""
+        with pytest.raises(ValueError):
+            skip_value(b'{"a": [1, 2', 0)
+    
+    def test_unterminated_string_raises(self):
+        """Test a string cut off mid-way raises ValueError."""
+        with pytest.raises(ValueError):
+            skip_value(b'{"a": "tru', 0)
+
+
+class TestObjectSpans:
+    """Tests for object_spans."""
+    
+    def test_maps_keys_to_value_bytes(self):
+        """Test each key maps to the exact bytes of its value."""
+        doc = {"a": [1, "x]}"], "b": {"c": None}, "d": -1.5, "e": "é"}
+        buf = json.dumps(doc, indent=2).encode()
+        
+        spans = object_spans(buf)
+        
+        assert set(spans) == set(doc)
+        for key, (start, end) in spans.items():
+            assert json.loads(buf[start:end]) == doc[key]
+    
+    def test_empty_object(self):
+        """Test an empty object yields no spans."""
+        assert object_spans(b'  { }  ') == {}
+    
+    def test_rejects_non_object(self):
+        """Test a non-object value raises ValueError."""
+        with pytest.raises(ValueError):
+            object_spans(b'[1, 2]')
+    
+    def test_matches_categories_backup(self):
+        """Test spans over the shipped categories.json match json.loads."""
+        path = Path(__file__).parent.parent / "data" / "categories.json"
+        buf = path.read_bytes()
+        expected = json.loads(buf)
+        
+        for category_type, (start, _) in object_spans(buf).items():
+            for slug, (sub_start, sub_end) in object_spans(buf, start).items():
+                assert json.loads(buf[sub_start:sub_end]) == expected[category_type][slug]
@@ -0,0 +1,220 @@
+"""Tests for scripts/load_backup_to_redis.py."""
+
+import fnmatch
+import importlib.util
+import json
+import pytest
+import shutil
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+@pytest.fixture
+def loader(tmp_path, monkeypatch):
+    """Load the loader script with the backup directory copied to tmp_path."""
+    for name in ("catalog", "solutions", "settings", "content", "categories"):
+        shutil.copy(DATA_DIR / f"{name}.json", tmp_path / f"{name}.json")
+    monkeypatch.syspath_prepend(str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location("load_backup_to_redis", SCRIPTS_DIR / "load_backup_to_redis.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module.export, "BACKUP_DIR", tmp_path)
+    yield module
+    sys.modules.pop("export_redis_to_backup", None)
+
+
+class FakeRedis:
+    """In-memory stand-in for the commands the loader sends."""
+
+    def __init__(self):
+        self.store = {}
+        self.hashes = {}
+        self.transactions = []
+
+    def json_set(self, key, value):
+        self.store[key] = json.dumps([value], separators=(",", ":")).encode()
+
+    def scan_iter(self, match: str, count: int):
+        return (key.encode() for key in list(self.store) if fnmatch.fnmatchcase(key, match))
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def pipeline(self, transaction: bool):
+        fake = self
+
+        class Pipeline:
+            def __init__(self):
+                self.queued = []
+
+            def execute_command(self, *args):
+                self.queued.append(args)
+
+            def execute(self):
+                return [[fake.store.get(key) for key in args[1:-1]] for args in self.queued]
+
+        return Pipeline()
+
+    def transaction(self, func, *watches, value_from_callable: bool):
+        fake = self
+
+        class Transaction:
+            """Reads run immediately until multi(); writes are queued for EXEC."""
+
+            def __init__(self):
+                self.queued = None
+                self.watched = list(watches)
+
+            def __getattr__(self, name):
+                return getattr(fake, name)
+
+            def watch(self, *keys):
+                assert self.queued is None, "WATCH inside MULTI"
+                self.watched.extend(keys)
+
+            def multi(self):
+                self.queued = []
+
+            def execute_command(self, *args):
+                self.queued.append(args)
+
+            def delete(self, *keys):
+                self.queued.append(("DEL", *keys))
+
+            def set(self, key, value):
+                self.queued.append(("SET", key, value))
+
+            def hset(self, key, mapping):
+                self.queued.append(("HSET", key, mapping))
+
+        pipe = Transaction()
+        result = func(pipe)
+        self.transactions.append((tuple(pipe.watched), pipe.queued))
+        for command, key, *args in pipe.queued or []:
+            if command == "JSON.SET":
+                self.json_set(key, json.loads(args[1]))
+            elif command == "DEL":
+                for deleted in (key, *args):
+                    self.store.pop(deleted, None)
+            elif command == "SET":
+                self.store[key] = str(args[0]).encode()
+            elif command == "HSET":
+                self.hashes.setdefault(key, {}).update(args[0])
+        return result
+
+
+def _seeded(loader) -> FakeRedis:
+    client = FakeRedis()
+    for key, raw in loader.redis_documents(loader.export.BACKUP_DIR).items():
+        client.json_set(key, json.loads(raw))
+    return client
+
+
+class TestValidation:
+    """Tests for backup file validation."""
+
+    def test_repository_backup_is_valid(self, loader, tmp_path):
+        """Test the committed backup files pass validation."""
+        files, errors = loader.read_backup_files(tmp_path)
+
+        assert errors == []
+        assert loader.validate_backup(files) == []
+
+    def test_reports_structural_problems(self, loader, tmp_path):
+        """Test mismatched slugs, dangling catalog entries and bad JSON are all reported."""
+        categories = json.loads((tmp_path / "categories.json").read_text())
+        categories["role"]["legal"]["slug"] = "law"
+        del categories["role"]["hr"]
+        (tmp_path / "categories.json").write_text(json.dumps(categories))
+        (tmp_path / "content.json").write_text('{"exec_narr": ')
+
+        files, errors = loader.read_backup_files(tmp_path)
+        errors += loader.validate_backup(files)
+
+        assert any(error.startswith("content.json: invalid JSON") for error in errors)
+        assert "categories.json role/legal: role:legal.slug: expected 'legal'" in errors
+        assert "catalog.json roles: 'hr' has no document in categories.json" in errors
+
+    def test_invalid_backup_never_touches_redis(self, loader, tmp_path):
+        """Test a failed validation aborts before any Redis command."""
+        (tmp_path / "catalog.json").write_text("[]")
+        client = FakeRedis()
+
+        assert not loader.load_backup_to_redis(client=client)
+        assert client.transactions == []
+
+
+class TestLoad:
+    """Tests for the transactional load and dry run."""
+
+    def test_first_load_writes_everything_in_one_transaction(self, loader):
+        """Test an empty Redis receives every document plus a version in one MULTI."""
+        client = FakeRedis()
+        documents = loader.redis_documents(loader.export.BACKUP_DIR)
+
+        plan, version = loader.load(client, documents)
+
+        assert version == 1
+        assert len(client.transactions) == 1
+        watched, queued = client.transactions[0]
+        assert watched[0] == "fas:version" and set(watched[1:]) == set(documents)
+        assert sum(1 for command in queued if command[0] == "JSON.SET") == len(documents)
+        assert json.loads(client.store["fas:role:legal"])[0]["slug"] == "legal"
+        assert client.hashes["fas:versions"]["fas:catalog"] == 1
+        assert len(plan["added"]) == len(documents)
+
+    def test_only_changed_documents_are_written(self, loader, tmp_path):
+        """Test a refresh writes and versions just the edited document."""
+        client = _seeded(loader)
+        client.store["fas:version"] = b"4"
+        categories = json.loads((tmp_path / "categories.json").read_text())
+        categories["role"]["legal"]["name"] = "Legal & Compliance"
+        (tmp_path / "categories.json").write_text(json.dumps(categories, indent=2))
+
+        plan, version = loader.load(client, loader.redis_documents(tmp_path))
+
+        assert plan["changed"] == ["fas:role:legal"]
+        assert version == 5
+        assert client.hashes["fas:versions"] == {"fas:role:legal": 5}
+        assert json.loads(client.store["fas:role:legal"])[0]["name"] == "Legal & Compliance"
+
+    def test_no_changes_leaves_version_alone(self, loader):
+        """Test a load that matches Redis writes nothing."""
+        client = _seeded(loader)
+
+        plan, version = loader.load(client, loader.redis_documents(loader.export.BACKUP_DIR))
+
+        assert version is None
+        assert client.transactions[0][1] is None
+        assert "fas:version" not in client.store
+
+    def test_prune_deletes_keys_missing_locally(self, loader):
+        """Test --prune removes backed-up keys that are gone from the files."""
+        client = _seeded(loader)
+        client.json_set("fas:role:retired", {"slug": "retired"})
+
+        plan, version = loader.load(client, loader.redis_documents(loader.export.BACKUP_DIR), prune=True)
+
+        assert plan["removed"] == ["fas:role:retired"]
+        assert "fas:role:retired" in client.transactions[0][0]
+        assert "fas:role:retired" not in client.store
+        assert client.hashes["fas:versions"] == {"fas:role:retired": 1}
+
+    def test_dry_run_prints_diff_without_writing(self, loader, tmp_path, caplog):
+        """Test --dry-run reports additions and a field-level diff but changes nothing."""
+        client = _seeded(loader)
+        del client.store["fas:role:hr"]
+        client.json_set("fas:settings:inspire", {"stale": True})
+        before = dict(client.store)
+
+        with caplog.at_level("INFO"):
+            assert loader.load_backup_to_redis(dry_run=True, client=client)
+
+        assert client.store == before
+        assert client.transactions == []
+        assert "  + fas:role:hr" in caplog.messages
+        assert "  ~ fas:settings:inspire" in caplog.messages
+        assert any(message.strip().startswith('-  "stale": true') for message in caplog.messages)
@@ -2,8 +2,9 @@
 
 import json
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
+from unittest.mock import MagicMock, patch, AsyncMock, PropertyMock
 from fastapi.testclient import TestClient
+from app.redis_client import Document
 
 
 class TestRootEndpoint:
@@ -33,6 +34,27 @@ class TestRootEndpoint:
         assert "recommendations" in endpoints
 
 
+class TestReadyEndpoint:
+    """Tests for /ready endpoint."""
+    
+    def test_ready_returns_503_until_warm_up_finishes(self, client, monkeypatch):
+        """Test readiness is reported only after warm-up."""
+        from app.main import redis_client
+        monkeypatch.setattr(redis_client, "ready", False)
+        monkeypatch.setattr(redis_client, "warmup", None)
+        
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json() == {"ready": False, "warmup": None}
+        
+        monkeypatch.setattr(redis_client, "ready", True)
+        monkeypatch.setattr(redis_client, "warmup", {"documents": 42, "missing": []})
+        
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["warmup"]["documents"] == 42
+
+
 class TestHealthEndpoint:
     """Tests for /health endpoint."""
     
@@ -54,6 +76,15 @@ class TestHealthEndpoint:
         
         assert data["redis_status"] == "backup_only_mode"
     
+    def test_health_reports_open_circuit(self, client):
+        """Test health endpoint surfaces an open Redis circuit breaker."""
+        stats = {"redis_available": False, "circuit": {"state": "open"}}
+        with patch("app.main.redis_client.stats", return_value=stats):
+            response = client.get("/health")
+        
+        assert response.json()["redis_status"] == "circuit_open"
+        assert response.json()["data_layer"]["circuit"]["state"] == "open"
+    
     def test_health_returns_degraded_when_config_invalid(self, client, monkeypatch):
         """Test health endpoint returns degraded status with invalid config."""
         # Clear required env vars to invalidate config
@@ -140,13 +171,13 @@ class TestCatalogEndpoint:
         # Should work with backup data
         assert response.status_code in [200, 500]  # May fail if no backup files exist
     
-    @patch('app.redis_client.redis_client.get_catalog')
+    @patch('app.redis_client.redis_client.get_catalog_document')
     def test_catalog_returns_roles_and_industries(self, mock_get_catalog, client):
         """Test catalog endpoint returns roles and industries data."""
-        mock_get_catalog.return_value = {
+        mock_get_catalog.return_value = Document(json.dumps({
             "roles": ["developer", "architect"],
             "industries": ["healthcare", "finance"]
-        }
+        }).encode())
         
         response = client.get("/api/catalog")
         
@@ -181,7 +212,15 @@ class TestCategoryEndpoint:
         # Should return 404 if not found, or 200 if exists
         assert response.status_code in [200, 404]
     
-    @patch('app.redis_client.redis_client.get_category')
+    def test_category_serves_backup_bytes(self, client):
+        """Test category endpoint serves the backup document as JSON."""
+        response = client.get("/api/category/role/legal")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["slug"] == "legal"
+    
+    @patch('app.redis_client.redis_client.get_category_document')
     def test_category_returns_404_when_not_found(self, mock_get_category, client):
         """Test category endpoint returns 404 when category doesn't exist."""
         mock_get_category.return_value = None
@@ -190,7 +229,7 @@ class TestCategoryEndpoint:
         
         assert response.status_code == 404
     
-    @patch('app.redis_client.redis_client.get_category')
+    @patch('app.redis_client.redis_client.get_category_document')
     def test_category_returns_category_data(self, mock_get_category, client):
         """Test category endpoint returns category data when found."""
         mock_data = {
@@ -198,25 +237,410 @@ class TestCategoryEndpoint:
             "title": "Developer",
             "description": "Software developer role"
         }
-        mock_get_category.return_value = mock_data
+        mock_get_category.return_value = Document(json.dumps(mock_data).encode())
         
         response = client.get("/api/category/role/developer")
         
         assert response.status_code == 200
         data = response.json()
         assert data == mock_data
+    
+    def test_category_fields_projects_document(self, client):
+        """Test fields= returns only the requested paths with their own ETag."""
+        full = client.get("/api/category/role/legal")
+        response = client.get("/api/category/role/legal?fields=name,slug,useCases[].name")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {"name", "slug", "useCases"}
+        assert data["useCases"] == [{"name": u["name"]} for u in full.json()["useCases"]]
+        assert response.headers["etag"] != full.headers["etag"]
+        assert len(response.content) < len(full.content)
+    
+    def test_category_fields_rejects_invalid_path(self, client):
+        """Test a malformed fields= value returns 400."""
+        response = client.get("/api/category/role/legal?fields=name,$.slug")
+        
+        assert response.status_code == 400
+    
+    def test_category_fields_rejects_unknown_top_level_field(self, client):
+        """Test a top-level field categories do not have returns 400 instead of {}."""
+        response = client.get("/api/category/role/legal?fields=name,x1")
+        
+        assert response.status_code == 400
+        assert "x1" in response.json()["detail"]
+
+
+class TestBulkCategoriesEndpoint:
+    """Tests for /api/categories bulk endpoint."""
+    
+    def test_all_returns_every_catalog_category(self, client):
+        """Test slugs=all returns every role listed in the catalog."""
+        catalog = client.get("/api/catalog").json()
+        
+        response = client.get("/api/categories", params={"type": "role", "slugs": "all"})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert list(data["categories"]) == [role["slug"] for role in catalog["roles"]]
+        assert data["missing"] == []
+        assert data["partial"] is False
+    
+    def test_limit_applies_to_listed_slugs_only(self, client):
+        """Test slugs=all is not capped by the per-request slug limit."""
+        catalog = client.get("/api/catalog").json()
+        
+        with patch("app.main.MAX_BULK_CATEGORIES", 1):
+            every = client.get("/api/categories", params={"type": "role", "slugs": "all"})
+            listed = client.get("/api/categories", params={"type": "role", "slugs": "legal,hr"})
+        
+        assert every.status_code == 200
+        assert len(every.json()["categories"]) == len(catalog["roles"]) > 1
+        assert listed.status_code == 400
+    
+    def test_reports_missing_slugs_as_partial(self, client):
+        """Test unknown slugs are listed and the result flagged partial."""
+        response = client.get("/api/categories", params={"type": "industry", "slugs": "retail,unknown,retail"})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert list(data["categories"]) == ["retail"]
+        assert data["categories"]["retail"]["slug"] == "retail"
+        assert data["missing"] == ["unknown"]
+        assert data["partial"] is True
+    
+    def test_matches_single_category_endpoint(self, client):
+        """Test bulk members equal the single-category responses."""
+        single = client.get("/api/category/role/hr").json()
+        
+        bulk = client.get("/api/categories", params={"type": "role", "slugs": "hr"}).json()
+        
+        assert bulk["categories"]["hr"] == single
+    
+    def test_rejects_invalid_type(self, client):
+        """Test bulk endpoint validates the category type."""
+        response = client.get("/api/categories", params={"type": "team", "slugs": "all"})
+        
+        assert response.status_code == 400
+    
+    def test_returns_404_when_nothing_found(self, client):
+        """Test bulk endpoint returns 404 when no slug resolves."""
+        response = client.get("/api/categories", params={"type": "role", "slugs": "nope,nada"})
+        
+        assert response.status_code == 404
+
+
+class TestExploreBundleEndpoint:
+    """Tests for /api/explore/bundle."""
+    
+    def test_bundle_expands_to_category_responses(self, client):
+        """Test each bundled category resolves to the single-category response."""
+        from app.bundle import expand_category
+        
+        response = client.get("/api/explore/bundle")
+        
+        assert response.status_code == 200
+        assert response.headers["etag"]
+        bundle = response.json()
+        assert bundle["missing"] == []
+        legal = next(role for role in bundle["roles"] if role["slug"] == "legal")
+        assert expand_category(bundle, legal) == client.get("/api/category/role/legal").json()
+    
+    def test_bundle_is_compressed_and_smaller(self, client):
+        """Test the bundle is served precompressed and beats fetching every category."""
+        bundle = client.get("/api/explore/bundle", headers={"Accept-Encoding": "gzip"})
+        catalog = client.get("/api/catalog").json()
+        separate = sum(
+            len(client.get(f"/api/category/{category_type}/{entry['slug']}").content)
+            for category_type, key in (("role", "roles"), ("industry", "industries"))
+            for entry in catalog[key]
+        )
+        
+        assert bundle.headers["content-encoding"] == "gzip"
+        assert len(bundle.content) < separate
+    
+    @patch('app.main.redis_client.get_explore_bundle', new_callable=AsyncMock, return_value=None)
+    def test_bundle_returns_500_without_catalog(self, mock_get_bundle, client):
+        """Test a missing catalog is reported as an error."""
+        assert client.get("/api/explore/bundle").status_code == 500
+
+
+class TestSearchEndpoint:
+    """Tests for /api/search."""
+    
+    def test_finds_use_cases_across_categories(self, client):
+        """Test hits point at the category and use case that match."""
+        response = client.get("/api/search", params={"q": "contract "})
+        
+        assert response.status_code == 200
+        assert response.headers["etag"]
+        body = response.json()
+        assert body["suggestions"] == []
+        top = body["hits"][0]
+        assert (top["type"], top["slug"]) == ("role", "legal")
+        use_case = client.get("/api/category/role/legal").json()["useCases"][top["index"]]
+        assert use_case["name"] == top["useCase"]
+    
+    def test_completes_the_last_word(self, client):
+        """Test a partial last word is matched as a prefix and suggested."""
+        body = client.get("/api/search", params={"q": "fra", "limit": 3}).json()
+        
+        assert "fraud" in body["suggestions"]
+        assert 0 < len(body["hits"]) <= 3
+        assert any("fraud" in hit["useCase"].lower() for hit in body["hits"])
+    
+    @pytest.mark.parametrize("params", [{}, {"q": ""}, {"q": "a", "limit": 0}, {"q": "a" * 201}])
+    def test_rejects_invalid_queries(self, client, params):
+        """Test missing, empty and oversized queries are refused."""
+        assert client.get("/api/search", params=params).status_code == 422
+
+
+class TestUseCaseFilterEndpoint:
+    """Tests for /api/use-cases."""
+    
+    def test_filters_across_categories_with_counts(self, client):
+        """Test facet filters return matching use cases and facet counts."""
+        response = client.get("/api/use-cases", params={"solution": "Azure AI Foundry", "type": "industry"})
+        
+        assert response.status_code == 200
+        assert response.headers["etag"]
+        body = response.json()
+        assert body["total"] == len(body["useCases"]) > 0
+        assert body["facets"]["type"]["industry"] == body["total"]
+        for reference in body["useCases"]:
+            assert reference["type"] == "industry"
+            category = client.get(f"/api/category/industry/{reference['slug']}").json()
+            use_case = category["useCases"][reference["index"]]
+            assert use_case["name"] == reference["useCase"]
+            assert "Azure AI Foundry" in [solution["name"] for solution in use_case["solutions"]]
+    
+    def test_repeated_values_are_ored_and_paged(self, client):
+        """Test repeating a parameter widens the match and offset/limit page it."""
+        demo = client.get("/api/use-cases", params={"link": "Demo"}).json()["total"]
+        either = client.get("/api/use-cases", params=[("link", "Demo"), ("link", "Video")]).json()
+        page = client.get("/api/use-cases", params=[("link", "Demo"), ("link", "Video"), ("offset", 2), ("limit", 3)]).json()
+        
+        assert either["total"] >= demo
+        assert page["useCases"] == either["useCases"][2:5]
+    
+    def test_unfiltered_request_counts_everything(self, client):
+        """Test no filters match every use case."""
+        body = client.get("/api/use-cases", params={"limit": 0}).json()
+        
+        assert body["useCases"] == []
+        assert sum(body["facets"]["type"].values()) == body["total"]
+
+
+class TestRelatedUseCasesEndpoint:
+    """Tests for /api/use-cases/{id}/related."""
+    
+    def test_lists_similar_use_cases(self, client):
+        """Test related use cases are references, most similar first, never the use case itself."""
+        reference = client.get("/api/use-cases", params={"limit": 1}).json()["useCases"][0]
+        
+        response = client.get(f"/api/use-cases/{reference['id']}/related", params={"limit": 3})
+        
+        assert response.status_code == 200
+        assert response.headers["etag"]
+        body = response.json()
+        assert body["useCase"] == reference
+        scores = [related["score"] for related in body["related"]]
+        assert 0 < len(scores) <= 3
+        assert scores == sorted(scores, reverse=True)
+        assert reference["id"] not in [related["id"] for related in body["related"]]
+        for related in body["related"]:
+            category = client.get(f"/api/category/{related['type']}/{related['slug']}").json()
+            assert category["useCases"][related["index"]]["name"] == related["useCase"]
+    
+    @pytest.mark.parametrize("use_case_id", ["role:legal:999", "role:nope:0", "legal"])
+    def test_unknown_use_case_returns_404(self, client, use_case_id):
+        """Test ids that match no use case are not found."""
+        assert client.get(f"/api/use-cases/{use_case_id}/related").status_code == 404
+    
+    @pytest.mark.parametrize("limit", [0, 9])
+    def test_rejects_invalid_limits(self, client, limit):
+        """Test limits outside 1..MAX_RELATED_RESULTS are refused."""
+        assert client.get("/api/use-cases/role:legal:0/related", params={"limit": limit}).status_code == 422
+
+
+class TestConditionalGet:
+    """Tests for ETag / If-None-Match handling on content endpoints."""
+    
+    @pytest.mark.parametrize("path", [
+        "/api/catalog",
+        "/api/category/role/legal",
+        "/api/settings/inspire",
+        "/api/solutions",
+    ])
+    def test_returns_etag_and_cache_control(self, client, path):
+        """Test content endpoints send a strong ETag and Cache-Control."""
+        response = client.get(path)
+        
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert "max-age" in response.headers["cache-control"]
+    
+    def test_matching_if_none_match_returns_304(self, client):
+        """Test a matching If-None-Match yields an empty 304."""
+        etag = client.get("/api/category/role/legal").headers["etag"]
+        
+        response = client.get("/api/category/role/legal", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+    
+    def test_weak_and_listed_etags_match(self, client):
+        """Test weak validators and ETag lists are compared weakly."""
+        etag = client.get("/api/catalog").headers["etag"]
+        
+        weak = client.get("/api/catalog", headers={"If-None-Match": f"W/{etag}"})
+        listed = client.get("/api/catalog", headers={"If-None-Match": f'"other", {etag}'})
+        
+        assert weak.status_code == 304
+        assert listed.status_code == 304
+    
+    def test_stale_etag_returns_full_body(self, client):
+        """Test a non-matching If-None-Match returns the document."""
+        response = client.get("/api/catalog", headers={"If-None-Match": '"stale"'})
+        
+        assert response.status_code == 200
+        assert response.json()["type"] == "catalog"
+    
+    def test_etag_differs_between_documents(self, client):
+        """Test different documents get different ETags."""
+        legal = client.get("/api/category/role/legal").headers["etag"]
+        sales = client.get("/api/category/role/sales").headers["etag"]
+        
+        assert legal != sales
+
+
+class TestContentVersionHeader:
+    """Tests for the X-Content-Version response header."""
+    
+    def test_header_reflects_content_version(self, client):
+        """Test content responses carry the last seen fas:version."""
+        from app.main import redis_client
+        with patch.object(type(redis_client), "content_version", new_callable=PropertyMock, return_value=42):
+            response = client.get("/api/catalog")
+            bulk = client.get("/api/categories?type=role&slugs=legal")
+        
+        assert response.headers["x-content-version"] == "42"
+        assert bulk.headers["x-content-version"] == "42"
+    
+    def test_header_omitted_when_unknown(self, client):
+        """Test no header is sent when no version has been read."""
+        from app.main import redis_client
+        with patch.object(type(redis_client), "content_version", new_callable=PropertyMock, return_value=None):
+            response = client.get("/api/catalog")
+        
+        assert "x-content-version" not in response.headers
+
+
+class TestContentChangesEndpoint:
+    """Tests for GET /api/content/changes."""
+    
+    def test_returns_changes_with_hrefs(self, client):
+        """Test changes since a version are listed with patches and API paths."""
+        from app.main import redis_client
+        changes = [
+            {"key": "fas:role:legal", "version": 7, "patch": [{"op": "replace", "path": "/name", "value": "Law"}], "removed": False},
+            {"key": "fas:catalog", "version": 8, "patch": None, "removed": False},
+            {"key": "fas:content:exec_narr", "version": 8, "patch": None, "removed": False},
+        ]
+        with patch.object(type(redis_client), "content_version", new_callable=PropertyMock, return_value=8), \
+                patch.object(redis_client, "changes_since", new=AsyncMock(return_value=changes)) as changes_since:
+            response = client.get("/api/content/changes?since=6")
+        
+        changes_since.assert_awaited_once_with(6)
+        assert response.status_code == 200
+        assert response.headers["x-content-version"] == "8"
+        assert response.headers["cache-control"] == "no-store"
+        body = response.json()
+        assert body["version"] == 8 and body["since"] == 6 and body["reset"] is False
+        assert [change["href"] for change in body["changes"]] == ["/api/category/role/legal", "/api/catalog", None]
+        assert body["changes"][0]["patch"] == changes[0]["patch"]
+    
+    def test_reports_reset_when_log_does_not_reach_back(self, client):
+        """Test clients older than the change log are told to reload."""
+        from app.main import redis_client
+        with patch.object(type(redis_client), "content_version", new_callable=PropertyMock, return_value=300), \
+                patch.object(redis_client, "changes_since", new=AsyncMock(return_value=None)):
+            body = client.get("/api/content/changes?since=1").json()
+        
+        assert body == {"version": 300, "since": 1, "reset": True, "changes": []}
+    
+    def test_backup_mode_reports_no_changes(self, client):
+        """Test without a content version there is nothing to sync."""
+        body = client.get("/api/content/changes?since=0").json()
+        
+        assert body == {"version": None, "since": 0, "reset": False, "changes": []}
+    
+    def test_requires_non_negative_since(self, client):
+        """Test since is required and validated."""
+        assert client.get("/api/content/changes").status_code == 422
+        assert client.get("/api/content/changes?since=-1").status_code == 422
+
+
+class TestCompressedResponses:
+    """Tests for precompressed content responses."""
+    
+    def test_serves_gzip_variant(self, client):
+        """Test a gzip-accepting client gets the precompressed body."""
+        plain = client.get("/api/category/role/legal", headers={"Accept-Encoding": "identity"})
+        response = client.get("/api/category/role/legal", headers={"Accept-Encoding": "gzip"})
+        
+        assert "content-encoding" not in plain.headers
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json() == plain.json()
+        assert int(response.headers["content-length"]) < len(plain.content)
+        assert response.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+    
+    def test_bulk_categories_are_not_compressed_per_request(self, client):
+        """Test the per-request bulk body is sent as built."""
+        response = client.get("/api/categories?type=role&slugs=all", headers={"Accept-Encoding": "gzip, br"})
+        
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+    
+    def test_encoding_etag_revalidates(self, client):
+        """Test the per-encoding ETag yields a 304 for the same encoding."""
+        headers = {"Accept-Encoding": "gzip"}
+        etag = client.get("/api/catalog", headers=headers).headers["etag"]
+        
+        response = client.get("/api/catalog", headers={**headers, "If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.headers["content-encoding"] == "gzip"
+    
+    @pytest.mark.parametrize("header,expected", [
+        (None, None),
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=0.5, br", "br"),
+        ("br;q=0, gzip", "gzip"),
+        ("gzip;q=0", None),
+        ("*", "br"),
+        ("identity", None),
+        ("BR;q=0.8, gzip;q=0.8", "br"),
+    ])
+    def test_negotiate_encoding(self, header, expected):
+        """Test Accept-Encoding negotiation honours q-values and preference."""
+        from app.main import negotiate_encoding
+        
+        assert negotiate_encoding(header, ("br", "gzip")) == expected
 
 
 class TestInspireSettingsEndpoint:
     """Tests for /api/settings/inspire endpoint."""
     
-    @patch('app.redis_client.redis_client.get_settings')
+    @patch('app.redis_client.redis_client.get_settings_document')
     def test_inspire_settings_returns_settings_data(self, mock_get_settings, client):
         """Test inspire settings endpoint returns settings data."""
         mock_settings = {
             "interests": ["AI", "Cloud", "Data"]
         }
-        mock_get_settings.return_value = mock_settings
+        mock_get_settings.return_value = Document(json.dumps(mock_settings).encode())
         
         response = client.get("/api/settings/inspire")
         
@@ -224,7 +648,7 @@ class TestInspireSettingsEndpoint:
         data = response.json()
         assert data == mock_settings
     
-    @patch('app.redis_client.redis_client.get_settings')
+    @patch('app.redis_client.redis_client.get_settings_document')
     def test_inspire_settings_returns_500_when_load_fails(self, mock_get_settings, client):
         """Test inspire settings endpoint returns 500 when data load fails."""
         mock_get_settings.return_value = None
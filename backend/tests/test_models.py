@@ -0,0 +1,85 @@
+"""Tests for app/models.py."""
+
+import json
+import re
+import pytest
+from pathlib import Path
+
+from app.models import Catalog, Category, ContentError, has_model, parse_document
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def _category(**members) -> dict:
+    return {
+        "type": "role", "slug": "legal", "name": "Legal",
+        "useCases": [{
+            "name": "Contracts",
+            "solutions": [{"name": "Copilot", "links": [{"type": "Docs", "url": "https://example.com/copilot"}]}],
+            "customerEvidence": [{"name": "Contoso", "storyUrl": "https://example.com/contoso"}],
+        }],
+        **members,
+    }
+
+
+class TestParseDocument:
+    """Tests for validating stored documents into models."""
+
+    def test_parses_every_repository_document(self):
+        """Test the catalog and all categories in data/ are valid."""
+        catalog = parse_document("catalog", json.loads((DATA_DIR / "catalog.json").read_text()))
+        categories = json.loads((DATA_DIR / "categories.json").read_text())
+
+        assert isinstance(catalog, Catalog)
+        for category_type in ("role", "industry"):
+            for slug in catalog.slugs(category_type):
+                category = parse_document(f"{category_type}:{slug}", categories[category_type][slug])
+                assert (category.type, category.slug) == (category_type, slug)
+
+    def test_shared_values_are_one_instance(self):
+        """Test equal solutions, links and strings across documents are interned."""
+        first = Category.parse(_category(), "role", "legal")
+        second = Category.parse(_category(slug="hr", name="HR"), "role", "hr")
+
+        assert first.use_cases[0].solutions[0] is second.use_cases[0].solutions[0]
+        assert first.use_cases[0].customer_evidence[0] is second.use_cases[0].customer_evidence[0]
+        assert first.use_cases[0].name is second.use_cases[0].name
+
+    def test_models_are_immutable(self):
+        """Test parsed models cannot be modified or grow attributes."""
+        category = Category.parse(_category(), "role", "legal")
+
+        with pytest.raises(AttributeError):
+            category.name = "Other"
+        assert not hasattr(category, "__dict__")
+
+    def test_unmodeled_keys_are_not_parsed(self):
+        """Test solutions, settings and content documents have no model."""
+        assert parse_document("solutions", ["anything"]) is None
+        assert parse_document("settings:inspire", None) is None
+        assert not has_model("content:exec_narr")
+        assert has_model("industry:retail")
+
+    @pytest.mark.parametrize("key, data, message", [
+        ("role:legal", [], "role:legal: expected an object"),
+        ("role:legal", _category(type="industry"), "role:legal.type: expected 'role'"),
+        ("role:hr", _category(), "role:hr.slug: expected 'hr'"),
+        ("role:legal", _category(name=None), "role:legal.name: expected a str"),
+        ("role:legal", _category(useCases={}), "role:legal.useCases: expected a list"),
+        ("role:legal", _category(useCases=[{"solutions": []}]), "role:legal.useCases[0].name: expected a str"),
+        ("role:legal", _category(priorities=["a", 1]), "role:legal.priorities[1]: expected a str"),
+        ("catalog", {"roles": ["legal"]}, "catalog.roles[0]: expected an object"),
+        ("catalog", {"roles": [{"slug": "a", "name": "A"}] * 2}, "catalog.roles[1].slug: duplicate 'a'"),
+    ])
+    def test_rejects_malformed_documents(self, key, data, message):
+        """Test violations raise ContentError naming the offending path."""
+        with pytest.raises(ContentError, match=f"^{re.escape(message)}$"):
+            parse_document(key, data)
+
+    def test_rejects_non_http_urls(self):
+        """Test links that could run script in the browser are refused."""
+        data = _category()
+        data["useCases"][0]["solutions"][0]["links"][0]["url"] = "javascript:alert(1)"
+
+        with pytest.raises(ContentError, match=r"links\[0\]\.url: expected an http\(s\) URL"):
+            parse_document("role:legal", data)
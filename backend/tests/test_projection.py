@@ -0,0 +1,129 @@
+"""Tests for app/projection.py field projections."""
+
+import json
+import pytest
+from pathlib import Path
+
+from app.projection import assemble, parse_fields, project, redis_paths
+
+
+def _jsonpath(data, path: str) -> list:
+    """Evaluate the ``$.a.b[*].c`` subset of JSONPath that redis_paths emits."""
+    nodes = [data]
+    for segment in path[2:].split("."):
+        wildcard = segment.endswith("[*]")
+        name = segment.removesuffix("[*]")
+        nodes = [node[name] for node in nodes if isinstance(node, dict) and name in node]
+        if wildcard:
+            nodes = [item for node in nodes if isinstance(node, list) for item in node]
+    return nodes
+
+
+def _redis_projection(data, fields):
+    """Answer a projection the way RedisClient does against RedisJSON."""
+    value_paths, array_paths = redis_paths(fields)
+    values = {path: _jsonpath(data, path) for path in value_paths}
+    lengths = {}
+    for path in array_paths:
+        found = _jsonpath(data, path)
+        lengths[path] = len(found[0]) if found and isinstance(found[0], list) else None
+    return assemble(fields, values, lengths)
+
+
+class TestParseFields:
+    """Tests for parse_fields."""
+
+    def test_canonical_sorted_and_deduplicated(self):
+        """Test equivalent field lists share one canonical form."""
+        assert parse_fields(" slug,name,slug ") == ("name", "slug")
+        assert parse_fields("name,slug") == parse_fields("slug, name")
+
+    def test_whole_field_absorbs_deeper_paths(self):
+        """Test a field requested whole drops paths beneath it."""
+        assert parse_fields("useCases[].name,useCases,name") == ("name", "useCases")
+
+    @pytest.mark.parametrize("fields", ["", " , ", "a-b", "a..b", "1a", "a[].b,a.c", "$.name"])
+    def test_rejects_invalid_fields(self, fields):
+        """Test malformed or conflicting paths raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_fields(fields)
+
+
+class TestProject:
+    """Tests for project."""
+
+    DATA = {
+        "name": "Legal",
+        "personas": {"primary": {"title": "GC"}, "other": 1},
+        "useCases": [
+            {"name": "Contracts", "solutions": [{"name": "Copilot", "links": ["x"]}]},
+            {"name": "Compliance", "description": "d"},
+            "not-an-object",
+        ],
+    }
+
+    def test_maps_over_arrays(self):
+        """Test ``[]`` segments project every element."""
+        result = project(self.DATA, parse_fields("name,useCases[].name"))
+
+        assert result == {"name": "Legal", "useCases": [{"name": "Contracts"}, {"name": "Compliance"}, {}]}
+
+    def test_descends_into_objects_and_skips_missing(self):
+        """Test object descent and missing paths behave like JSONPath."""
+        result = project(self.DATA, parse_fields("personas.primary.title,personas.missing,absent,name.first"))
+
+        assert result == {"personas": {"primary": {"title": "GC"}}}
+
+    def test_nested_arrays(self):
+        """Test several array hops are supported in Python projections."""
+        result = project(self.DATA, parse_fields("useCases[].solutions[].name"))
+
+        assert result["useCases"][0] == {"solutions": [{"name": "Copilot"}]}
+        assert redis_paths(parse_fields("useCases[].solutions[].name")) is None
+
+
+class TestRedisPaths:
+    """Tests for redis_paths and assemble."""
+
+    def test_maps_fields_to_jsonpath(self):
+        """Test fields become JSON.GET paths and arrays needing ARRLEN."""
+        fields = parse_fields("name,personas.primary,useCases[].name,useCases[].description")
+
+        assert redis_paths(fields) == (
+            ["$.name", "$.personas.primary", "$.useCases[*].description", "$.useCases[*].name"],
+            ["$.useCases"],
+        )
+
+    def test_misaligned_elements_return_none(self):
+        """Test elements lacking a field cannot be regrouped."""
+        data = {"useCases": [{"name": "a"}, {"description": "b"}]}
+
+        assert _redis_projection(data, parse_fields("useCases[].name")) is None
+
+    def test_non_array_returns_none(self):
+        """Test a ``[]`` segment over an object is not regrouped."""
+        data = {"useCases": {"x": {"name": "a"}}}
+
+        assert _redis_projection(data, parse_fields("useCases[].name")) is None
+
+    @pytest.mark.parametrize("fields", [
+        "name,slug,priorities,useCases[].name",
+        "personas,useCases[].name,useCases[].description",
+        "useCases[].customerEvidence",
+        "type,missing,name.first",
+    ])
+    def test_matches_python_projection_on_backup_data(self, fields):
+        """Test path queries and in-memory projection agree on real documents."""
+        with open(Path(__file__).parent.parent / "data" / "categories.json") as f:
+            categories = json.load(f)
+        parsed = parse_fields(fields)
+        aligned = 0
+
+        for members in categories.values():
+            for document in members.values():
+                from_paths = _redis_projection(document, parsed)
+                if from_paths is not None:
+                    aligned += 1
+                    assert json.dumps(from_paths) == json.dumps(project(document, parsed))
+
+        assert aligned
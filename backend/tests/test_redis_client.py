@@ -1,11 +1,22 @@
 """Tests for app/redis_client.py Redis client and backup functionality."""
 
+import asyncio
 import json
 import os
+import socket
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock, patch, mock_open
-from app.redis_client import BackupLoader, RedisClient, LazyRedisClient
+from unittest.mock import MagicMock, AsyncMock, patch, mock_open
+from app.redis_client import BackupLoader, ChangeLog, Document, DocumentCache, RedisClient, LazyRedisClient
+from tests.conftest import category_document
+
+
+def _catalog(roles=(), industries=()) -> dict:
+    """A catalog document listing ``roles`` and ``industries`` by slug."""
+    return {
+        "roles": [{"slug": slug, "name": slug.title()} for slug in roles],
+        "industries": [{"slug": slug, "name": slug.title()} for slug in industries],
+    }
 
 
 class TestBackupLoader:
@@ -15,18 +26,17 @@ class TestBackupLoader:
         """Test BackupLoader initializes correctly."""
         loader = BackupLoader()
         
-        assert loader._cache == {}
-        assert loader._loaded is False
+        assert loader._files == {}
         assert loader._redis_unavailable_logged is False
     
-    def test_load_backups_loads_all_files(self, monkeypatch, tmp_path):
-        """Test _load_backups reads all backup JSON files."""
+    def test_loads_only_requested_file(self, tmp_path):
+        """Test each getter reads only the backup file it needs."""
         # Create temporary backup files
-        catalog_data = {"roles": ["developer"], "industries": ["tech"]}
+        catalog_data = _catalog(["developer"], ["tech"])
         solutions_data = {"solutions": [{"id": "test", "title": "Test Solution"}]}
         settings_data = {"inspire": {"interests": []}}
         content_data = {"exec_narr": {"context": "test context"}}
-        categories_data = {"role": {"developer": {"title": "Developer"}}}
+        categories_data = {"role": {"developer": category_document("role", "developer", title="Developer")}}
         
         # Write test files
         backup_dir = tmp_path / "data"
@@ -40,18 +50,19 @@ class TestBackupLoader:
         # Patch BACKUP_DIR
         with patch('app.redis_client.BACKUP_DIR', backup_dir):
             loader = BackupLoader()
-            loader._load_backups()
             
-            assert loader._loaded is True
-            assert loader._cache['catalog'] == catalog_data
-            assert loader._cache['solutions'] == solutions_data
-            assert loader._cache['settings'] == settings_data
-            assert loader._cache['content'] == content_data
-            assert loader._cache['categories'] == categories_data
+            assert loader.get_catalog() == catalog_data
+            assert list(loader._files) == ["catalog"]
+            
+            assert loader.get_solutions() == solutions_data
+            assert loader.get_settings("inspire") == settings_data["inspire"]
+            assert loader.get_content("exec_narr") == content_data["exec_narr"]
+            assert loader.get_category("role", "developer") == categories_data["role"]["developer"]
+            assert loader.stats()["loaded"] == sorted(BackupLoader.FILES)
     
     def test_get_catalog_returns_cached_data(self, tmp_path):
         """Test get_catalog returns catalog data."""
-        catalog_data = {"roles": ["developer"]}
+        catalog_data = _catalog(["developer"])
         backup_dir = tmp_path / "data"
         backup_dir.mkdir()
         (backup_dir / "catalog.json").write_text(json.dumps(catalog_data))
@@ -78,8 +89,8 @@ class TestBackupLoader:
     def test_get_category_returns_specific_category(self, tmp_path):
         """Test get_category returns specific category data."""
         categories_data = {
-            "role": {"developer": {"title": "Developer", "slug": "developer"}},
-            "industry": {"healthcare": {"title": "Healthcare", "slug": "healthcare"}}
+            "role": {"developer": category_document("role", "developer", title="Developer")},
+            "industry": {"healthcare": category_document("industry", "healthcare", title="Healthcare")}
         }
         backup_dir = tmp_path / "data"
         backup_dir.mkdir()
@@ -89,10 +100,10 @@ class TestBackupLoader:
             loader = BackupLoader()
             
             result = loader.get_category("role", "developer")
-            assert result == {"title": "Developer", "slug": "developer"}
+            assert result == categories_data["role"]["developer"]
             
             result = loader.get_category("industry", "healthcare")
-            assert result == {"title": "Healthcare", "slug": "healthcare"}
+            assert result == categories_data["industry"]["healthcare"]
     
     def test_get_category_returns_none_when_not_found(self, tmp_path):
         """Test get_category returns None when category doesn't exist."""
@@ -139,6 +150,238 @@ class TestBackupLoader:
             
             assert result == {"context": "Executive narrative context"}
     
+    def test_get_category_document_slices_bytes_without_decoding(self, tmp_path):
+        """Test get_category_document returns the exact bytes of one category."""
+        categories_data = {
+            "role": {"legal": category_document("role", "legal", useCases=[{"name": "Contracts"}])},
+            "industry": {"retail": category_document("industry", "retail")}
+        }
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        (backup_dir / "categories.json").write_text(json.dumps(categories_data, indent=2))
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            loader = BackupLoader()
+            document = loader.get_category_document("role", "legal")
+            
+            assert isinstance(document.raw, bytes)
+            assert json.loads(document.raw) == categories_data["role"]["legal"]
+            assert loader.get_category_document("role", "legal") is document
+            assert loader.get_category_document("role", "missing") is None
+            assert loader.get_category_document("team", "legal") is None
+            assert list(loader._files["categories"]._documents) == [("role", "legal")]
+    
+    def test_get_catalog_document_and_settings(self, tmp_path):
+        """Test catalog and settings are served compact, whatever the file's formatting."""
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        (backup_dir / "catalog.json").write_text('{"roles": []}\n')
+        (backup_dir / "settings.json").write_text(json.dumps({"inspire": {"interests": ["ai"]}}))
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            loader = BackupLoader()
+            
+            assert loader.get_catalog_document().raw == b'{"roles":[]}'
+            assert loader.get_settings_document("inspire").data == {"interests": ["ai"]}
+            assert loader.get_solutions_document() is None
+    
+    def test_json_files_and_snapshot_serve_the_same_bytes(self, tmp_path):
+        """Test a pretty-printed, ASCII-escaped backup file yields the snapshot's bytes and ETag."""
+        from app.snapshot import documents_from_backup_dir, write_snapshot
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        legal = category_document("role", "legal", name="Légal", priorities=["Conformité"])
+        (backup_dir / "categories.json").write_text(json.dumps({"role": {"legal": legal}}, indent=2))
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            from_json = BackupLoader().get_category_document("role", "legal")
+            write_snapshot(backup_dir / "backup.snapshot", documents_from_backup_dir(backup_dir))
+            loader = BackupLoader()
+            from_snapshot = loader.get_category_document("role", "legal")
+            assert loader._snapshot.snapshot is not None
+        
+        assert from_json.raw == from_snapshot.raw == json.dumps(legal, separators=(",", ":"), ensure_ascii=False).encode()
+        assert from_json.etag == from_snapshot.etag
+    
+    def test_reload_changed_swaps_in_new_snapshot(self, tmp_path):
+        """Test a rewritten file is picked up and old Documents stay intact."""
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        path = backup_dir / "categories.json"
+        path.write_text(json.dumps({"role": {"legal": category_document("role", "legal", v=1)}}))
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            loader = BackupLoader()
+            old = loader.get_category_document("role", "legal")
+            
+            assert loader.reload_changed() == []
+            
+            staged = backup_dir / "categories.json.tmp"
+            staged.write_text(json.dumps({"role": {"legal": category_document("role", "legal", v=2)}}))
+            os.replace(staged, path)
+            
+            assert loader.reload_changed() == ["categories"]
+            assert loader.get_category("role", "legal")["v"] == 2
+            assert old.data["v"] == 1
+            assert loader.stats()["reloads"] == 1
+    
+    def test_reload_changed_keeps_snapshot_on_partial_file(self, tmp_path):
+        """Test a truncated or malformed rewrite is ignored."""
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        path = backup_dir / "catalog.json"
+        path.write_text(json.dumps(_catalog(["developer"])))
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            loader = BackupLoader()
+            assert loader.get_catalog() == _catalog(["developer"])
+            
+            path.write_text('{"roles": [{"slug": "devel')
+            assert loader.reload_changed() == []
+            path.write_text('{"roles": []} {}')
+            assert loader.reload_changed() == []
+            
+            assert loader.get_catalog() == _catalog(["developer"])
+            assert loader.stats()["reload_failures"] == 2
+    
+    def test_reload_changed_picks_up_created_file(self, tmp_path):
+        """Test a file that was missing on first access is loaded once it appears."""
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            loader = BackupLoader()
+            assert loader.get_solutions() is None
+            
+            (backup_dir / "solutions.json").write_text('{"solutions": []}')
+            assert loader.reload_changed() == ["solutions"]
+            assert loader.get_solutions() == {"solutions": []}
+    
+    @pytest.mark.asyncio
+    async def test_watch_reloads_in_background(self, tmp_path):
+        """Test watch() applies changes without a request triggering them."""
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        path = backup_dir / "catalog.json"
+        path.write_text('{"roles": []}')
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            loader = BackupLoader()
+            loader.get_catalog_document()
+            watcher = asyncio.create_task(loader.watch(interval=0.01))
+            path.write_text(json.dumps(_catalog(["developer"])))
+            
+            for _ in range(100):
+                if loader.reloads:
+                    break
+                await asyncio.sleep(0.01)
+            watcher.cancel()
+            
+            assert loader.get_catalog() == _catalog(["developer"])
+    
+    def test_reads_documents_from_snapshot(self, tmp_path):
+        """Test a snapshot file is preferred and JSON files are not read."""
+        from app.snapshot import write_snapshot
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        (backup_dir / "categories.json").write_text(json.dumps({"role": {"legal": category_document("role", "legal", source="json")}}))
+        write_snapshot(backup_dir / "backup.snapshot", {
+            "role:legal": json.dumps(category_document("role", "legal", source="snapshot")).encode(),
+            "settings:inspire": b'{"interests":[]}',
+            "catalog": b'{"roles":[]}',
+        })
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            loader = BackupLoader()
+            
+            assert loader.get_category("role", "legal")["source"] == "snapshot"
+            assert loader.get_settings_document("inspire").raw == b'{"interests":[]}'
+            assert loader.get_catalog() == {"roles": []}
+            assert loader.get_category_document("role", "legal") is loader.get_category_document("role", "legal")
+            assert loader.get_solutions() is None
+            assert loader._files == {}
+            assert loader.stats()["snapshot"] == 3
+    
+    def test_stale_snapshot_is_ignored(self, tmp_path):
+        """Test JSON files edited after the snapshot was written take precedence."""
+        from app.snapshot import write_snapshot
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        write_snapshot(backup_dir / "backup.snapshot", {"catalog": json.dumps(_catalog(["old"])).encode()})
+        catalog_path = backup_dir / "catalog.json"
+        catalog_path.write_text(json.dumps(_catalog(["new"])))
+        snapshot_mtime = (backup_dir / "backup.snapshot").stat().st_mtime_ns
+        os.utime(catalog_path, ns=(snapshot_mtime + 10**9, snapshot_mtime + 10**9))
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            loader = BackupLoader()
+            
+            assert loader.get_catalog() == _catalog(["new"])
+            assert loader.stats()["snapshot"] is None
+    
+    def test_edited_json_file_replaces_snapshot_on_reload(self, tmp_path):
+        """Test an edit to a JSON file the snapshot holds is hot-reloaded from the JSON file."""
+        from app.snapshot import write_snapshot
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        catalog_path = backup_dir / "catalog.json"
+        catalog_path.write_text(json.dumps(_catalog(["old"])))
+        write_snapshot(backup_dir / "backup.snapshot", {"catalog": json.dumps(_catalog(["old"])).encode()})
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            loader = BackupLoader()
+            assert loader.get_catalog() == _catalog(["old"])
+            assert loader._files == {}
+            
+            catalog_path.write_text(json.dumps(_catalog(["new"])))
+            snapshot_mtime = (backup_dir / "backup.snapshot").stat().st_mtime_ns
+            os.utime(catalog_path, ns=(snapshot_mtime + 10**9, snapshot_mtime + 10**9))
+            
+            assert loader.reload_changed() == ["backup.snapshot"]
+            assert loader.get_catalog() == _catalog(["new"])
+            assert loader.stats()["snapshot"] is None
+            assert loader.reload_changed() == []
+    
+    def test_newer_manifest_does_not_make_snapshot_stale(self, tmp_path):
+        """Test only the JSON files a snapshot is built from are compared with it."""
+        from app.snapshot import write_snapshot
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        (backup_dir / "catalog.json").write_text(json.dumps(_catalog(["old"])))
+        write_snapshot(backup_dir / "backup.snapshot", {"catalog": json.dumps(_catalog(["new"])).encode()})
+        # The exporter writes manifest.json after the snapshot
+        manifest_path = backup_dir / "manifest.json"
+        manifest_path.write_text("{}")
+        snapshot_mtime = (backup_dir / "backup.snapshot").stat().st_mtime_ns
+        os.utime(manifest_path, ns=(snapshot_mtime + 10**9, snapshot_mtime + 10**9))
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            loader = BackupLoader()
+            
+            assert loader.get_catalog() == _catalog(["new"])
+            assert loader.stats()["snapshot"] == 1
+    
+    def test_reload_swaps_snapshot_and_ignores_corrupt_one(self, tmp_path):
+        """Test a rewritten snapshot is hot-reloaded and a corrupt one is not."""
+        from app.snapshot import write_snapshot
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        path = backup_dir / "backup.snapshot"
+        write_snapshot(path, {"catalog": b'{"v":1}'})
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            loader = BackupLoader()
+            assert loader.get_catalog() == {"v": 1}
+            
+            write_snapshot(path, {"catalog": b'{"v":2}'})
+            assert loader.reload_changed() == ["backup.snapshot"]
+            assert loader.get_catalog() == {"v": 2}
+            
+            path.write_bytes(b"garbage")
+            assert loader.reload_changed() == []
+            assert loader.get_catalog() == {"v": 2}
+            assert loader.stats()["reload_failures"] == 1
+    
     def test_log_redis_unavailable_logs_once(self):
         """Test log_redis_unavailable only logs once per process."""
         loader = BackupLoader()
@@ -153,6 +396,233 @@ class TestBackupLoader:
         assert loader._redis_unavailable_logged is True
 
 
+class TestDocument:
+    """Tests for the Document wrapper."""
+    
+    def test_data_is_decoded_lazily_once(self):
+        """Test data is parsed on first access and memoized."""
+        document = Document(b'{"a": [1, 2]}')
+        
+        assert not hasattr(document, "_data")
+        assert document.data == {"a": [1, 2]}
+        assert document.data is document.data
+    
+    def test_etag_is_strong_and_content_derived(self):
+        """Test the ETag is quoted, stable, and changes with the bytes."""
+        first = Document(b'{"a": 1}')
+        same = Document(b'{"a": 1}')
+        changed = Document(b'{"a": 2}')
+        
+        assert first.etag.startswith('"') and first.etag.endswith('"')
+        assert first.etag == same.etag
+        assert first.etag != changed.etag
+    
+    def test_precompress_builds_each_encoding_once(self):
+        """Test encodings are computed once per version and round-trip."""
+        import gzip
+        raw = json.dumps({"useCases": [{"name": "Contract review"}] * 50}).encode()
+        document = Document(raw)
+        
+        assert document.compressed_bytes == 0
+        gzipped = document.encoded("gzip")
+        
+        assert gzip.decompress(gzipped) == raw
+        assert document.encoded("gzip") is gzipped
+        assert document.compressed_bytes == sum(len(document.encoded(e)) for e in Document.COMPRESSORS)
+        assert document.compressed_bytes < len(raw)
+        assert document.encoded("zstd") is None
+    
+    def test_brotli_encoding_when_available(self):
+        """Test a brotli variant is produced when the brotli module is installed."""
+        brotli = pytest.importorskip("brotli")
+        raw = json.dumps({"useCases": [{"name": "Contract review"}] * 50}).encode()
+        
+        assert brotli.decompress(Document(raw).encoded("br")) == raw
+    
+    def test_small_documents_are_not_compressed(self):
+        """Test documents under the size threshold are served as stored."""
+        document = Document(b'{"a": 1}')
+        document.precompress()
+        
+        assert document.precompressed
+        assert document.encoded("gzip") is None
+        assert document.compressed_bytes == 0
+    
+    @pytest.mark.asyncio
+    async def test_precompress_helper_skips_done_and_missing(self):
+        """Test precompress() only compresses documents that need it."""
+        from app.redis_client import precompress
+        done = Document(b"{}")
+        done.precompress()
+        pending = Document(json.dumps(["x" * 20] * 100).encode())
+        
+        await precompress(done, None, pending)
+        
+        assert pending.precompressed
+        assert pending.compressed_bytes > 0
+
+
+class TestDocumentCache:
+    """Tests for DocumentCache LRU+TTL cache."""
+    
+    def test_get_counts_hits_and_misses(self):
+        """Test get records hits and misses."""
+        cache = DocumentCache(max_bytes=1000, ttl=60)
+        
+        assert cache.get("fas:catalog") is None
+        cache.set("fas:catalog", {"roles": []}, 20)
+        assert cache.get("fas:catalog") == {"roles": []}
+        
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size_bytes"] == 20
+    
+    def test_expired_entry_is_a_miss(self, monkeypatch):
+        """Test entries past their TTL are dropped on read."""
+        now = [1000.0]
+        monkeypatch.setattr('app.redis_client.time.monotonic', lambda: now[0])
+        cache = DocumentCache(max_bytes=1000, ttl=10)
+        cache.set("fas:catalog", {"a": 1}, 10)
+        cache.set("fas:solutions", {"b": 2}, 10, ttl=100)
+        
+        now[0] += 11
+        
+        assert cache.get("fas:catalog") is None
+        assert cache.get("fas:solutions") == {"b": 2}
+        assert cache.expirations == 1
+        assert cache.size_bytes == 10
+    
+    def test_evicts_least_recently_used_to_fit(self):
+        """Test inserting past max_bytes evicts the LRU entries."""
+        cache = DocumentCache(max_bytes=100, ttl=60)
+        cache.set("a", 1, 40)
+        cache.set("b", 2, 40)
+        cache.get("a")
+        cache.set("c", 3, 40)
+        
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        assert cache.evictions == 1
+        assert cache.size_bytes == 80
+    
+    def test_oversized_document_is_not_cached(self):
+        """Test a document larger than the whole budget is skipped."""
+        cache = DocumentCache(max_bytes=100, ttl=60)
+        cache.set("a", 1, 50)
+        cache.set("huge", 2, 500)
+        
+        assert "huge" not in cache
+        assert "a" in cache
+    
+    def test_invalidate_and_clear(self):
+        """Test invalidate drops one key and clear drops all."""
+        cache = DocumentCache(max_bytes=100, ttl=60)
+        cache.set("a", 1, 10)
+        cache.set("b", 2, 10)
+        
+        assert cache.invalidate("a") is True
+        assert cache.invalidate("a") is False
+        cache.clear()
+        
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+    
+    def _breaker(self, **kwargs):
+        from app.redis_client import CircuitBreaker
+        options = {"failure_rate": 0.5, "window_size": 10, "min_calls": 4, "open_seconds": 10}
+        options.update(kwargs)
+        return CircuitBreaker(**options)
+    
+    def test_stays_closed_below_minimum_calls(self):
+        breaker = self._breaker()
+        for _ in range(3):
+            breaker.record_failure()
+        
+        assert breaker.state == breaker.CLOSED
+        assert breaker.allow_request() is True
+    
+    def test_opens_at_failure_rate_and_fails_fast(self):
+        breaker = self._breaker()
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        
+        assert breaker.state == breaker.OPEN
+        assert breaker.allow_request() is False
+        assert breaker.stats()["rejected"] == 1
+        assert breaker.stats()["times_opened"] == 1
+    
+    def test_rolling_window_forgets_old_failures(self):
+        breaker = self._breaker(window_size=4)
+        breaker.record_failure()
+        for _ in range(4):
+            breaker.record_success()
+        breaker.record_failure()
+        
+        assert breaker.state == breaker.CLOSED
+        assert breaker.stats()["failure_rate"] == 0.25
+    
+    def test_half_open_probe_closes_or_reopens(self, monkeypatch):
+        import app.redis_client
+        now = [1000.0]
+        monkeypatch.setattr(app.redis_client.time, "monotonic", lambda: now[0])
+        breaker = self._breaker()
+        breaker.trip()
+        
+        assert breaker.probe_due() is False
+        now[0] += 10
+        assert breaker.probe_due() is True
+        assert breaker.state == breaker.HALF_OPEN
+        assert breaker.allow_request() is False
+        
+        breaker.record_failure()
+        assert breaker.state == breaker.OPEN
+        assert breaker.times_opened == 1
+        
+        now[0] += 10
+        assert breaker.probe_due() is True
+        breaker.record_success()
+        assert breaker.state == breaker.CLOSED
+        assert breaker.stats()["window_calls"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_client_serves_backup_while_open_and_recovers(self, monkeypatch):
+        monkeypatch.setenv("REDIS_HOST", "test-redis.com")
+        monkeypatch.setenv("REDIS_PASSWORD", "test-password")
+        monkeypatch.setenv("BACKUP_ONLY", "false")
+        monkeypatch.setenv("CIRCUIT_OPEN_SECONDS", "0.01")
+        
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
+        client = app.redis_client.RedisClient()
+        client.client = AsyncMock()
+        client.client.ping = AsyncMock(side_effect=[ConnectionError("down"), ConnectionError("down"), True])
+        client.client.execute_command = AsyncMock(return_value=b'[{"ok":true}]')
+        
+        await client.connect()
+        assert client.redis_available is False
+        assert await client.get_json("fas:test") is None
+        client.client.execute_command.assert_not_awaited()
+        
+        for _ in range(100):
+            if client.redis_available:
+                break
+            await asyncio.sleep(0.01)
+        
+        assert client.redis_available is True
+        assert client.breaker.times_opened == 1
+        assert await client.get_json("fas:test") == {"ok": True}
+        await client.close()
+
+
 class TestRedisClient:
     """Tests for RedisClient class."""
     
@@ -175,9 +645,10 @@ class TestRedisClient:
         
         assert client.redis_available is False
     
-    @patch('app.redis_client.redis.Redis')
-    def test_initialization_with_redis_config(self, mock_redis, monkeypatch):
-        """Test RedisClient initializes Redis when config present."""
+    @patch('app.redis_client.aioredis.Redis')
+    @patch('app.redis_client.aioredis.BlockingConnectionPool')
+    def test_initialization_with_redis_config(self, mock_pool, mock_redis, monkeypatch):
+        """Test RedisClient builds a bounded async pool when config present."""
         monkeypatch.setenv("REDIS_HOST", "test-redis.com")
         monkeypatch.setenv("REDIS_PASSWORD", "test-password")
         monkeypatch.setenv("REDIS_PORT", "6380")
@@ -188,29 +659,28 @@ class TestRedisClient:
         import app.redis_client
         importlib.reload(app.redis_client)
         
-        # Mock successful connection
-        mock_instance = MagicMock()
-        mock_instance.ping.return_value = True
-        mock_redis.return_value = mock_instance
-        
-        from app.redis_client import RedisClient
+        from app.redis_client import RedisClient, aioredis
         client = RedisClient()
         
-        assert client.redis_available is True
-        mock_redis.assert_called_once_with(
+        assert client.redis_available is False
+        mock_pool.assert_called_once_with(
+            connection_class=aioredis.SSLConnection,
+            max_connections=20,
+            timeout=2.0,
             host="test-redis.com",
             port=6380,
             password="test-password",
             username="default",
-            ssl=True,
             decode_responses=False,
-            socket_connect_timeout=2,
-            socket_timeout=2
+            socket_connect_timeout=2.0,
+            socket_timeout=2.0
         )
+        mock_redis.assert_called_once_with(connection_pool=mock_pool.return_value)
     
-    @patch('app.redis_client.redis.Redis')
-    def test_test_connection_marks_available_on_success(self, mock_redis, monkeypatch):
-        """Test _test_connection sets redis_available to True on success."""
+    @pytest.mark.asyncio
+    @patch('app.redis_client.aioredis.Redis')
+    async def test_test_connection_marks_available_on_success(self, mock_redis, monkeypatch):
+        """Test connect sets redis_available to True on success."""
         monkeypatch.setenv("REDIS_HOST", "test-redis.com")
         monkeypatch.setenv("REDIS_PASSWORD", "test-password")
         monkeypatch.delenv("BACKUP_ONLY", raising=False)
@@ -221,34 +691,44 @@ class TestRedisClient:
         importlib.reload(app.redis_client)
         
         mock_instance = MagicMock()
-        mock_instance.ping.return_value = True
+        mock_instance.ping = AsyncMock(return_value=True)
         mock_redis.return_value = mock_instance
         
         from app.redis_client import RedisClient
         client = RedisClient()
+        await client.connect()
         
         assert client.redis_available is True
     
-    @patch('app.redis_client.redis.Redis')
-    def test_test_connection_marks_unavailable_on_failure(self, mock_redis, monkeypatch):
-        """Test _test_connection sets redis_available to False on failure."""
+    @pytest.mark.asyncio
+    @patch('app.redis_client.aioredis.Redis')
+    async def test_test_connection_marks_unavailable_on_failure(self, mock_redis, monkeypatch):
+        """Test connect sets redis_available to False on failure."""
         monkeypatch.setenv("REDIS_HOST", "test-redis.com")
         monkeypatch.setenv("REDIS_PASSWORD", "test-password")
         monkeypatch.setenv("BACKUP_ONLY", "false")
         
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
         mock_instance = MagicMock()
-        mock_instance.ping.side_effect = Exception("Connection failed")
+        mock_instance.ping = AsyncMock(side_effect=Exception("Connection failed"))
         mock_redis.return_value = mock_instance
         
+        from app.redis_client import RedisClient
         client = RedisClient()
+        await client.connect()
         
         assert client.redis_available is False
     
-    @patch('app.redis_client.redis.Redis')
-    def test_get_json_returns_data_from_redis(self, mock_redis, monkeypatch):
+    @pytest.mark.asyncio
+    @patch('app.redis_client.aioredis.Redis')
+    async def test_get_json_returns_data_from_redis(self, mock_redis, monkeypatch):
         """Test get_json retrieves data from Redis when available."""
         monkeypatch.setenv("REDIS_HOST", "test-redis.com")
         monkeypatch.setenv("REDIS_PASSWORD", "test-password")
+        monkeypatch.setenv("VERSION_CHECK_SECONDS", "0")
         monkeypatch.delenv("BACKUP_ONLY", raising=False)
         
         # Reload the module to pick up new env vars
@@ -258,66 +738,943 @@ class TestRedisClient:
         
         test_data = {"key": "value", "number": 42}
         mock_instance = MagicMock()
-        mock_instance.ping.return_value = True
-        mock_instance.execute_command.return_value = json.dumps([test_data])
+        mock_instance.ping = AsyncMock(return_value=True)
+        mock_instance.execute_command = AsyncMock(return_value=json.dumps([test_data]))
         mock_redis.return_value = mock_instance
         
         from app.redis_client import RedisClient
         client = RedisClient()
-        result = client.get_json("test:key")
+        await client.connect()
+        result = await client.get_json("test:key")
         
         assert result == test_data
-        mock_instance.execute_command.assert_called_once_with('JSON.GET', 'test:key', '$')
+        mock_instance.execute_command.assert_awaited_once_with('JSON.GET', 'test:key', '$')
+    
+    @pytest.mark.asyncio
+    @patch('app.redis_client.aioredis.Redis')
+    async def test_get_json_serves_repeat_reads_from_cache(self, mock_redis, monkeypatch):
+        """Test get_json only hits Redis once for a cached document."""
+        monkeypatch.setenv("REDIS_HOST", "test-redis.com")
+        monkeypatch.setenv("REDIS_PASSWORD", "test-password")
+        monkeypatch.setenv("VERSION_CHECK_SECONDS", "0")
+        monkeypatch.setenv("BACKUP_ONLY", "false")
+        
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
+        legal = category_document("role", "legal")
+        payload = json.dumps([legal])
+        mock_instance = MagicMock()
+        mock_instance.ping = AsyncMock(return_value=True)
+        mock_instance.execute_command = AsyncMock(return_value=payload)
+        mock_redis.return_value = mock_instance
+        
+        from app.redis_client import RedisClient
+        client = RedisClient()
+        await client.connect()
+        first = await client.get_json("fas:role:legal")
+        second = await client.get_json("fas:role:legal")
+        
+        assert first == second == legal
+        mock_instance.execute_command.assert_awaited_once()
+        stats = client.stats()["cache"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size_bytes"] == len(json.dumps(legal))
+    
+    @pytest.mark.asyncio
+    @patch('app.redis_client.aioredis.Redis')
+    async def test_cache_size_counts_compressed_encodings(self, mock_redis, monkeypatch):
+        """Test a cached document counts its precompressed variants against the byte budget."""
+        monkeypatch.setenv("REDIS_HOST", "test-redis.com")
+        monkeypatch.setenv("REDIS_PASSWORD", "test-password")
+        monkeypatch.setenv("VERSION_CHECK_SECONDS", "0")
+        monkeypatch.setenv("BACKUP_ONLY", "false")
+        
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
+        legal = category_document("role", "legal", priorities=["Reduce contract risk"] * 200)
+        mock_instance = MagicMock()
+        mock_instance.ping = AsyncMock(return_value=True)
+        mock_instance.execute_command = AsyncMock(return_value=json.dumps([legal]))
+        mock_redis.return_value = mock_instance
+        
+        client = app.redis_client.RedisClient()
+        await client.connect()
+        document = await client.get_document("fas:role:legal")
+        
+        assert document.compressed_bytes > 0
+        assert client.cache.size_bytes == len(document.raw) + document.compressed_bytes
     
-    @patch('app.redis_client.redis.Redis')
-    def test_get_json_returns_none_when_key_not_found(self, mock_redis, monkeypatch):
+    @pytest.mark.asyncio
+    @patch('app.redis_client.aioredis.Redis')
+    async def test_get_json_raw_unwraps_root_array(self, mock_redis, monkeypatch):
+        """Test get_json_raw strips the $ wrapper and never decodes."""
+        monkeypatch.setenv("REDIS_HOST", "test-redis.com")
+        monkeypatch.setenv("REDIS_PASSWORD", "test-password")
+        monkeypatch.setenv("BACKUP_ONLY", "false")
+        
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
+        mock_instance = MagicMock()
+        mock_instance.ping = AsyncMock(return_value=True)
+        mock_instance.execute_command = AsyncMock(return_value=b'[{"type":"role","slug":"legal","name":"Legal","tags":["a"]}]')
+        mock_redis.return_value = mock_instance
+        
+        from app.redis_client import RedisClient
+        client = RedisClient()
+        await client.connect()
+        raw = await client.get_json_raw("fas:role:legal")
+        
+        assert raw == b'{"type":"role","slug":"legal","name":"Legal","tags":["a"]}'
+        document = client.cache.get("fas:role:legal")
+        assert not hasattr(document, "_data")
+    
+    @pytest.mark.asyncio
+    @patch('app.redis_client.aioredis.Redis')
+    async def test_get_json_returns_none_when_key_not_found(self, mock_redis, monkeypatch):
         """Test get_json returns None when key doesn't exist in Redis."""
         monkeypatch.setenv("REDIS_HOST", "test-redis.com")
         monkeypatch.setenv("REDIS_PASSWORD", "test-password")
         monkeypatch.setenv("BACKUP_ONLY", "false")
         
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
         mock_instance = MagicMock()
-        mock_instance.ping.return_value = True
-        mock_instance.execute_command.return_value = None
+        mock_instance.ping = AsyncMock(return_value=True)
+        mock_instance.execute_command = AsyncMock(return_value=None)
         mock_redis.return_value = mock_instance
         
+        from app.redis_client import RedisClient
         client = RedisClient()
-        result = client.get_json("nonexistent:key")
+        await client.connect()
+        result = await client.get_json("nonexistent:key")
         
         assert result is None
     
-    @patch('app.redis_client.redis.Redis')
-    def test_get_json_handles_redis_error(self, mock_redis, monkeypatch):
+    @pytest.mark.asyncio
+    @patch('app.redis_client.aioredis.Redis')
+    async def test_get_json_handles_redis_error(self, mock_redis, monkeypatch):
         """Test get_json handles Redis errors gracefully."""
         monkeypatch.setenv("REDIS_HOST", "test-redis.com")
         monkeypatch.setenv("REDIS_PASSWORD", "test-password")
         monkeypatch.setenv("BACKUP_ONLY", "false")
         
-        mock_instance = MagicMock()
-        mock_instance.ping.return_value = True
-        mock_instance.execute_command.side_effect = Exception("Redis error")
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
+        mock_instance = AsyncMock()
+        mock_instance.ping = AsyncMock(return_value=True)
+        mock_instance.execute_command = AsyncMock(side_effect=Exception("Redis error"))
         mock_redis.return_value = mock_instance
         
+        from app.redis_client import RedisClient
         client = RedisClient()
-        result = client.get_json("test:key")
+        await client.connect()
+        result = await client.get_json("test:key")
         
         assert result is None
+        assert client.redis_available is True
+        assert client.breaker.stats()["failure_rate"] == 1.0
+        
+        for _ in range(app.redis_client.CIRCUIT_MIN_CALLS - 1):
+            await client.get_json("test:key")
+        
         assert client.redis_available is False
+        assert client.breaker.state == app.redis_client.CircuitBreaker.OPEN
+        await client.close()
     
-    def test_get_catalog_falls_back_to_backup(self, monkeypatch, tmp_path):
+    @pytest.mark.asyncio
+    async def test_get_catalog_falls_back_to_backup(self, monkeypatch, tmp_path):
         """Test get_catalog falls back to backup when Redis unavailable."""
         monkeypatch.setenv("BACKUP_ONLY", "true")
         
-        catalog_data = {"roles": ["developer"]}
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
+        catalog_data = _catalog(["developer"])
         backup_dir = tmp_path / "data"
         backup_dir.mkdir()
         (backup_dir / "catalog.json").write_text(json.dumps(catalog_data))
         
+        from app.redis_client import RedisClient
         with patch('app.redis_client.BACKUP_DIR', backup_dir):
             client = RedisClient()
-            result = client.get_catalog()
+            await client.connect()
+            result = await client.get_catalog()
             
             assert result == catalog_data
+    
+    @pytest.mark.asyncio
+    async def test_cold_backup_reads_run_in_a_worker_thread(self, monkeypatch, tmp_path):
+        """Test backup reads and validation stay off the event loop, also after a reload."""
+        import threading
+        
+        monkeypatch.setenv("BACKUP_ONLY", "true")
+        
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        categories = backup_dir / "categories.json"
+        categories.write_text(json.dumps({"role": {"legal": category_document("role", "legal")}}))
+        
+        validated = app.redis_client._validated
+        threads = []
+        
+        def spy(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return validated(*args, **kwargs)
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir), patch('app.redis_client._validated', spy):
+            client = app.redis_client.RedisClient()
+            await client.connect()
+            first = await client.get_category_document("role", "legal")
+            assert await client.get_category_document("role", "legal") is first
+            
+            categories.write_text(json.dumps({"role": {"legal": category_document("role", "legal", name="Law")}}))
+            client.backup_loader.reload_changed()
+            reloaded = await client.get_category_document("role", "legal")
+            await client.close()
+        
+        assert reloaded.model.name == "Law"
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+    
+    @pytest.mark.asyncio
+    async def test_slow_redis_does_not_block_event_loop(self, monkeypatch):
+        """Test a slow Redis round trip leaves other coroutines running."""
+        monkeypatch.setenv("REDIS_HOST", "test-redis.com")
+        monkeypatch.setenv("REDIS_PASSWORD", "test-password")
+        monkeypatch.setenv("BACKUP_ONLY", "false")
+        
+        import asyncio
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
+        async def slow_get(*args):
+            await asyncio.sleep(0.2)
+            return json.dumps([{"slow": True}])
+        
+        from app.redis_client import RedisClient
+        with patch('app.redis_client.aioredis.Redis') as mock_redis:
+            mock_instance = MagicMock()
+            mock_instance.ping = AsyncMock(return_value=True)
+            mock_instance.execute_command = slow_get
+            mock_redis.return_value = mock_instance
+            
+            client = RedisClient()
+            await client.connect()
+            
+            ticks = 0
+            
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+            
+            tick_task = asyncio.create_task(ticker())
+            result = await client.get_json("test:key")
+            tick_task.cancel()
+        
+        assert result == {"slow": True}
+        assert ticks >= 10
+
+
+class TestBulkCategories:
+    """Tests for JSON.MGET backed bulk category reads."""
+    
+    @pytest.mark.asyncio
+    async def test_fetches_misses_with_one_mget_and_falls_back(self, mock_redis_client, tmp_path):
+        """Test cache misses share one JSON.MGET and gaps come from backup."""
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        (backup_dir / "categories.json").write_text(json.dumps({"role": {"it": category_document("role", "it", source="backup")}}))
+        
+        legal = json.dumps(category_document("role", "legal")).encode()
+        execute = AsyncMock(return_value=[b"[" + legal + b"]", None, None])
+        client = mock_redis_client(execute)
+        import app.redis_client
+        client.cache.set("fas:role:hr", app.redis_client.Document(b'{"slug":"hr"}'), 13)
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            documents, missing, from_backup = await client.get_category_documents(
+                "role", ["legal", "hr", "it", "ghost"]
+            )
+        
+        execute.assert_awaited_once_with('JSON.MGET', 'fas:role:legal', 'fas:role:it', 'fas:role:ghost', '$')
+        assert list(documents) == ["legal", "hr", "it"]
+        assert documents["legal"].raw == legal
+        assert documents["it"].data["source"] == "backup"
+        assert missing == ["ghost"]
+        assert from_backup == ["it"]
+        assert "fas:role:legal" in client.cache
+
+
+class TestContentValidation:
+    """Tests for rejecting malformed documents at ingest."""
+
+    @pytest.mark.asyncio
+    async def test_malformed_redis_document_falls_back_to_backup(self, mock_redis_client, tmp_path):
+        """Test a document failing validation is neither cached nor served."""
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        (backup_dir / "categories.json").write_text(json.dumps({"role": {"legal": category_document("role", "legal")}}))
+
+        client = mock_redis_client(AsyncMock(return_value=json.dumps([{"slug": "legal", "useCases": {}}])))
+
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            document = await client.get_category_document("role", "legal")
+
+        assert document.model.name == "Legal"
+        assert "fas:role:legal" not in client.cache
+        assert client.stats()["rejected"] == 1
+
+    def test_malformed_backup_document_is_not_served(self, tmp_path):
+        """Test backup members failing validation read as missing."""
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        (backup_dir / "catalog.json").write_text(json.dumps({"roles": [{"slug": "legal"}]}))
+        (backup_dir / "categories.json").write_text(json.dumps({
+            "role": {"legal": category_document("role", "legal"), "hr": category_document("role", "legal")},
+        }))
+
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            loader = BackupLoader()
+
+            assert loader.get_catalog_document() is None
+            assert loader.get_category_document("role", "hr") is None
+            assert loader.get_category_document("role", "legal").model.slug == "legal"
+
+
+class TestProjectedDocuments:
+    """Tests for fields= projections."""
+    
+    @staticmethod
+    def _pipeline(replies):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=replies)
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=pipe)
+        context.__aexit__ = AsyncMock(return_value=False)
+        return pipe, context
+    
+    @pytest.mark.asyncio
+    async def test_reads_paths_in_one_round_trip(self, mock_redis_client):
+        """Test fields are read with JSON.GET paths plus JSON.ARRLEN and cached."""
+        import app.redis_client
+        client = mock_redis_client()
+        values = {"$.name": ["Legal"], "$.useCases[*].name": ["Contracts", "Compliance"]}
+        pipe, context = self._pipeline([json.dumps(values).encode(), [2]])
+        client.client.pipeline = MagicMock(return_value=context)
+        fields = ("name", "useCases[].name")
+        
+        document = await client.get_projected_document("fas:role:legal", fields)
+        again = await client.get_projected_document("fas:role:legal", fields)
+        
+        assert document.data == {"name": "Legal", "useCases": [{"name": "Contracts"}, {"name": "Compliance"}]}
+        assert again is document
+        pipe.execute_command.assert_any_call('JSON.GET', 'fas:role:legal', '$.name', '$.useCases[*].name')
+        pipe.execute_command.assert_any_call('JSON.ARRLEN', 'fas:role:legal', '$.useCases')
+        pipe.execute.assert_awaited_once()
+        assert document.precompressed
+        
+        client.cache.invalidate("fas:role:legal")
+        assert "fas:role:legal" + app.redis_client.PROJECTION_SEPARATOR + "name,useCases[].name" not in client.cache
+    
+    @pytest.mark.asyncio
+    async def test_projects_cached_full_document(self, mock_redis_client):
+        """Test a cached full document is projected without touching Redis."""
+        import app.redis_client
+        client = mock_redis_client()
+        client.client.pipeline = MagicMock()
+        client.client.execute_command = AsyncMock()
+        client.cache.set("fas:role:legal", app.redis_client.Document(b'{"name":"Legal","slug":"legal","x":1}'), 36)
+        
+        document = await client.get_projected_document("fas:role:legal", ("name", "slug"))
+        
+        assert document.raw == b'{"name":"Legal","slug":"legal"}'
+        assert await client.get_projected_document("fas:role:legal", ("name", "slug")) is document
+        client.client.pipeline.assert_not_called()
+        client.client.execute_command.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_projections_of_cached_documents_count_against_the_budget(self, mock_redis_client):
+        """Test in-memory projections are cache entries of their own, dropped with their document."""
+        import app.redis_client
+        client = mock_redis_client()
+        base = app.redis_client.Document(b'{"name":"Legal","slug":"legal","x":1}')
+        client.cache.set("fas:role:legal", base, base.size_bytes)
+        
+        document = await client.get_projected_document("fas:role:legal", ("name",))
+        
+        assert not hasattr(base, "_data")
+        assert client.cache.size_bytes == base.size_bytes + document.size_bytes
+        assert client.cache.peek("fas:role:legal" + app.redis_client.PROJECTION_SEPARATOR + "name") is document
+        
+        # Storing a new version of the document drops projections of the old one
+        newer = app.redis_client.Document(b'{"name":"Legal & Compliance"}')
+        client.cache.set("fas:role:legal", newer, newer.size_bytes)
+        assert client.cache.size_bytes == newer.size_bytes
+        assert (await client.get_projected_document("fas:role:legal", ("name",))).raw == b'{"name":"Legal & Compliance"}'
+    
+    @pytest.mark.asyncio
+    async def test_misaligned_paths_fall_back_to_full_document(self, mock_redis_client):
+        """Test elements missing a field make the client project the full document."""
+        client = mock_redis_client()
+        _, context = self._pipeline([json.dumps({"$.useCases[*].description": ["a"]}).encode(), [2]])
+        client.client.pipeline = MagicMock(return_value=context)
+        client.client.execute_command = AsyncMock(return_value=json.dumps([
+            category_document("role", "legal", useCases=[{"name": "x", "description": "a"}, {"name": "y"}])
+        ]).encode())
+        
+        document = await client.get_projected_document("fas:role:legal", ("useCases[].description",))
+        
+        client.client.execute_command.assert_awaited_once_with('JSON.GET', 'fas:role:legal', '$')
+        assert document.data == {"useCases": [{"description": "a"}, {}]}
+    
+    @pytest.mark.asyncio
+    async def test_category_projection_falls_back_to_backup(self, mock_redis_client, tmp_path):
+        """Test a missing key is projected from the backup document."""
+        client = mock_redis_client()
+        client.client.execute_command = AsyncMock(return_value=None)
+        backup_dir = tmp_path / "data"
+        backup_dir.mkdir()
+        (backup_dir / "categories.json").write_text(json.dumps({"role": {"it": category_document("role", "it", name="IT")}}))
+        
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            document = await client.get_category_projection("role", "it", ("name",))
+        
+        client.client.execute_command.assert_awaited_once_with('JSON.GET', 'fas:role:it', '$.name')
+        assert document.raw == b'{"name":"IT"}'
+
+
+class TestStaleWhileRevalidate:
+    """Tests for stale-while-revalidate reads."""
+    
+    @pytest.mark.asyncio
+    async def test_serves_stale_copy_and_refreshes_once(self, mock_redis_client):
+        """Test expired entries are served while one refresh runs per key."""
+        import asyncio
+        
+        release = asyncio.Event()
+        
+        async def slow_get(*args):
+            await release.wait()
+            return json.dumps([category_document("role", "legal", version=2)])
+        
+        execute = AsyncMock(side_effect=slow_get)
+        client = mock_redis_client(execute, CACHE_MAX_STALE_SECONDS="60")
+        client.cache.set("fas:role:legal", Document(json.dumps(category_document("role", "legal", version=1)).encode()), 10, ttl=-1)
+        
+        results = await asyncio.gather(*(client.get_category("role", "legal") for _ in range(5)))
+        
+        assert all(r["version"] == 1 for r in results)
+        assert len(client._refresh_tasks) == 1
+        
+        release.set()
+        await asyncio.gather(*client._refresh_tasks.values())
+        
+        assert execute.await_count == 1
+        assert (await client.get_category("role", "legal"))["version"] == 2
+        stats = client.stats()["refresh"]["fas:role:legal"]
+        assert stats["refreshes"] == 1
+        assert stats["last_lag_ms"] >= 1000
+        assert client.cache.stale_hits == 5
+    
+    @pytest.mark.asyncio
+    async def test_blocks_past_max_staleness(self, mock_redis_client):
+        """Test entries older than the max-staleness bound are fetched inline."""
+        execute = AsyncMock(return_value=json.dumps([{"version": 2}]))
+        client = mock_redis_client(execute, CACHE_MAX_STALE_SECONDS="60")
+        client.cache.set("fas:catalog", Document(json.dumps({"version": 1}).encode()), 10, ttl=-120)
+        
+        result = await client.get_catalog()
+        
+        assert result == {"version": 2}
+        assert client._refresh_tasks == {}
+        execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_other_documents_do_not_serve_stale(self, mock_redis_client):
+        """Test settings reads block on expiry instead of serving stale."""
+        execute = AsyncMock(return_value=json.dumps([{"version": 2}]))
+        client = mock_redis_client(execute, CACHE_MAX_STALE_SECONDS="60")
+        client.cache.set("fas:settings:inspire", Document(json.dumps({"version": 1}).encode()), 10, ttl=-1)
+        
+        result = await client.get_settings("inspire")
+        
+        assert result == {"version": 2}
+        assert client._refresh_tasks == {}
+    
+    @pytest.mark.asyncio
+    async def test_failed_refresh_is_counted(self, mock_redis_client):
+        """Test a refresh that cannot reach Redis keeps the stale copy."""
+        import asyncio
+        
+        execute = AsyncMock(side_effect=Exception("Redis down"))
+        client = mock_redis_client(execute, CACHE_MAX_STALE_SECONDS="60")
+        client.cache.set("fas:catalog", Document(json.dumps({"version": 1}).encode()), 10, ttl=-1)
+        
+        assert await client.get_catalog() == {"version": 1}
+        await asyncio.gather(*client._refresh_tasks.values())
+        
+        assert client.refresh_stats["fas:catalog"]["failures"] == 1
+        assert await client.get_catalog() == {"version": 1}
+        await asyncio.gather(*client._refresh_tasks.values())
+
+
+class TestContentVersion:
+    """Tests for fas:version freshness checks."""
+    
+    @staticmethod
+    def _client(mock_redis_client, replies: dict):
+        async def execute_command(command, *args):
+            reply = replies[command]
+            return reply() if callable(reply) else reply
+        
+        return mock_redis_client(AsyncMock(side_effect=execute_command), CACHE_TTL_SECONDS="0.01")
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_version_keeps_cache_past_ttl(self, mock_redis_client):
+        """Test a matching version lets cached documents outlive their TTL."""
+        replies = {"GET": b"3", "JSON.GET": b'[{"v":1}]'}
+        client = self._client(mock_redis_client, replies)
+        
+        assert await client.check_version() == 3
+        assert client.cache_validated is True
+        await client.get_json("fas:catalog")
+        await asyncio.sleep(0.02)
+        await client.get_json("fas:catalog")
+        
+        json_gets = [c for c in client.client.execute_command.await_args_list if c.args[0] == "JSON.GET"]
+        assert len(json_gets) == 1
+        assert client.stats()["content_version"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_version_bump_evicts_changed_documents_only(self, mock_redis_client):
+        """Test per-document versions limit eviction to rewritten keys."""
+        version = [b"3"]
+        replies = {
+            "GET": lambda: version[0],
+            "HGETALL": [b"fas:catalog", b"2", b"fas:role:legal", b"4"],
+        }
+        client = self._client(mock_redis_client, replies)
+        await client.check_version()
+        client.cache.set("fas:catalog", Document(b"{}"), 2)
+        client.cache.set("fas:role:legal", Document(b"{}"), 2)
+        
+        version[0] = b"4"
+        assert await client.check_version() == 4
+        
+        assert "fas:catalog" in client.cache
+        assert "fas:role:legal" not in client.cache
+        assert client.version_changes == 2
+    
+    @pytest.mark.asyncio
+    async def test_version_bump_without_document_versions_clears_cache(self, mock_redis_client):
+        """Test a bump with no fas:versions hash drops every cached document."""
+        version = [b"3"]
+        replies = {"GET": lambda: version[0], "HGETALL": []}
+        client = self._client(mock_redis_client, replies)
+        await client.check_version()
+        client.cache.set("fas:catalog", Document(b"{}"), 2)
+        
+        version[0] = b"5"
+        await client.check_version()
+        
+        assert len(client.cache) == 0
+    
+    @pytest.mark.asyncio
+    async def test_version_bump_missing_from_document_versions_clears_cache(self, mock_redis_client):
+        """Test a bump no fas:versions entry records drops every cached document."""
+        version = [b"3"]
+        replies = {"GET": lambda: version[0], "HGETALL": [b"fas:catalog", b"2", b"fas:role:legal", b"3"]}
+        client = self._client(mock_redis_client, replies)
+        await client.check_version()
+        client.cache.set("fas:catalog", Document(b"{}"), 2)
+        client.cache.set("fas:role:legal", Document(b"{}"), 2)
+        
+        version[0] = b"4"
+        assert await client.check_version() == 4
+        
+        assert len(client.cache) == 0
+        assert client.cache_validated is True
+    
+    @pytest.mark.asyncio
+    async def test_missing_or_invalid_version_falls_back_to_ttl(self, mock_redis_client):
+        """Test the cache is not trusted past TTL without a usable version."""
+        replies = {"GET": None}
+        client = self._client(mock_redis_client, replies)
+        
+        assert await client.check_version() is None
+        assert client.cache_validated is False
+        
+        replies["GET"] = b"not-a-number"
+        assert await client.check_version() is None
+        assert client.content_version is None
+
+    
+    @pytest.mark.asyncio
+    async def test_version_bump_records_patches_for_cached_documents(self, mock_redis_client):
+        """Test changed documents that were cached are logged with a JSON Patch."""
+        version = [b"3"]
+        legal = category_document("role", "legal", useCases=[{"name": "Contracts"}] * 20)
+        replies = {
+            "GET": lambda: version[0],
+            "HGETALL": [b"fas:catalog", b"4", b"fas:role:legal", b"5", b"fas:role:gone", b"5"],
+            "JSON.MGET": lambda: [json.dumps([{**legal, "name": "Legal & Compliance"}]).encode(), None],
+        }
+        client = self._client(mock_redis_client, replies)
+        await client.check_version()
+        client.cache.set("fas:role:legal", Document(json.dumps(legal).encode()), 2)
+        client.cache.set("fas:role:gone", Document(b'{"slug":"gone"}'), 2)
+        
+        version[0] = b"5"
+        await client.check_version()
+        
+        assert await client.changes_since(3) == [
+            {"key": "fas:catalog", "version": 4, "patch": None, "removed": False},
+            {"key": "fas:role:legal", "version": 5,
+             "patch": [{"op": "replace", "path": "/name", "value": "Legal & Compliance"}], "removed": False},
+            {"key": "fas:role:gone", "version": 5, "patch": None, "removed": True},
+        ]
+        assert await client.changes_since(4) == (await client.changes_since(3))[1:]
+        assert await client.changes_since(2) is None
+        assert client.cache.get("fas:role:legal").data["name"] == "Legal & Compliance"
+    
+    @pytest.mark.asyncio
+    async def test_full_eviction_resets_change_log(self, mock_redis_client):
+        """Test a bump without per-document versions makes older clients reload."""
+        version = [b"3"]
+        replies = {"GET": lambda: version[0], "HGETALL": []}
+        client = self._client(mock_redis_client, replies)
+        await client.check_version()
+        
+        version[0] = b"5"
+        await client.check_version()
+        
+        assert await client.changes_since(3) is None
+        assert await client.changes_since(5) == []
+    
+    @pytest.mark.asyncio
+    async def test_client_ahead_of_server_resets(self, mock_redis_client):
+        """Test a client holding a newer version than fas:version must reload."""
+        version = [b"51"]
+        replies = {"GET": lambda: version[0], "HGETALL": []}
+        client = self._client(mock_redis_client, replies)
+        await client.check_version()
+        
+        # Redis rebuilt: fas:version restarts lower than what clients hold
+        version[0] = b"3"
+        await client.check_version()
+        
+        assert await client.changes_since(51) is None
+        assert await client.changes_since(3) == []
+
+
+class TestChangeLog:
+    """Tests for the bounded change log behind delta sync."""
+    
+    def test_merges_changes_per_key(self):
+        """Test several changes to one key are concatenated into one patch."""
+        log = ChangeLog(size=8)
+        log.reset(1)
+        log.record(2, "fas:catalog", [{"op": "add", "path": "/a", "value": 1}])
+        log.record(3, "fas:role:hr", None)
+        log.record(4, "fas:catalog", [{"op": "remove", "path": "/a"}])
+        
+        assert log.since(1) == [
+            {"key": "fas:catalog", "version": 4, "removed": False,
+             "patch": [{"op": "add", "path": "/a", "value": 1}, {"op": "remove", "path": "/a"}]},
+            {"key": "fas:role:hr", "version": 3, "patch": None, "removed": False},
+        ]
+        assert log.since(4) == []
+    
+    def test_missing_patch_poisons_merged_change(self):
+        """Test a change without a patch makes the merged change patchless."""
+        log = ChangeLog(size=8)
+        log.reset(1)
+        log.record(2, "fas:catalog", [{"op": "add", "path": "/a", "value": 1}])
+        log.record(3, "fas:catalog", None, removed=True)
+        
+        assert log.since(1) == [{"key": "fas:catalog", "version": 3, "patch": None, "removed": True}]
+    
+    def test_floor_rises_as_entries_fall_off(self):
+        """Test clients older than the oldest evicted change must reset."""
+        log = ChangeLog(size=2)
+        log.reset(1)
+        for version in (2, 3, 4):
+            log.record(version, f"fas:role:r{version}", None)
+        
+        assert log.floor == 2
+        assert log.since(1) is None
+        assert [change["key"] for change in log.since(2)] == ["fas:role:r3", "fas:role:r4"]
+    
+    def test_unknown_start_always_resets(self):
+        """Test a log that never saw a version cannot answer."""
+        assert ChangeLog().since(0) is None
+
+
+class TestClientTracking:
+    """Tests for CLIENT TRACKING based cache invalidation."""
+    
+    def test_invalidation_message_evicts_keys(self, monkeypatch):
+        """Test an invalidate message drops only the named keys."""
+        monkeypatch.setenv("BACKUP_ONLY", "true")
+        client = RedisClient()
+        client.cache.set("fas:catalog", Document(json.dumps({"a": 1}).encode()), 10)
+        client.cache.set("fas:role:legal", Document(json.dumps({"b": 2}).encode()), 10)
+        
+        client._handle_invalidation([b"message", b"__redis__:invalidate", [b"fas:catalog"]])
+        
+        assert "fas:catalog" not in client.cache
+        assert "fas:role:legal" in client.cache
+        assert client.invalidations == 1
+    
+    def test_flush_invalidation_clears_cache(self, monkeypatch):
+        """Test a null invalidate payload (FLUSHALL) clears the cache."""
+        monkeypatch.setenv("BACKUP_ONLY", "true")
+        client = RedisClient()
+        client.cache.set("fas:catalog", Document(json.dumps({"a": 1}).encode()), 10)
+        
+        client._handle_invalidation([b"message", b"__redis__:invalidate", None])
+        
+        assert len(client.cache) == 0
+    
+    def test_ignores_unrelated_messages(self, monkeypatch):
+        """Test subscribe confirmations and pongs are ignored."""
+        monkeypatch.setenv("BACKUP_ONLY", "true")
+        client = RedisClient()
+        client.cache.set("fas:catalog", Document(json.dumps({"a": 1}).encode()), 10)
+        
+        client._handle_invalidation([b"subscribe", b"__redis__:invalidate", 1])
+        client._handle_invalidation([b"pong", b""])
+        
+        assert "fas:catalog" in client.cache
+        assert client.invalidations == 0
+    
+    @pytest.mark.asyncio
+    async def test_tracking_serves_expired_entries(self, monkeypatch):
+        """Test reads ignore TTL while tracking keeps the cache coherent."""
+        monkeypatch.setenv("BACKUP_ONLY", "true")
+        client = RedisClient()
+        client.cache.set("fas:catalog", Document(json.dumps({"a": 1}).encode()), 10, ttl=-1)
+        client.tracking_active = True
+        
+        assert await client.get_json("fas:catalog") == {"a": 1}
+    
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cached_document(self, plain_redis_server, monkeypatch):
+        """Test a SET on a local redis-server evicts the cached copy, and only that one."""
+        import asyncio
+        import importlib
+        import app.redis_client
+        
+        monkeypatch.setenv("REDIS_HOST", plain_redis_server["host"])
+        monkeypatch.setenv("REDIS_PORT", str(plain_redis_server["port"]))
+        monkeypatch.setenv("REDIS_PASSWORD", plain_redis_server["password"])
+        monkeypatch.setenv("REDIS_SSL", "false")
+        monkeypatch.setenv("REDIS_CLIENT_TRACKING", "true")
+        monkeypatch.setenv("BACKUP_ONLY", "false")
+        importlib.reload(app.redis_client)
+        
+        client = app.redis_client.RedisClient()
+        await client.connect()
+        try:
+            for _ in range(50):
+                if client.tracking_active:
+                    break
+                await asyncio.sleep(0.05)
+            assert client.tracking_active
+            
+            # BCAST tracking covers every fas: key, whether or not this client read it
+            for key in ("fas:version", "fas:catalog"):
+                client.cache.set(key, app.redis_client.Document(b"1"), 1)
+            plain_redis_server["admin"].set("fas:version", "2")
+            for _ in range(50):
+                if "fas:version" not in client.cache:
+                    break
+                await asyncio.sleep(0.05)
+            
+            assert "fas:version" not in client.cache
+            assert "fas:catalog" in client.cache
+            assert client.invalidations >= 1
+        finally:
+            await client.close()
+
+
+class TestReadReplicas:
+    """Tests for read-replica selection and cluster reads."""
+    
+    # No background reload or version tasks next to the servers under test
+    ENV = {"REDIS_SSL": "false", "BACKUP_RELOAD_SECONDS": "0", "VERSION_CHECK_SECONDS": "0"}
+    
+    @classmethod
+    def _reload(cls, redis_module, host, port, password, **env):
+        return redis_module(REDIS_HOST=host, REDIS_PORT=port, REDIS_PASSWORD=password, **cls.ENV, **env)
+    
+    @staticmethod
+    def _gets(server) -> int:
+        return server["admin"].info("commandstats").get("cmdstat_get", {}).get("calls", 0)
+    
+    def test_parse_hosts(self):
+        """Test replica lists accept optional ports."""
+        from app.redis_client import _parse_hosts
+        
+        assert _parse_hosts("a:6380, b,,c.example.com:1", 6379) == [("a", 6380), ("b", 6379), ("c.example.com", 1)]
+        assert _parse_hosts("", 6379) == []
+    
+    @pytest.mark.asyncio
+    async def test_selects_fastest_replica_with_hysteresis(self):
+        """Test the fastest healthy replica wins, but a close second does not steal reads."""
+        from app.redis_client import ReadReplica, ReplicaSet
+        
+        fast, slow, down = (ReadReplica(name, MagicMock()) for name in ("fast", "slow", "down"))
+        for replica, latency in ((fast, 0.001), (slow, 0.020), (down, 0.0001)):
+            replica.latency, replica.healthy = latency, True
+        down.healthy = False
+        replicas = ReplicaSet([slow, fast, down], latency_window=0.005)
+        
+        replicas._choose()
+        assert replicas.select() is fast
+        
+        slow.latency = 0.0008
+        replicas._choose()
+        assert replicas.select() is fast
+        
+        replicas.mark_down(fast)
+        assert replicas.select() is slow
+        assert replicas.stats()["fallbacks"] == 1
+        
+        replicas.mark_down(slow)
+        assert replicas.select() is None
+    
+    @pytest.mark.asyncio
+    async def test_replica_error_retries_on_primary(self, mock_redis_client):
+        """Test a failing replica is skipped and the read still succeeds."""
+        import app.redis_client as module
+        client = mock_redis_client(AsyncMock(return_value=b'[{"roles":[]}]'), **self.ENV)
+        replica = module.ReadReplica("replica:6379", MagicMock())
+        replica.client.execute_command = AsyncMock(side_effect=ConnectionError("gone"))
+        replica.latency, replica.healthy = 0.001, True
+        client.replicas = module.ReplicaSet([replica])
+        client.replicas._choose()
+        
+        assert await client.get_json("fas:catalog") == {"roles": []}
+        
+        assert not replica.healthy
+        assert client.replicas.select() is None
+        assert client.breaker.stats()["failure_rate"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_cluster_mget_splits_by_slot(self, mock_redis_client):
+        """Test bulk reads issue one JSON.MGET per hash slot in cluster mode."""
+        from redis.crc import key_slot
+        
+        async def mget(command, *args):
+            return [json.dumps([category_document("role", key.split(":")[-1])]).encode() for key in args[:-1]]
+        
+        client = mock_redis_client(AsyncMock(side_effect=mget), REDIS_CLUSTER="true", **self.ENV)
+        client.client.keyslot = lambda key: key_slot(key.encode())
+        keys = ["fas:role:legal", "fas:role:hr", "fas:role:it"]
+        
+        documents = await client.get_documents(keys)
+        
+        assert [documents[key].data["slug"] for key in keys] == ["legal", "hr", "it"]
+        assert client.client.execute_command.await_count == len({key_slot(key.encode()) for key in keys})
+    
+    @pytest.mark.asyncio
+    async def test_reads_go_to_local_replica(self, redis_replication, redis_module):
+        """Test reads use a replica and fall back when it stops."""
+        primary, replicas = redis_replication["primary"], redis_replication["replicas"]
+        module = self._reload(
+            redis_module, primary["host"], primary["port"], redis_replication["password"],
+            REDIS_REPLICAS=",".join(f"{r['host']}:{r['port']}" for r in replicas),
+        )
+        primary["admin"].set("fas:version", 3)
+        primary["admin"].execute_command("WAIT", 2, 2000)
+        
+        client = module.RedisClient()
+        await client.connect()
+        try:
+            stats = client.stats()["replicas"]
+            assert all(replica["healthy"] for replica in stats["replicas"].values())
+            selected = next(r for r in replicas if f"{r['host']}:{r['port']}" == stats["selected"])
+            other = next(r for r in replicas if r is not selected)
+            
+            assert await client.check_version() == 3
+            assert self._gets(selected) == 1
+            assert self._gets(primary) == 0
+            
+            selected["admin"].close()
+            selected["process"].terminate()
+            selected["process"].wait()
+            primary["admin"].set("fas:version", 4)
+            primary["admin"].execute_command("WAIT", 1, 2000)
+            
+            assert await client.check_version() == 4
+            assert client.stats()["replicas"]["fallbacks"] == 1
+            await client.replicas.measure()
+            assert client.stats()["replicas"]["selected"] == f"{other['host']}:{other['port']}"
+        finally:
+            await client.close()
+    
+    @pytest.mark.asyncio
+    async def test_replica_with_broken_link_is_skipped(self, redis_replication, redis_module):
+        """Test a replica that lost its primary is not read from."""
+        primary, replicas = redis_replication["primary"], redis_replication["replicas"]
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            unused_port = sock.getsockname()[1]
+        replicas[0]["admin"].execute_command("REPLICAOF", "127.0.0.1", unused_port)
+        module = self._reload(
+            redis_module, primary["host"], primary["port"], redis_replication["password"],
+            REDIS_REPLICAS=f"{replicas[0]['host']}:{replicas[0]['port']}",
+        )
+        
+        client = module.RedisClient()
+        await client.connect()
+        try:
+            assert client.stats()["replicas"]["selected"] is None
+            primary["admin"].set("fas:version", 7)
+            assert await client.check_version() == 7
+            assert self._gets(replicas[0]) == 0
+        finally:
+            await client.close()
+    
+    @pytest.mark.asyncio
+    async def test_cluster_reads_from_shard_replica(self, redis_cluster, redis_module):
+        """Test cluster mode discovers the shard replica and reads from it."""
+        primary, replica = redis_cluster["primary"], redis_cluster["replica"]
+        module = self._reload(
+            redis_module, primary["host"], primary["port"], redis_cluster["password"], REDIS_CLUSTER="true"
+        )
+        primary["admin"].set("fas:version", 5)
+        primary["admin"].execute_command("WAIT", 1, 2000)
+        
+        client = module.RedisClient()
+        await client.connect()
+        try:
+            assert client.redis_available
+            assert await client.check_version() == 5
+            assert self._gets(replica) == 1
+            assert self._gets(primary) == 0
+        finally:
+            await client.close()
 
 
 class TestLazyRedisClient:
@@ -331,11 +1688,12 @@ class TestLazyRedisClient:
         
         assert lazy_client._client is None
     
-    def test_get_catalog_creates_client_on_demand(self, monkeypatch, tmp_path):
+    @pytest.mark.asyncio
+    async def test_get_catalog_creates_client_on_demand(self, monkeypatch, tmp_path):
         """Test LazyRedisClient creates client on first method call."""
         monkeypatch.setenv("BACKUP_ONLY", "true")
         
-        catalog_data = {"roles": ["developer"]}
+        catalog_data = _catalog(["developer"])
         backup_dir = tmp_path / "data"
         backup_dir.mkdir()
         (backup_dir / "catalog.json").write_text(json.dumps(catalog_data))
@@ -345,12 +1703,13 @@ class TestLazyRedisClient:
             
             assert lazy_client._client is None
             
-            result = lazy_client.get_catalog()
+            result = await lazy_client.get_catalog()
             
             assert lazy_client._client is not None
             assert result == catalog_data
     
-    def test_reuses_client_instance(self, monkeypatch, tmp_path):
+    @pytest.mark.asyncio
+    async def test_reuses_client_instance(self, monkeypatch, tmp_path):
         """Test LazyRedisClient reuses the same client instance."""
         monkeypatch.setenv("BACKUP_ONLY", "true")
         
@@ -362,10 +1721,193 @@ class TestLazyRedisClient:
         with patch('app.redis_client.BACKUP_DIR', backup_dir):
             lazy_client = LazyRedisClient()
             
-            lazy_client.get_catalog()
+            await lazy_client.get_catalog()
             first_client = lazy_client._client
             
-            lazy_client.get_solutions()
+            await lazy_client.get_solutions()
             second_client = lazy_client._client
             
             assert first_client is second_client
+    
+    @pytest.mark.asyncio
+    async def test_start_warms_up_in_background(self, monkeypatch, tmp_path):
+        """Test start() connects and warms caches without blocking, then reports ready."""
+        monkeypatch.setenv("BACKUP_ONLY", "true")
+        monkeypatch.setenv("BACKUP_RELOAD_SECONDS", "0")
+        
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
+        backup_dir = _write_backup_dir(tmp_path)
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            lazy_client = app.redis_client.LazyRedisClient()
+            lazy_client.start()
+            
+            assert lazy_client.ready is False
+            await lazy_client._startup_task
+            
+            assert lazy_client.ready is True
+            assert lazy_client.warmup["documents"] == 7
+            assert lazy_client.warmup["missing"] == ["role:missing"]
+            await lazy_client.close()
+
+
+class TestExploreBundle:
+    """Tests for RedisClient.get_explore_bundle, get_search_index and get_related_graph."""
+    
+    @pytest.mark.asyncio
+    async def test_bundle_is_rebuilt_only_when_sources_change(self, monkeypatch, tmp_path):
+        """Test repeat calls reuse the built Document until a category changes."""
+        monkeypatch.setenv("BACKUP_ONLY", "true")
+        
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
+        backup_dir = _write_backup_dir(tmp_path)
+        with patch('app.redis_client.BACKUP_DIR', backup_dir), \
+                patch('app.redis_client.BACKUP_SNAPSHOT', ''):
+            client = app.redis_client.RedisClient()
+            first = await client.get_explore_bundle()
+            again = await client.get_explore_bundle()
+            
+            assert again is first
+            data = json.loads(first.raw)
+            assert [role["slug"] for role in data["roles"]] == ["legal"]
+            assert [industry["slug"] for industry in data["industries"]] == ["retail", "energy"]
+            assert data["missing"] == ["role:missing"]
+            # Sources are not left holding a decoded copy of their bytes
+            assert not hasattr(client.backup_loader.get_category_document("role", "legal"), "_data")
+            
+            categories = json.loads((backup_dir / "categories.json").read_text())
+            categories["role"]["legal"]["name"] = "Legal & Compliance"
+            (backup_dir / "categories.json").write_text(json.dumps(categories))
+            client.backup_loader.reload_changed()
+            rebuilt = await client.get_explore_bundle()
+            
+            assert rebuilt is not first
+            assert json.loads(rebuilt.raw)["roles"][0]["name"] == "Legal & Compliance"
+
+    
+    @pytest.mark.asyncio
+    async def test_search_index_is_rebuilt_only_when_sources_change(self, monkeypatch, tmp_path):
+        """Test the search index is reused until a category changes."""
+        monkeypatch.setenv("BACKUP_ONLY", "true")
+        
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
+        backup_dir = _write_backup_dir(tmp_path)
+        with patch('app.redis_client.BACKUP_DIR', backup_dir), \
+                patch('app.redis_client.BACKUP_SNAPSHOT', ''):
+            client = app.redis_client.RedisClient()
+            first = await client.get_search_index()
+            
+            assert await client.get_search_index() is first
+            assert first.search("contracts") == []
+            
+            categories = json.loads((backup_dir / "categories.json").read_text())
+            categories["role"]["legal"]["useCases"] = [{"name": "Contract review"}]
+            (backup_dir / "categories.json").write_text(json.dumps(categories))
+            client.backup_loader.reload_changed()
+            rebuilt = await client.get_search_index()
+            
+            assert rebuilt is not first
+            assert [hit.category.slug for hit in rebuilt.search("contr")] == ["legal"]
+    
+    @pytest.mark.asyncio
+    async def test_related_graph_is_updated_when_one_category_changes(self, monkeypatch, tmp_path):
+        """Test a changed category updates the previous graph with its IDF weights."""
+        monkeypatch.setenv("BACKUP_ONLY", "true")
+        
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
+        backup_dir = _write_backup_dir(tmp_path)
+        categories = json.loads((backup_dir / "categories.json").read_text())
+        categories["industry"]["retail"]["useCases"] = [{"name": "Contract review", "description": "Supplier contracts"}]
+        (backup_dir / "categories.json").write_text(json.dumps(categories))
+        with patch('app.redis_client.BACKUP_DIR', backup_dir), \
+                patch('app.redis_client.BACKUP_SNAPSHOT', ''):
+            client = app.redis_client.RedisClient()
+            first = await client.get_related_graph()
+            
+            assert await client.get_related_graph() is first
+            assert first.related(first.position("industry:retail:0")) == []
+            
+            categories["role"]["legal"]["useCases"] = [{"name": "Contract drafting", "description": "Supplier contracts"}]
+            (backup_dir / "categories.json").write_text(json.dumps(categories))
+            client.backup_loader.reload_changed()
+            updated = await client.get_related_graph()
+            
+            assert updated is not first
+            assert updated._idf is first._idf
+            hits = updated.related(updated.position("industry:retail:0"))
+            assert [hit.category.use_case_id(hit.index) for hit in hits] == ["role:legal:0"]
+
+
+def _write_backup_dir(tmp_path) -> Path:
+    """Write a small but complete set of backup files."""
+    backup_dir = tmp_path / "data"
+    backup_dir.mkdir()
+    files = {
+        "catalog": _catalog(["legal", "missing"], ["retail", "energy"]),
+        "solutions": {"solutions": []},
+        "settings": {"inspire": {"interests": []}},
+        "content": {"exec_narr": {"context": "ctx"}},
+        "categories": {
+            "role": {"legal": category_document("role", "legal")},
+            "industry": {"retail": category_document("industry", "retail"), "energy": category_document("industry", "energy")},
+        },
+    }
+    for name, data in files.items():
+        (backup_dir / f"{name}.json").write_text(json.dumps(data))
+    return backup_dir
+
+
+class TestWarmUp:
+    """Tests for RedisClient.warm_up."""
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_from_backup(self, monkeypatch, tmp_path):
+        """Test warm-up loads every served document from the backup files."""
+        monkeypatch.setenv("BACKUP_ONLY", "true")
+        
+        import importlib
+        import app.redis_client
+        importlib.reload(app.redis_client)
+        
+        backup_dir = _write_backup_dir(tmp_path)
+        with patch('app.redis_client.BACKUP_DIR', backup_dir):
+            client = app.redis_client.RedisClient()
+            report = await client.warm_up()
+            
+            assert report["documents"] == 7
+            assert report["missing"] == ["role:missing"]
+            assert report["from_backup"] == 3
+            assert report["redis_available"] is False
+            assert client.backup_loader.stats()["loaded"] == sorted(app.redis_client.BackupLoader.FILES)
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_fills_document_cache(self, mock_redis_client):
+        """Test warm-up reads from Redis into the document cache."""
+        catalog = _catalog(["legal"], ["retail"])
+        
+        async def execute_command(command, *args):
+            if command == "JSON.MGET":
+                return [json.dumps([category_document(*key.split(":")[1:])]).encode() for key in args[:-1]]
+            if args[0] == "fas:catalog":
+                return json.dumps([catalog]).encode()
+            return b'[{}]'
+        
+        client = mock_redis_client(AsyncMock(side_effect=execute_command))
+        
+        report = await client.warm_up()
+        
+        assert report == {**report, "documents": 6, "missing": [], "from_backup": 0}
+        for key in ["fas:catalog", "fas:solutions", "fas:settings:inspire", "fas:content:exec_narr",
+                    "fas:role:legal", "fas:industry:retail"]:
+            assert key in client.cache
@@ -0,0 +1,123 @@
+"""Tests for app/related.py."""
+
+import numpy as np
+import pytest
+
+from app.models import Category
+from app.related import RelatedGraph, _counts, _nearest, _vectors
+from tests.conftest import category_model
+
+
+def _category(category_type: str, slug: str, *use_cases: tuple[str, str]) -> Category:
+    return category_model(category_type, slug, *({"name": name, "description": description} for name, description in use_cases))
+
+
+def _sources() -> list[tuple[str, Category]]:
+    return [
+        ("a", _category("role", "legal",
+                        ("Contract review", "Flag risky clauses in supplier contracts"),
+                        ("Case research", "Summarize precedent for litigation teams"))),
+        ("b", _category("role", "finance",
+                        ("Invoice matching", "Match supplier invoices to purchase orders"),
+                        ("Close automation", "Reconcile ledgers every month"))),
+        ("c", _category("industry", "retail",
+                        ("Fraud detection", "Spot fraudulent card transactions at checkout"),
+                        ("Supplier contracts", "Negotiate supplier contracts and flag risky clauses"))),
+    ]
+
+
+def _names(graph: RelatedGraph, use_case_id: str) -> list[str]:
+    return [hit.use_case.name for hit in graph.related(graph.position(use_case_id))]
+
+
+def _assert_same_graph(graph: RelatedGraph, expected: RelatedGraph):
+    assert [c.use_case_id(i) for c, i in graph.documents] == [c.use_case_id(i) for c, i in expected.documents]
+    np.testing.assert_allclose(graph.vectors, expected.vectors, atol=1e-6)
+    np.testing.assert_array_equal(graph.neighbors, expected.neighbors)
+    np.testing.assert_allclose(graph.scores, expected.scores, atol=1e-6)
+
+
+def _rebuilt(graph: RelatedGraph, sources: list[tuple[str, Category]]) -> RelatedGraph:
+    """A full build of ``sources`` under the IDF weights ``graph`` was built with."""
+    vectors = _vectors(_counts(category for _, category in sources), graph._idf)
+    expected = RelatedGraph.__new__(RelatedGraph)
+    expected._set(sources, graph._idf, vectors, *_nearest(vectors, np.arange(len(vectors)), graph.neighbors.shape[1]))
+    return expected
+
+
+class TestRelatedGraph:
+    """Tests for building and incrementally updating the similarity graph."""
+
+    def test_similar_use_cases_rank_first_across_categories(self):
+        """Test the closest use case comes first, whatever its category type."""
+        graph = RelatedGraph(_sources())
+
+        assert _names(graph, "role:legal:0")[0] == "Supplier contracts"
+        assert _names(graph, "industry:retail:1")[0] == "Contract review"
+
+    def test_excludes_self_and_unrelated(self):
+        """Test a use case is never its own neighbour and zero similarity is dropped."""
+        graph = RelatedGraph(_sources())
+
+        for position, (category, index) in enumerate(graph.documents):
+            hits = graph.related(position)
+            assert category.use_case_id(index) not in [hit.category.use_case_id(hit.index) for hit in hits]
+            assert all(hit.score > 0 for hit in hits)
+            assert [hit.score for hit in hits] == sorted((hit.score for hit in hits), reverse=True)
+        assert "Close automation" not in _names(graph, "industry:retail:0")
+
+    def test_unknown_id(self):
+        """Test ids of missing use cases have no position."""
+        graph = RelatedGraph(_sources())
+
+        assert graph.position("role:legal:2") is None
+        assert graph.position("legal") is None
+
+    @pytest.mark.parametrize("k", [1, 8])
+    def test_single_category_change_matches_full_build(self, k):
+        """Test updating one category equals rebuilding with the same IDF."""
+        sources = _sources()
+        graph = RelatedGraph(sources, k)
+        changed = list(sources)
+        changed[0] = ("a2", _category("role", "legal",
+                                      ("Contract review", "Flag risky clauses in supplier contracts"),
+                                      ("Fraud cases", "Investigate fraudulent card transactions"),
+                                      ("Invoice disputes", "Resolve supplier invoice disputes")))
+
+        updated = graph.updated(changed)
+
+        _assert_same_graph(updated, _rebuilt(graph, changed))
+        assert "Fraud cases" in _names(updated, "industry:retail:0")
+        # Untouched inputs keep the frozen weights
+        assert updated._idf is graph._idf
+
+    @pytest.mark.parametrize("k", [1, 8])
+    def test_shrinking_category_shifts_later_rows(self, k):
+        """Test removing use cases remaps neighbours of the categories after it."""
+        sources = _sources()
+        graph = RelatedGraph(sources, k)
+        changed = list(sources)
+        changed[1] = ("b2", _category("role", "finance", ("Close automation", "Reconcile ledgers every month")))
+
+        updated = graph.updated(changed)
+
+        _assert_same_graph(updated, _rebuilt(graph, changed))
+        assert "Invoice matching" not in _names(updated, "role:legal:0")
+
+    def test_unchanged_sources_reuse_the_graph(self):
+        """Test the same ETags return the same graph."""
+        graph = RelatedGraph(_sources())
+
+        assert graph.updated(_sources()) is graph
+
+    def test_several_changes_rebuild(self):
+        """Test changing the category set or several categories rebuilds with fresh IDF."""
+        sources = _sources()
+        graph = RelatedGraph(sources)
+        added = sources + [("d", _category("industry", "energy", ("Grid forecasting", "Forecast grid demand")))]
+        both = [("a2", sources[0][1]), ("b2", sources[1][1]), sources[2]]
+
+        for changed in (added, both, sources[1:]):
+            updated = graph.updated(changed)
+            _assert_same_graph(updated, RelatedGraph(changed))
+            assert updated.etags == {(c.type, c.slug): etag for etag, c in changed}
@@ -0,0 +1,79 @@
+"""Tests for app/search.py."""
+
+import json
+from pathlib import Path
+
+from app.models import Category
+from app.search import SearchIndex, tokenize
+from tests.conftest import category_model
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def _repository_index() -> SearchIndex:
+    categories = json.loads((DATA_DIR / "categories.json").read_text())
+    return SearchIndex(
+        Category.parse(document, category_type, slug)
+        for category_type, members in categories.items()
+        for slug, document in members.items()
+    )
+
+
+class TestSearchIndex:
+    """Tests for BM25 ranking and prefix completion."""
+
+    def test_tokenize_folds_case_and_punctuation(self):
+        """Test tokens are lowercased words without punctuation."""
+        assert tokenize("AI-Optimized Contract, Management!") == ["ai", "optimized", "contract", "management"]
+
+    def test_name_matches_outrank_description_matches(self):
+        """Test field weights favour use-case names."""
+        index = SearchIndex([category_model(
+            "role",
+            "legal",
+            {"name": "Review agreements", "description": "Find risky fraud clauses"},
+            {"name": "Detect fraud", "description": "Score transactions"},
+        )])
+
+        hits = index.search("fraud ")
+
+        assert [hit.use_case.name for hit in hits] == ["Detect fraud", "Review agreements"]
+        assert hits[0].score > hits[1].score
+
+    def test_indexes_solutions_and_customer_evidence(self):
+        """Test solution names, customer names and solution plays are searchable."""
+        index = SearchIndex([category_model("role", "hr", {
+            "name": "Onboarding",
+            "solutions": [{"name": "Copilot Studio", "links": []}],
+            "customerEvidence": [{"name": "Contoso", "solutionPlay": "Agentic workflows"}],
+        })])
+
+        for query in ("studio ", "contoso ", "agentic "):
+            assert [hit.category.slug for hit in index.search(query)] == ["hr"]
+
+    def test_last_word_is_a_prefix_while_typing(self):
+        """Test a query not ending in a space completes its last word."""
+        index = SearchIndex([category_model("role", "legal", {"name": "Contract review"}, {"name": "Contracts at scale"})])
+
+        assert len(index.search("contr")) == 2
+        assert index.search("contr ") == []
+        assert index.complete("contr") == ["contract", "contracts"]
+
+    def test_prefix_expansions_do_not_add_up(self):
+        """Test a use case matching several completions scores its best one only."""
+        index = SearchIndex([category_model("role", "legal", {"name": "Contract contracts contractor"}, {"name": "Contract"})])
+
+        def score(query: str) -> float:
+            return next(hit.score for hit in index.search(query) if hit.index == 0)
+
+        assert score("contract") == max(score(term + " ") for term in ("contract", "contracts", "contractor"))
+
+    def test_repository_queries(self):
+        """Test common searches find the expected use cases in data/."""
+        index = _repository_index()
+
+        assert index.search("contract")[0].category.slug == "legal"
+        assert any("fraud" in hit.use_case.name.lower() for hit in index.search("fraud", limit=3))
+        assert index.search("zzzz") == []
+        assert index.search("  ") == []
+        assert len(index.search("copilot", limit=5)) == 5
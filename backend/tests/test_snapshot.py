@@ -0,0 +1,126 @@
+"""Tests for app/snapshot.py indexed backup snapshots."""
+
+import json
+import pytest
+from pathlib import Path
+
+from app.snapshot import HEADER_SIZE, MAGIC, Snapshot, documents_from_backup_dir, write_atomic, write_snapshot
+
+
+class TestSnapshotFormat:
+    """Tests for write_snapshot and Snapshot."""
+
+    def test_round_trip(self, tmp_path):
+        """Test every document reads back byte for byte."""
+        documents = {"catalog": b'{"roles":[]}', "role:legal": b'{"slug":"legal"}', "empty": b""}
+        path = tmp_path / "backup.snapshot"
+        write_snapshot(path, documents)
+
+        snapshot = Snapshot(path)
+
+        assert len(snapshot) == 3
+        for key, raw in documents.items():
+            assert snapshot.get(key) == raw
+        assert snapshot.get("role:missing") is None
+        assert "role:legal" in snapshot
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test a file without the magic header raises ValueError."""
+        path = tmp_path / "catalog.json"
+        path.write_text('{"roles": []}' + " " * 20)
+
+        with pytest.raises(ValueError):
+            Snapshot(path)
+
+    def test_rejects_truncated_file(self, tmp_path):
+        """Test a snapshot cut short raises ValueError instead of serving garbage."""
+        path = tmp_path / "backup.snapshot"
+        write_snapshot(path, {"catalog": b'{"roles":["developer","sales"]}'})
+        path.write_bytes(path.read_bytes()[:-5])
+
+        with pytest.raises(ValueError, match="out of bounds"):
+            Snapshot(path)
+
+        path.write_bytes(MAGIC + (1000).to_bytes(8, "little") + b"{}")
+        with pytest.raises(ValueError, match="truncated"):
+            Snapshot(path)
+
+    @pytest.mark.parametrize("index", [b'{"documents":[]}', b'{"documents":{"a":1}}', b'{"documents":{"a":["0",1]}}'])
+    def test_rejects_malformed_index_entries(self, tmp_path, index):
+        """Test index entries of the wrong shape raise ValueError, not TypeError."""
+        path = tmp_path / "backup.snapshot"
+        path.write_bytes(MAGIC + len(index).to_bytes(8, "little") + index + b"1")
+
+        with pytest.raises(ValueError, match="malformed"):
+            Snapshot(path)
+
+    def test_index_is_read_without_touching_documents(self, tmp_path):
+        """Test offsets point past the index into the document section."""
+        path = tmp_path / "backup.snapshot"
+        write_snapshot(path, {"a": b"1", "b": b"22"})
+
+        snapshot = Snapshot(path)
+
+        assert min(offset for offset, _ in snapshot.index.values()) > HEADER_SIZE
+
+
+class TestWriteAtomic:
+    """Tests for write_atomic."""
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        """Test an interrupted write leaves the old file intact and no temp file."""
+        path = tmp_path / "categories.json"
+        path.write_text('{"role": {}}')
+
+        def chunks():
+            yield b'{"role": {"legal": '
+            raise OSError("disk full")
+
+        with pytest.raises(OSError):
+            write_atomic(path, chunks())
+
+        assert path.read_text() == '{"role": {}}'
+        assert not list(tmp_path.glob(".*.tmp"))
+
+
+class TestDocumentsFromBackupDir:
+    """Tests for documents_from_backup_dir."""
+
+    def test_maps_files_to_redis_key_suffixes(self, tmp_path):
+        """Test backup JSON members become compact documents keyed like Redis."""
+        (tmp_path / "catalog.json").write_text(json.dumps({"roles": [{"slug": "legal"}]}, indent=2))
+        (tmp_path / "settings.json").write_text(json.dumps({"inspire": {"a": 1}, "avatar": {"b": 2}}))
+        (tmp_path / "content.json").write_text(json.dumps({"exec_narr": {"context": "x"}}))
+        (tmp_path / "categories.json").write_text(json.dumps({
+            "role": {"legal": {"slug": "legal"}},
+            "industry": {"retail": {"slug": "retail"}},
+        }))
+
+        documents = documents_from_backup_dir(tmp_path)
+
+        assert set(documents) == {
+            "catalog", "settings:inspire", "settings:avatar", "content:exec_narr",
+            "role:legal", "industry:retail",
+        }
+        assert documents["catalog"] == b'{"roles":[{"slug":"legal"}]}'
+
+    def test_keeps_non_ascii_as_utf8(self, tmp_path):
+        """Test documents are encoded like RedisJSON returns them, without \\u escapes."""
+        (tmp_path / "catalog.json").write_text(json.dumps({"roles": [{"name": "Café"}]}, indent=2))
+
+        assert documents_from_backup_dir(tmp_path)["catalog"] == '{"roles":[{"name":"Café"}]}'.encode()
+
+    def test_matches_repository_backup(self, tmp_path):
+        """Test the bundled backup data converts and reads back intact."""
+        backup_dir = Path(__file__).parent.parent / "data"
+        with open(backup_dir / "categories.json") as f:
+            categories = json.load(f)
+        path = tmp_path / "backup.snapshot"
+        write_snapshot(path, documents_from_backup_dir(backup_dir))
+
+        snapshot = Snapshot(path)
+
+        for category_type, members in categories.items():
+            for slug, document in members.items():
+                assert json.loads(snapshot.get(f"{category_type}:{slug}")) == document
@@ -0,0 +1,183 @@
+"""Tests for scripts/export_static_api.py."""
+
+import gzip
+import importlib.util
+import json
+import re
+import shutil
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from app.redis_client import BackupLoader
+from app.snapshot import documents_from_backup_dir, write_snapshot
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+
+@pytest.fixture
+def static_api(monkeypatch):
+    """Load the static export script."""
+    monkeypatch.syspath_prepend(str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location("export_static_api", SCRIPTS_DIR / "export_static_api.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    yield module
+    sys.modules.pop("export_redis_to_backup", None)
+
+
+def _maps(conf: str) -> dict[str, dict[str, str]]:
+    """Parse the generated ``map`` blocks into {variable: {key: value}}."""
+    maps = {}
+    for variable, body in re.findall(r"^map [^\n]* (\$\w+) \{\n(.*?)^\}", conf, re.M | re.S):
+        maps[variable] = dict(
+            (key.replace('\\"', '"'), value.replace('\\"', '"'))
+            for key, value in re.findall(r'^\s+"?(.*?)"? "(.*)";$', body, re.M)
+        )
+    return maps
+
+
+class TestStaticExport:
+    """Tests for rendering read-only routes to files."""
+    
+    def test_imports_without_numpy(self):
+        """Test the export runs with only the static-api image's packages (no NumPy)."""
+        code = "import sys; sys.modules['numpy'] = None; import export_static_api"
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=SCRIPTS_DIR, capture_output=True, text=True
+        )
+        
+        assert result.returncode == 0, result.stderr
+
+    def test_files_match_what_the_backend_serves(self, static_api, tmp_path):
+        """Test identity bytes and ETags equal the backend loader's documents."""
+        assert static_api.export_static_api(tmp_path)
+
+        with patch("app.redis_client.BACKUP_SNAPSHOT", ""):
+            loader = BackupLoader()
+            catalog = loader.get_catalog_document()
+            legal = loader.get_category_document("role", "legal")
+        assert (tmp_path / "api/catalog.json").read_bytes() == catalog.raw
+        assert (tmp_path / "api/category/role/legal.json").read_bytes() == legal.raw
+        assert gzip.decompress((tmp_path / "api/catalog.json.gz").read_bytes()) == catalog.raw
+        assert (tmp_path / "api/settings/inspire.json").exists()
+        assert not list(tmp_path.glob("api/content*"))
+
+        maps = _maps((tmp_path / "static-api.conf").read_text())
+        assert maps["$static_api_etag"]["/api/catalog.json"] == catalog.etag
+        assert maps["$static_api_etag"]["/api/catalog.json.gz"] == f'{catalog.etag[:-1]}-gzip"'
+
+    @pytest.mark.parametrize("snapshot", [False, True])
+    def test_etags_match_the_api_in_backup_mode(self, static_api, tmp_path, mock_env_vars, snapshot):
+        """Test every exported body and ETag equals the API's, served from the JSON files or a snapshot."""
+        from app.main import app
+        from app.redis_client import LazyRedisClient
+        
+        assert static_api.export_static_api(tmp_path / "out")
+        etags = _maps((tmp_path / "out" / "static-api.conf").read_text())["$static_api_etag"]
+        backup_dir = tmp_path / "backup"
+        shutil.copytree(static_api.export.BACKUP_DIR, backup_dir, ignore=shutil.ignore_patterns("*.snapshot"))
+        if snapshot:
+            write_snapshot(backup_dir / "backup.snapshot", documents_from_backup_dir(backup_dir))
+        
+        with patch("app.redis_client.BACKUP_DIR", backup_dir), \
+                patch("app.redis_client.BACKUP_ONLY", True), \
+                patch("app.main.redis_client", LazyRedisClient()):
+            client = TestClient(app)
+            for file in [file for file in etags if file.endswith(".json")]:
+                response = client.get(file.removesuffix(".json"), headers={"Accept-Encoding": "identity"})
+                
+                assert response.status_code == 200, file
+                assert response.content == (tmp_path / "out" / file.lstrip("/")).read_bytes(), file
+                assert response.headers["etag"] == etags[file], file
+
+    def test_maps_pick_best_available_variant(self, static_api, tmp_path):
+        """Test each Accept-Encoding class maps to a file that exists, preferring compression."""
+        assert static_api.export_static_api(tmp_path)
+
+        files = _maps((tmp_path / "static-api.conf").read_text())["$static_api_file"]
+        assert files[":/api/catalog"] == "/api/catalog.json"
+        assert files["gzip:/api/catalog"] == "/api/catalog.json.gz"
+        assert files["br,gzip:/api/catalog"].startswith("/api/catalog.json.")
+        for file in files.values():
+            assert (tmp_path / file.lstrip("/")).exists()
+
+    def test_small_documents_are_served_uncompressed(self, static_api, tmp_path):
+        """Test documents below COMPRESSION_MIN_BYTES only get an identity file."""
+        rendered = static_api.render({"settings:inspire": b'{"a":1}', "catalog": b"{}"})
+        static_api.write_static_api(tmp_path, rendered, version=None)
+
+        files = _maps((tmp_path / "static-api.conf").read_text())["$static_api_file"]
+        assert files["gzip:/api/settings/inspire"] == "/api/settings/inspire.json"
+        assert not (tmp_path / "api/settings/inspire.json.gz").exists()
+
+    def test_rerun_writes_only_changes_and_removes_stale_files(self, static_api, tmp_path):
+        """Test unchanged files keep their mtime and dropped routes are deleted."""
+        documents = {"catalog": b"{}", "role:legal": b'{"slug":"legal"}', "role:hr": b'{"slug":"hr"}'}
+        static_api.write_static_api(tmp_path, static_api.render(documents), version=3)
+        legal = tmp_path / "api/category/role/legal.json"
+        before = legal.stat().st_mtime_ns
+
+        del documents["role:hr"]
+        documents["catalog"] = b'{"roles":[]}'
+        written, removed = static_api.write_static_api(tmp_path, static_api.render(documents), version=4)
+
+        assert legal.stat().st_mtime_ns == before
+        assert written == ["api/catalog.json", "static-api.conf"]
+        assert removed == ["api/category/role/hr.json"]
+        assert _maps((tmp_path / "static-api.conf").read_text())["$static_api_version"] == {"default": "4"}
+
+    @pytest.mark.parametrize("key, path", [
+        ("catalog", "/api/catalog"),
+        ("settings:inspire", "/api/settings/inspire"),
+        ("industry:retail", "/api/category/industry/retail"),
+        ("content:exec_narr", None),
+        ("settings:other", None),
+        ("role:../etc", None),
+    ])
+    def test_api_path(self, static_api, key, path):
+        """Test only routes nginx can serve safely are exported."""
+        assert static_api.api_path(key) == path
+
+
+class TestStaticExportFromRedis:
+    """Tests for --from-redis."""
+
+    def test_reads_documents_and_version(self, static_api, tmp_path):
+        """Test Redis documents are unwrapped and the version becomes X-Content-Version."""
+        class FakeRedis:
+            store = {
+                "fas:catalog": json.dumps([{"roles": []}]).encode(),
+                "fas:role:legal": json.dumps([{"slug": "legal"}]).encode(),
+                "fas:content:exec_narr": b'[{}]',
+            }
+
+            def scan_iter(self, match, count):
+                return (key.encode() for key in self.store)
+
+            def get(self, key):
+                return b"9"
+
+            def pipeline(self, transaction):
+                store = self.store
+
+                class Pipeline:
+                    def __init__(self):
+                        self.queued = []
+
+                    def execute_command(self, *args):
+                        self.queued.append(args)
+
+                    def execute(self):
+                        return [[store[key] for key in args[1:-1]] for args in self.queued]
+
+                return Pipeline()
+
+        assert static_api.export_static_api(tmp_path, from_redis=True, client=FakeRedis())
+
+        assert json.loads((tmp_path / "api/category/role/legal.json").read_bytes()) == {"slug": "legal"}
+        assert not (tmp_path / "api/content").exists()
+        assert _maps((tmp_path / "static-api.conf").read_text())["$static_api_version"] == {"default": "9"}
@@ -8,6 +8,12 @@ from datetime import datetime
 from app.story_scraper import StoryCache, StoryScraper
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Write the relative stories_cache.json under tmp_path, not the source tree."""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestStoryCache:
     """Tests for StoryCache class."""
     
@@ -266,11 +266,13 @@ Four Pillars:
 
   let successCount = 0;
   let errorCount = 0;
+  const uploadedKeys: string[] = [];
 
   for (const [key, doc] of documents) {
     try {
       await client.sendCommand(['JSON.SET', key, '$', JSON.stringify(doc)]);
       console.log(`  ✅ Uploaded: ${key}`);
+      uploadedKeys.push(key);
       successCount++;
     } catch (error: any) {
       console.error(`  ❌ Failed to upload ${key}:`, error.message);
@@ -278,6 +280,18 @@ Four Pillars:
     }
   }
 
+  if (uploadedKeys.length > 0) {
+    // Bump the global content version, then record it per document so the
+    // backend can evict just the documents written in this run
+    const version = String(await client.sendCommand(['INCR', `${KEY_PREFIX}:version`]));
+    await client.sendCommand([
+      'HSET',
+      `${KEY_PREFIX}:versions`,
+      ...uploadedKeys.flatMap((key) => [key, version]),
+    ]);
+    console.log(`\n🔖 Content version: ${version}`);
+  }
+
   console.log(`\n✨ Migration complete!`);
   console.log(`   Redis uploads: ${successCount} success, ${errorCount} errors`);
   console.log(`   Backup files: 5 files written to ${BACKUP_DIR}`);
@@ -38,6 +38,27 @@ export interface CategoryData {
   }>;
 }
 
+type Solution = CategoryData['useCases'][number]['solutions'][number];
+type Link = Solution['links'][number];
+type Evidence = CategoryData['useCases'][number]['customerEvidence'][number];
+
+type BundledCategory = Omit<CategoryData, 'useCases'> & {
+  useCases: Array<Omit<CategoryData['useCases'][number], 'solutions' | 'customerEvidence'> & {
+    solutions: number[];
+    customerEvidence: number[];
+  }>;
+};
+
+/** Every role and industry, with solutions, links and evidence referenced by index. */
+export interface ExploreBundle {
+  roles: BundledCategory[];
+  industries: BundledCategory[];
+  solutions: Array<Omit<Solution, 'links'> & { links: number[] }>;
+  links: Link[];
+  evidence: Evidence[];
+  missing: string[];
+}
+
 export interface InspireSettings {
   type: string;
   inspireInterests: string[];
@@ -51,7 +72,51 @@ export async function fetchCatalog(): Promise<Catalog> {
   return response.json();
 }
 
+let exploreBundle: Promise<ExploreBundle> | null = null;
+
+/** Fetched once per page load and shared by every caller; a failed fetch is retried on the next call. */
+export function fetchExploreBundle(): Promise<ExploreBundle> {
+  if (!exploreBundle) {
+    exploreBundle = fetch(`${API_BASE_URL}/api/explore/bundle`)
+      .then(response => {
+        if (!response.ok) {
+          throw new Error('Failed to fetch explore bundle');
+        }
+        return response.json();
+      })
+      .catch(error => {
+        exploreBundle = null;
+        throw error;
+      });
+  }
+  return exploreBundle;
+}
+
+function expandCategory(bundle: ExploreBundle, category: BundledCategory): CategoryData {
+  return {
+    ...category,
+    useCases: category.useCases.map(useCase => ({
+      ...useCase,
+      solutions: useCase.solutions.map(id => {
+        const solution = bundle.solutions[id];
+        return { ...solution, links: solution.links.map(link => bundle.links[link]) };
+      }),
+      customerEvidence: useCase.customerEvidence.map(id => bundle.evidence[id]),
+    })),
+  };
+}
+
+/** Category details from the explore bundle, or from its own endpoint if the bundle lacks it. */
 export async function fetchCategory(type: 'role' | 'industry', slug: string): Promise<CategoryData> {
+  try {
+    const bundle = await fetchExploreBundle();
+    const category = (type === 'role' ? bundle.roles : bundle.industries).find(c => c.slug === slug);
+    if (category) {
+      return expandCategory(bundle, category);
+    }
+  } catch (error) {
+    console.warn('Explore bundle unavailable, fetching category directly:', error);
+  }
   const response = await fetch(`${API_BASE_URL}/api/category/${type}/${slug}`);
   if (!response.ok) {
     throw new Error(`Failed to fetch ${type} ${slug}`);